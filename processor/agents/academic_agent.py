@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Optional, Dict, List
 
 from processor.agents.base_agent import BaseAgent
+from processor.utils.response_cache import ResponseCache
 
 
 class AcademicAgent(BaseAgent):
@@ -25,6 +26,8 @@ class AcademicAgent(BaseAgent):
             ollama_host: Optional custom Ollama host URL (default: http://localhost:11434)
         """
         super().__init__(model_name=model_name, ollama_host=ollama_host, schema_name="academic_agent_schema.json")
+        # Parsed responses keyed by request (see _response_cache_key) so reruns skip the LLM call
+        self.response_cache = ResponseCache.from_env()
     
     def analyze_academic_profile(
         self,
@@ -171,6 +174,11 @@ CRITICAL JSON FORMAT REQUIREMENTS:
 - All scores must be integers between 0 and 100
 - The response must be parseable by json.loads() without any preprocessing"""
 
+        cache_key = self._response_cache_key(prompt, self.system_message)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Build full file path for debugging (use absolute paths)
             full_filename = "unknown"
@@ -187,6 +195,7 @@ CRITICAL JSON FORMAT REQUIREMENTS:
 
             # Use BaseAgent's JSON parsing method (handles markdown extraction and retry)
             result = self.parse_llm_response(response_text, filename=full_filename, messages=messages)
+            self.response_cache.set(cache_key, result)
             return result
 
         except ValueError as e:
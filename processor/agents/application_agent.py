@@ -6,71 +6,42 @@ This agent extracts structured information from application forms, assesses comp
 and generates application profiles with scores.
 """
 
-import json
-from typing import Optional, Dict, List
+import os
+import asyncio
+import logging
+from typing import Optional, Dict, List, Any, Iterator, Tuple
 
-from processor.agents.base_agent import BaseAgent
+import ollama
 
+from jsonschema import ValidationError
 
-class ApplicationAgent(BaseAgent):
-    """Agent that analyzes application forms and generates profiles using Ollama."""
+from processor.agents.base_agent import BaseAgent, OllamaConnectionError, get_async_client
+from processor.agents.json_parser import IncrementalObjectParser, IncrementalArrayParser
+from processor.utils.response_cache import ResponseCache
 
-    def __init__(self, model_name: str = "llama3.2", ollama_host: Optional[str] = None):
-        """
-        Initialize the Application Agent with Ollama.
 
-        Args:
-            model_name: Name of the Ollama model to use (e.g., "llama3.2", "mistral", "phi3")
-                       Default: "llama3.2"
-            ollama_host: Optional custom Ollama host URL (default: http://localhost:11434)
-        """
-        super().__init__(model_name=model_name, ollama_host=ollama_host, schema_name="application_agent_schema.json")
-    
-    def analyze_application(self, extracted_text: str, file_list: List[str], additional_criteria: Optional[str] = None) -> Dict:
-        """
-        Analyze the application form text and generate a profile.
-        
-        Args:
-            extracted_text: Text extracted from the application form
-            file_list: List of all files in the application folder
-            additional_criteria: Optional additional criteria to consider when analyzing (from application_criteria.txt)
-            
-        Returns:
-            Dictionary with profile, summary, and score
-        """
-        # Count attachments
-        num_attachments = len([f for f in file_list if '_' in f and f.split('_')[-1].split('.')[0].isdigit()])
-        
-        # Add additional criteria section if provided
-        criteria_section = ""
-        if additional_criteria:
-            criteria_section = f"""
+logger = logging.getLogger(__name__)
 
-Additional Scholarship-Specific Criteria:
-{additional_criteria}
 
-Please take these additional criteria into account when analyzing the application, assessing completeness, and scoring.
-"""
-        
-        prompt = f"""You are an Application Agent analyzing a WAI (Women in Aviation International) scholarship application form.
+# Static instructions and output structure. Kept byte-identical across calls and sent
+# as the system message so Ollama can reuse the KV cache of this prefix; only the
+# per-application data goes in the user message.
+APPLICATION_SYSTEM_PROMPT = """You are an Application Agent analyzing a WAI (Women in Aviation International) scholarship application form.
 
 Your task is to:
 1. Extract structured information from the application form
 2. Assess completeness based on what information is present or missing
 3. Generate a summary of the application
-4. Provide an overall score (0-100) that evaluates the overall quality and completeness of the application{', considering the additional criteria provided above' if additional_criteria else ''}
+4. Provide an overall score (0-100) that evaluates the overall quality and completeness of the application, considering any additional scholarship-specific criteria provided
 5. Also provide a completeness score (0-100) specifically measuring how much required information was provided
 
-Application Form Text:
-{extracted_text}
-
-Files in Application Folder:
-{json.dumps(file_list, indent=2)}{criteria_section}
+The user message contains the application form text, the list of files in the application folder,
+the number of attachments and, optionally, additional scholarship-specific criteria.
 
-Based on the application form text and the list of files{', and the additional criteria provided above' if additional_criteria else ''}, please provide a JSON response with the following structure:
+Based on the application form text and the list of files (and the additional criteria, if provided), respond with the following JSON structure:
 
-{{
-    "profile": {{
+{
+    "profile": {
         "wai_membership_number": "extracted or null",
         "wai_application_number": "extracted or null",
         "first_name": "extracted or null",
@@ -79,7 +50,7 @@ Based on the application form text and the list of files{', and the additional c
         "email": "extracted or null",
         "membership_since": "extracted or null",
         "membership_expiration": "extracted or null",
-        "home_address": {{
+        "home_address": {
             "country": "extracted or null",
             "address_1": "extracted or null",
             "address_2": "extracted or null",
@@ -88,8 +59,8 @@ Based on the application form text and the list of files{', and the additional c
             "zip_postal_code": "extracted or null",
             "home_phone": "extracted or null",
             "work_phone": "extracted or null"
-        }},
-        "school_information": {{
+        },
+        "school_information": {
             "country": "extracted or null",
             "school_name": "extracted or null",
             "address_1": "extracted or null",
@@ -97,29 +68,29 @@ Based on the application form text and the list of files{', and the additional c
             "city": "extracted or null",
             "state_province": "extracted or null",
             "zip_postal_code": "extracted or null"
-        }},
-        "completeness": {{
+        },
+        "completeness": {
             "has_resume": true/false,
             "has_essay": true/false,
             "num_recommendation_letters": 0-3,
             "has_medical_certificate": true/false,
             "has_logbook": true/false,
-            "num_attachments": {num_attachments}
-        }}
-    }},
+            "num_attachments": <integer, number of attachments given below>
+        }
+    },
     "summary": "A 2-3 sentence summary of who this applicant is and what is in their application package",
-    "scores": {{
+    "scores": {
         "overall_score": <integer 0-100, required>,
         "completeness_score": <integer 0-100, required>,
-        "score_breakdown": {{
+        "score_breakdown": {
             "profile_information": "score and reasoning",
             "contact_information": "score and reasoning",
             "school_information": "score and reasoning",
             "supporting_documents": "score and reasoning"
-        }},
+        },
         "missing_items": ["list of missing or incomplete items"]
-    }}
-}}
+    }
+}
 
 CRITICAL JSON FORMAT REQUIREMENTS:
 - You MUST respond with ONLY valid JSON
@@ -131,15 +102,257 @@ CRITICAL JSON FORMAT REQUIREMENTS:
 - All scores must be integers between 0 and 100
 - The response must be parseable by json.loads() without any preprocessing"""
 
+# Rough token estimate (~4 chars/token) of the static prefix, passed as num_keep so the
+# prefix is retained when the context window shifts.
+APPLICATION_PROMPT_NUM_KEEP = len(APPLICATION_SYSTEM_PROMPT) // 4
+
+# The response JSON is well under 1k tokens; capping decode length bounds worst-case latency
+APPLICATION_NUM_PREDICT = 1024
+
+# Application forms are short; anything beyond this is OCR noise or appended pages
+MAX_FORM_TEXT_CHARS = 8000
+
+APPLICATION_CHAT_OPTIONS = {
+    "num_keep": APPLICATION_PROMPT_NUM_KEEP,
+    "num_predict": APPLICATION_NUM_PREDICT,
+}
+
+# Fixed pieces of the per-application user message
+_FORM_TEXT_HEADER = "Application Form Text:\n"
+_FILES_HEADER = "\n\nFiles in Application Folder:\n"
+_NUM_ATTACHMENTS_HEADER = "\n\nNumber of attachments: "
+_CRITERIA_HEADER = "\n\n\nAdditional Scholarship-Specific Criteria:\n"
+_CRITERIA_FOOTER = (
+    "\n\nPlease take these additional criteria into account when analyzing the application, "
+    "assessing completeness, and scoring.\n"
+)
+
+
+# Batch mode: several applications per request. The single-application prompt is kept as
+# the prefix so both modes share the same cached KV prefix.
+APPLICATION_BATCH_SYSTEM_PROMPT = APPLICATION_SYSTEM_PROMPT + """
+
+BATCH MODE:
+The user message contains several applications, each introduced by a line "=== Application <id> ===".
+Analyze each application independently and respond with a single JSON object of the form
+{"results": [{"id": "<id>", "profile": {...}, "summary": "...", "scores": {...}}, ...]}
+with exactly one entry per application, in the same order as they appear."""
+
+# Applications per batched request; 4-8 amortizes the shared prefix without making
+# a single slow request hold back too many results
+APPLICATION_BATCH_SIZE = 4
+
+_BATCH_APPLICATION_HEADER = "=== Application {} ===\n"
+
+
+def _is_attachment(filename: str) -> bool:
+    """Whether a filename follows the attachment naming convention (..._<index>.<ext>)."""
+    _, sep, tail = filename.rpartition('_')
+    return bool(sep) and tail.partition('.')[0].isdigit()
+
+
+class ApplicationAgent(BaseAgent):
+    """Agent that analyzes application forms and generates profiles using Ollama."""
+
+    def __init__(
+        self,
+        model_name: str = "llama3.2",
+        ollama_host: Optional[str] = None,
+        validate_connection: bool = True
+    ):
+        """
+        Initialize the Application Agent with Ollama.
+
+        Form extraction is constrained to the output schema, so small quantized models
+        (e.g. "llama3.2:1b" or "llama3.2:3b-instruct-q4_K_M") give comparable
+        profiles at a fraction of the latency and memory of larger or fp16 models.
+        Step 2 uses APPLICATION_AGENT_MODEL for this agent when it is set.
+
+        Args:
+            model_name: Name of the Ollama model to use (e.g., "llama3.2", "mistral", "phi3")
+                       Default: "llama3.2"
+            ollama_host: Optional custom Ollama host URL (default: http://localhost:11434)
+            validate_connection: If False, defer the Ollama connection check until first use
+        """
+        super().__init__(
+            model_name=model_name,
+            ollama_host=ollama_host,
+            validate_connection=validate_connection,
+            schema_name="application_agent_schema.json"
+        )
+        # Parsed responses keyed by request (see _response_cache_key) so reruns skip the LLM call
+        self.response_cache = ResponseCache.from_env()
+    
+    def _build_prompt(self, extracted_text: str, file_list: List[str], additional_criteria: Optional[str] = None) -> str:
+        """
+        Build the variable part of the prompt (user message) for a single application form.
+
+        The static instructions live in APPLICATION_SYSTEM_PROMPT.
+
+        Args:
+            extracted_text: Text extracted from the application form
+            file_list: List of all files in the application folder
+            additional_criteria: Optional additional criteria to consider when analyzing
+
+        Returns:
+            Prompt text for the user message
+        """
+        # Count attachments
+        num_attachments = sum(1 for f in file_list if _is_attachment(f))
+
+        if len(extracted_text) > MAX_FORM_TEXT_CHARS:
+            extracted_text = (
+                extracted_text[:MAX_FORM_TEXT_CHARS]
+                + f"\n[... truncated {len(extracted_text) - MAX_FORM_TEXT_CHARS} characters ...]"
+            )
+
+        parts = [
+            _FORM_TEXT_HEADER, extracted_text,
+            _FILES_HEADER, "\n".join(file_list),
+            _NUM_ATTACHMENTS_HEADER, str(num_attachments),
+        ]
+        # Add additional criteria section if provided
+        if additional_criteria:
+            parts += [_CRITERIA_HEADER, additional_criteria, _CRITERIA_FOOTER]
+        prompt = "".join(parts)
+
+        return prompt
+
+    def _build_messages_for(self, prompt: str) -> List[Dict[str, str]]:
+        """Build the [system, user] message pair for a user prompt."""
+        return [
+            {"role": "system", "content": APPLICATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    def analyze_application(self, extracted_text: str, file_list: List[str], additional_criteria: Optional[str] = None) -> Dict:
+        """
+        Analyze the application form text and generate a profile.
+        
+        Args:
+            extracted_text: Text extracted from the application form
+            file_list: List of all files in the application folder
+            additional_criteria: Optional additional criteria to consider when analyzing (from application_criteria.txt)
+            
+        Returns:
+            Dictionary with profile, summary, and score
+        """
+        prompt = self._build_prompt(extracted_text, file_list, additional_criteria)
+
+        cache_key = self._response_cache_key(prompt, APPLICATION_SYSTEM_PROMPT, APPLICATION_CHAT_OPTIONS)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Prepare messages for potential retry
-            messages = [{"role": "user", "content": prompt}]
+            # Prepare messages for potential retry (static system prefix + variable user message)
+            messages = self._build_messages_for(prompt)
 
-            # Use BaseAgent's retry-enabled chat method with system message
-            response_text = self._chat_with_retry(messages, system_message=self.system_message)
+            response_text = self._chat_with_retry(
+                messages, options=APPLICATION_CHAT_OPTIONS
+            )
 
             # Use BaseAgent's JSON parsing method (handles markdown extraction and retry)
             result = self.parse_llm_response(response_text, filename="application_form", messages=messages)
+            self.response_cache.set(cache_key, result)
+            return result
+
+        except ValueError as e:
+            raise RuntimeError(f"Failed to parse JSON response: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"Error analyzing application: {str(e)}")
+
+    def analyze_application_stream(
+        self,
+        extracted_text: str,
+        file_list: List[str],
+        additional_criteria: Optional[str] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Analyze the application form, yielding top-level fields as soon as they are generated.
+
+        The response is streamed from Ollama and parsed incrementally, so e.g. the
+        "profile" field is available while "summary" and "scores" are still being
+        decoded. Collecting all yielded pairs into a dict gives the same result as
+        analyze_application (the full response is still validated at the end).
+
+        Args:
+            extracted_text: Text extracted from the application form
+            file_list: List of all files in the application folder
+            additional_criteria: Optional additional criteria to consider when analyzing
+
+        Yields:
+            (field_name, value) tuples for the top-level fields of the profile
+        """
+        prompt = self._build_prompt(extracted_text, file_list, additional_criteria)
+
+        cache_key = self._response_cache_key(prompt, APPLICATION_SYSTEM_PROMPT, APPLICATION_CHAT_OPTIONS)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            yield from cached.items()
+            return
+
+        try:
+            messages = self._build_messages_for(prompt)
+            parser = IncrementalObjectParser()
+            emitted = {}
+
+            for chunk in self._chat_stream(messages, options=APPLICATION_CHAT_OPTIONS):
+                for key, value in parser.feed(chunk):
+                    emitted[key] = value
+                    yield key, value
+
+            # Validate the complete response (and recover via JSONParser if needed)
+            result = self.parse_llm_response(parser.text, filename="application_form", messages=messages)
+
+        except ValueError as e:
+            raise RuntimeError(f"Failed to parse JSON response: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"Error analyzing application: {str(e)}")
+
+        for key, value in result.items():
+            if emitted.get(key, object()) != value:
+                yield key, value
+        self.response_cache.set(cache_key, result)
+
+    async def analyze_application_async(
+        self,
+        extracted_text: str,
+        file_list: List[str],
+        additional_criteria: Optional[str] = None,
+        client: Optional[ollama.AsyncClient] = None
+    ) -> Dict:
+        """
+        Async version of analyze_application using ollama.AsyncClient.
+
+        Args:
+            extracted_text: Text extracted from the application form
+            file_list: List of all files in the application folder
+            additional_criteria: Optional additional criteria to consider when analyzing
+            client: Optional AsyncClient shared across concurrent requests
+
+        Returns:
+            Dictionary with profile, summary, and score
+        """
+        prompt = self._build_prompt(extracted_text, file_list, additional_criteria)
+
+        cache_key = self._response_cache_key(prompt, APPLICATION_SYSTEM_PROMPT, APPLICATION_CHAT_OPTIONS)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            messages = self._build_messages_for(prompt)
+
+            response_text = await self._achat_with_retry(
+                messages, client=client, options=APPLICATION_CHAT_OPTIONS
+            )
+
+            # Parsing (and the rare LLM fix-up retry) is blocking, keep it off the event loop
+            result = await asyncio.to_thread(
+                self.parse_llm_response, response_text, "application_form", messages
+            )
+            self.response_cache.set(cache_key, result)
             return result
 
         except ValueError as e:
@@ -147,3 +360,164 @@ CRITICAL JSON FORMAT REQUIREMENTS:
         except Exception as e:
             raise RuntimeError(f"Error analyzing application: {str(e)}")
 
+    async def analyze_many_async(
+        self,
+        apps: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Analyze several application forms concurrently.
+
+        Concurrency is bounded by max_concurrency, defaulting to OLLAMA_NUM_PARALLEL
+        (or 4 when unset). The Ollama server must also be started with
+        OLLAMA_NUM_PARALLEL >= max_concurrency to actually run requests in parallel.
+
+        Args:
+            apps: List of dicts with 'extracted_text', 'file_list' and optional
+                  'additional_criteria' keys (same arguments as analyze_application)
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of results in the same order as apps. Failed analyses are returned
+            as {"error": "..."} dictionaries instead of raising.
+        """
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        # One AsyncClient (connection pool) shared by the whole batch
+        client = get_async_client(self.ollama_host)
+
+        async def _run(app: Dict[str, Any]) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.analyze_application_async(
+                        app.get('extracted_text', ''),
+                        app.get('file_list', []),
+                        additional_criteria=app.get('additional_criteria'),
+                        client=client
+                    )
+                except RuntimeError as e:
+                    return {"error": str(e)}
+
+        return await asyncio.gather(*[_run(app) for app in apps])
+
+    def analyze_many(self, apps: List[Dict[str, Any]], max_concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        Synchronous wrapper around analyze_many_async.
+
+        Args:
+            apps: List of application dicts (see analyze_many_async)
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of results in the same order as apps
+        """
+        return asyncio.run(self.analyze_many_async(apps, max_concurrency=max_concurrency))
+
+    def _batch_schema(self) -> Optional[Dict[str, Any]]:
+        """JSON schema for a batched response: {"results": [<id> + agent schema, ...]}."""
+        if not self.schema:
+            return None
+        item = {
+            "type": "object",
+            "properties": {"id": {"type": "string"}, **self.schema.get("properties", {})},
+            "required": ["id"] + list(self.schema.get("required", [])),
+        }
+        return {
+            "type": "object",
+            "properties": {"results": {"type": "array", "items": item}},
+            "required": ["results"],
+        }
+
+    def analyze_batch(
+        self,
+        apps: List[Tuple[str, List[str]]],
+        additional_criteria: Optional[str] = None,
+        batch_size: int = APPLICATION_BATCH_SIZE
+    ) -> List[Dict]:
+        """
+        Analyze several application forms, packing up to batch_size of them into each request.
+
+        One request per batch amortizes the shared instructions and schema across the
+        applications in it and keeps the GPU busier than one small request at a time.
+        Results are streamed and each one is accepted (and cached) as soon as the model
+        closes it. Applications that are missing from a batched response or fail
+        validation are re-analyzed individually with analyze_application.
+
+        Args:
+            apps: List of (extracted_text, file_list) tuples
+            additional_criteria: Optional additional criteria applied to every application
+            batch_size: Maximum number of applications per request
+
+        Returns:
+            List of results in the same order as apps. Failed analyses are returned
+            as {"error": "..."} dictionaries instead of raising.
+        """
+        results: List[Optional[Dict]] = [None] * len(apps)
+        pending = []
+
+        for index, (extracted_text, file_list) in enumerate(apps):
+            prompt = self._build_prompt(extracted_text, file_list, additional_criteria)
+            cache_key = self._response_cache_key(prompt, APPLICATION_SYSTEM_PROMPT, APPLICATION_CHAT_OPTIONS)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, prompt, cache_key))
+
+        batch_size = max(1, batch_size)
+        for start in range(0, len(pending), batch_size):
+            self._analyze_batch_chunk(pending[start:start + batch_size], results)
+
+        for index, (extracted_text, file_list) in enumerate(apps):
+            if results[index] is None:
+                try:
+                    results[index] = self.analyze_application(extracted_text, file_list, additional_criteria)
+                except RuntimeError as e:
+                    results[index] = {"error": str(e)}
+
+        return results
+
+    def _analyze_batch_chunk(self, chunk: List[Tuple[int, str, str]], results: List[Optional[Dict]]) -> None:
+        """
+        Run one batched request and store each valid result in results.
+
+        Args:
+            chunk: (index into results, user prompt, cache key) for each application
+            results: Result list filled in place; entries left as None were not answered
+        """
+        parts = []
+        for position, (_, prompt, _) in enumerate(chunk, start=1):
+            parts += [_BATCH_APPLICATION_HEADER.format(position), prompt, "\n\n"]
+        messages = [
+            {"role": "system", "content": APPLICATION_BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": "".join(parts)}
+        ]
+        options = {
+            "num_keep": len(APPLICATION_BATCH_SYSTEM_PROMPT) // 4,
+            "num_predict": APPLICATION_NUM_PREDICT * len(chunk),
+        }
+
+        parser = IncrementalArrayParser()
+        try:
+            for text in self._chat_stream(messages, options=options, response_format=self._batch_schema()):
+                for item in parser.feed(text):
+                    self._accept_batch_item(item, chunk, results)
+        except OllamaConnectionError as e:
+            logger.warning("Batched application request failed, falling back to single requests: %s", e)
+
+    def _accept_batch_item(self, item: Any, chunk: List[Tuple[int, str, str]], results: List[Optional[Dict]]) -> None:
+        """Validate one entry of a batched response and store it under its application."""
+        if not isinstance(item, dict):
+            return
+        item_id = str(item.pop("id", ""))
+        if not item_id.isdigit() or not 1 <= int(item_id) <= len(chunk):
+            logger.debug("Ignoring batched result with unknown id %r", item_id)
+            return
+        index, _, cache_key = chunk[int(item_id) - 1]
+        try:
+            self._validate_against_schema(item, filename=f"application_form (batch item {item_id})")
+        except ValidationError:
+            return
+        results[index] = item
+        self.response_cache.set(cache_key, item)
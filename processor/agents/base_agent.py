@@ -9,13 +9,20 @@ response parsing across all agent types.
 import os
 import json
 import time
+import random
+import asyncio
 import logging
+import weakref
+import functools
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, FrozenSet, Iterator, Tuple
 import ollama
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 
 from processor.agents.json_parser import JSONParser
+from processor.utils import json_utils
+from processor.utils.response_cache import ResponseCache
+from processor.utils.schema_validators import Validator, load_validator
 
 
 logger = logging.getLogger(__name__)
@@ -31,6 +38,167 @@ class OllamaModelError(Exception):
     pass
 
 
+# How long Ollama keeps the model loaded after a request (default server value is 5m,
+# which can evict the model between applications and stall on reload)
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "1h")
+
+# Load each model when the first agent using it connects, rather than on its first request
+OLLAMA_PRELOAD = os.getenv("OLLAMA_PRELOAD", "true").lower() not in ("0", "false", "no")
+
+# Optional HTTP timeout (seconds) for Ollama requests; unset means no timeout
+_timeout_env = os.getenv("OLLAMA_REQUEST_TIMEOUT")
+OLLAMA_REQUEST_TIMEOUT: Optional[float] = float(_timeout_env) if _timeout_env else None
+
+
+@functools.lru_cache(maxsize=8)
+def get_client(host: str) -> ollama.Client:
+    """
+    Return the process-wide ollama.Client for a host.
+
+    Shared by all agents so they reuse one underlying HTTP connection pool
+    (with keep-alive connections) instead of each going through the
+    module-level default client.
+
+    Args:
+        host: Ollama host URL
+
+    Returns:
+        Client bound to that host
+    """
+    return ollama.Client(host=host, timeout=OLLAMA_REQUEST_TIMEOUT)
+
+
+# AsyncClients are bound to the event loop they were first used on, so they are
+# cached per running loop (and dropped with it)
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, ollama.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client(host: str) -> ollama.AsyncClient:
+    """
+    Return the ollama.AsyncClient for a host on the running event loop.
+
+    Must be called from a coroutine. Repeated calls within the same loop share
+    one connection pool, like get_client does for synchronous requests.
+
+    Args:
+        host: Ollama host URL
+
+    Returns:
+        AsyncClient bound to that host
+    """
+    clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(host)
+    if client is None:
+        client = clients[host] = ollama.AsyncClient(host=host, timeout=OLLAMA_REQUEST_TIMEOUT)
+    return client
+
+
+@functools.lru_cache(maxsize=8)
+def _list_models(host: str) -> FrozenSet[str]:
+    """
+    List the models available on an Ollama host.
+
+    Cached for the process lifetime so that constructing several agents only
+    costs one HTTP roundtrip per host. Failures are not cached.
+
+    Args:
+        host: Ollama host URL
+
+    Returns:
+        Frozen set of model names
+    """
+    models_response = get_client(host).list()
+    # list() returns a ListResponse object with a 'models' attribute
+    # Each model is a Model object with a 'model' attribute containing the name
+    model_list = models_response.models if hasattr(models_response, 'models') else []
+    return frozenset(m.model for m in model_list if hasattr(m, 'model'))
+
+
+@functools.lru_cache(maxsize=16)
+def get_validated_host(host: str, model_name: str) -> bool:
+    """
+    Test connection to an Ollama host and check model availability, once per process.
+
+    Every specialized agent validates on construction; caching per (host, model)
+    means only the first agent pays for the check (and logs the missing-model
+    warning). Failures are not cached, so a later agent retries the check.
+
+    Args:
+        host: Ollama host URL
+        model_name: Name of the model that will be used
+
+    Returns:
+        True once the host has been validated
+
+    Raises:
+        OllamaConnectionError: If Ollama server cannot be reached
+    """
+    try:
+        # Check if Ollama is running and model is available
+        model_names = sorted(_list_models(host))
+
+        if model_name not in model_names:
+            logger.warning(
+                "Model '%s' not found locally. Available models: %s",
+                model_name, ', '.join(model_names) if model_names else 'None'
+            )
+            logger.info("To download the model, run: ollama pull %s", model_name)
+            logger.info("Attempting to use '%s' anyway (it will be downloaded if needed)...", model_name)
+    except Exception as e:
+        error_msg = (
+            f"Cannot connect to Ollama at {host}. "
+            f"Error: {str(e)}. "
+            f"Make sure Ollama is running with: ollama serve"
+        )
+        logger.error(error_msg)
+        raise OllamaConnectionError(error_msg)
+    return True
+
+
+@functools.lru_cache(maxsize=16)
+def preload_model(host: str, model_name: str) -> bool:
+    """
+    Load a model into Ollama's memory ahead of the first request, once per process.
+
+    Sends an empty generate request with OLLAMA_KEEP_ALIVE, so the first real
+    chat call does not pay the weight-loading time. Failures are logged and
+    otherwise ignored (the first chat call will load the model instead).
+
+    Args:
+        host: Ollama host URL
+        model_name: Name of the model to load
+
+    Returns:
+        True if the model was loaded
+    """
+    try:
+        get_client(host).generate(model=model_name, keep_alive=OLLAMA_KEEP_ALIVE)
+        return True
+    except Exception as e:
+        logger.debug("Could not preload model %s: %s", model_name, e)
+        return False
+
+
+def refresh_models() -> None:
+    """Clear the cached model listing and validation results (e.g. after running `ollama pull`)."""
+    _list_models.cache_clear()
+    get_validated_host.cache_clear()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_schema_file(schema_path: Path) -> Tuple[Dict[str, Any], Validator]:
+    """
+    Load a schema file and build its validator, once per process.
+
+    The returned schema dict is shared by all agents and must not be modified.
+    """
+    schema = json_utils.loads(schema_path.read_bytes())
+    logger.info("Loaded schema from %s", schema_path)
+    return schema, load_validator(schema, schema_path)
+
+
 class BaseAgent:
     """
     Base class for all scholarship analysis agents.
@@ -73,8 +241,10 @@ class BaseAgent:
         """
         self.model_name = model_name
         self.ollama_host = ollama_host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
+        self._client = get_client(self.ollama_host)
         self._connection_tested = False
         self.schema = None
+        self._schema_validator = None  # Compiled validate(instance) for self.schema
         self.system_message = system_message or (
             "You are a structured data extraction agent. You MUST respond with valid JSON only. "
             "Do NOT include markdown code blocks, comments, or any text outside the JSON. "
@@ -93,51 +263,40 @@ class BaseAgent:
         """
         Test connection to Ollama server and verify model availability.
 
+        The check is shared process-wide per (host, model), see get_validated_host.
+        Unless OLLAMA_PRELOAD=false, the model is also loaded into memory here.
+
         Raises:
             OllamaConnectionError: If Ollama server cannot be reached
             OllamaModelError: If the specified model is not available locally
         """
-        try:
-            # Check if Ollama is running and model is available
-            models_response = ollama.list()
-            # ollama.list() returns a ListResponse object with a 'models' attribute
-            # Each model is a Model object with a 'model' attribute containing the name
-            model_list = models_response.models if hasattr(models_response, 'models') else []
-            model_names = [m.model for m in model_list if hasattr(m, 'model')]
-
-            if self.model_name not in model_names:
-                logger.warning(
-                    f"Model '{self.model_name}' not found locally. "
-                    f"Available models: {', '.join(model_names) if model_names else 'None'}"
-                )
-                logger.info(f"To download the model, run: ollama pull {self.model_name}")
-                logger.info(f"Attempting to use '{self.model_name}' anyway (it will be downloaded if needed)...")
-        except Exception as e:
-            error_msg = (
-                f"Cannot connect to Ollama at {self.ollama_host}. "
-                f"Error: {str(e)}. "
-                f"Make sure Ollama is running with: ollama serve"
-            )
-            logger.error(error_msg)
-            raise OllamaConnectionError(error_msg)
+        get_validated_host(self.ollama_host, self.model_name)
+        if OLLAMA_PRELOAD:
+            preload_model(self.ollama_host, self.model_name)
 
     def _chat_with_retry(
         self,
         messages: List[Dict[str, str]],
         max_retries: Optional[int] = None,
         timeout: float = 60.0,
-        system_message: Optional[str] = None
+        system_message: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Send a chat request to Ollama with automatic retry on failure.
 
-        Uses exponential backoff strategy: 2s, 4s, 8s between retries.
+        Uses exponential backoff with jitter (~2s, 4s, 8s between retries) and
+        gives up immediately on client errors (HTTP 4xx, e.g. unknown model).
+        When the agent has a schema loaded it is passed as Ollama's `format`
+        parameter (structured outputs), so the model can only emit JSON that
+        matches the schema.
 
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             max_retries: Maximum number of retry attempts. Default: MAX_RETRIES class variable
             timeout: Timeout in seconds for each attempt (note: current ollama library doesn't support this)
             system_message: Optional system message to prepend to messages for structured output
+            options: Optional extra Ollama options merged over the defaults (e.g. num_keep)
 
         Returns:
             The response text from the model
@@ -148,46 +307,274 @@ class BaseAgent:
         if max_retries is None:
             max_retries = self.MAX_RETRIES
 
-        # Prepend system message if provided
-        final_messages = messages
-        if system_message:
-            # Check if first message is already a system message
-            if messages and messages[0].get('role') == 'system':
-                final_messages = messages  # Use existing system message
-            else:
-                final_messages = [{"role": "system", "content": system_message}] + messages
+        self._ensure_connection()
+        final_messages = self._build_messages(messages, system_message)
+        final_options = self._build_options(options)
 
         last_error = None
+        attempts = 0
 
         for attempt in range(max_retries):
             try:
-                response = ollama.chat(
+                response = self._client.chat(
                     model=self.model_name,
                     messages=final_messages,
                     stream=False,
-                    options={"temperature": 0}  # Lower temperature for more deterministic JSON output
+                    format=self.schema,  # Constrain decoding to the agent's JSON schema
+                    options=final_options,
+                    keep_alive=OLLAMA_KEEP_ALIVE
                 )
                 return response['message']['content']
             except (ConnectionError, TimeoutError, ollama.ResponseError) as e:
                 last_error = e
+                attempts = attempt + 1
+                if not self._is_retriable(e):
+                    logger.error("Ollama request failed with a non-retriable error: %s", e)
+                    break
                 if attempt < max_retries - 1:
-                    wait_time = self.INITIAL_RETRY_DELAY ** (attempt + 1)
+                    wait_time = self._retry_delay(attempt)
                     logger.warning(
-                        f"Ollama request failed (attempt {attempt + 1}/{max_retries}). "
-                        f"Retrying in {wait_time}s... Error: {str(e)}"
+                        "Ollama request failed (attempt %d/%d). Retrying in %.1fs... Error: %s",
+                        attempt + 1, max_retries, wait_time, e
                     )
                     time.sleep(wait_time)
                 else:
                     logger.error(
-                        f"Ollama request failed after {max_retries} attempts. "
+                        "Ollama request failed after %d attempts. Last error: %s",
+                        max_retries, e
+                    )
+
+        raise OllamaConnectionError(
+            f"Failed to get response from Ollama after {attempts} attempt(s). "
+            f"Last error: {str(last_error)}"
+        )
+
+    def _chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        max_retries: Optional[int] = None,
+        system_message: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chat response from Ollama, yielding content chunks as they are decoded.
+
+        Connection failures before the first chunk are retried like
+        _chat_with_retry; errors after streaming has started are raised as
+        OllamaConnectionError since partial output cannot be replayed.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            max_retries: Maximum number of retry attempts. Default: MAX_RETRIES class variable
+            system_message: Optional system message to prepend to messages for structured output
+            options: Optional extra Ollama options merged over the defaults
+            response_format: Optional JSON schema to constrain the output with
+                             instead of the agent's own schema
+
+        Yields:
+            Pieces of the response text
+        """
+        if max_retries is None:
+            max_retries = self.MAX_RETRIES
+
+        self._ensure_connection()
+        final_messages = self._build_messages(messages, system_message)
+        final_options = self._build_options(options)
+        if response_format is None:
+            response_format = self.schema
+
+        for attempt in range(max_retries):
+            started = False
+            try:
+                stream = self._client.chat(
+                    model=self.model_name,
+                    messages=final_messages,
+                    stream=True,
+                    format=response_format,
+                    options=final_options,
+                    keep_alive=OLLAMA_KEEP_ALIVE
+                )
+                for chunk in stream:
+                    content = chunk['message']['content']
+                    if content:
+                        started = True
+                        yield content
+                return
+            except (ConnectionError, TimeoutError, ollama.ResponseError) as e:
+                if started or not self._is_retriable(e) or attempt == max_retries - 1:
+                    raise OllamaConnectionError(
+                        f"Streaming request to Ollama failed after {attempt + 1} attempt(s). "
                         f"Last error: {str(e)}"
                     )
+                wait_time = self._retry_delay(attempt)
+                logger.warning(
+                    "Ollama streaming request failed (attempt %d/%d). Retrying in %.1fs... Error: %s",
+                    attempt + 1, max_retries, wait_time, e
+                )
+                time.sleep(wait_time)
+
+    async def _achat_with_retry(
+        self,
+        messages: List[Dict[str, str]],
+        max_retries: Optional[int] = None,
+        system_message: Optional[str] = None,
+        client: Optional[ollama.AsyncClient] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Async counterpart of _chat_with_retry using ollama.AsyncClient.
+
+        Lets callers issue several requests concurrently (e.g. with asyncio.gather)
+        so that HTTP I/O and model compute overlap. The Ollama server only runs
+        requests in parallel when OLLAMA_NUM_PARALLEL (and, for several models,
+        OLLAMA_MAX_LOADED_MODELS) is set on the server side.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            max_retries: Maximum number of retry attempts. Default: MAX_RETRIES class variable
+            system_message: Optional system message to prepend to messages for structured output
+            client: Optional AsyncClient to use. If None, the loop's shared client for the host is used.
+            options: Optional extra Ollama options merged over the defaults (e.g. num_keep)
+
+        Returns:
+            The response text from the model
+
+        Raises:
+            OllamaConnectionError: If all retry attempts fail
+        """
+        if max_retries is None:
+            max_retries = self.MAX_RETRIES
+
+        self._ensure_connection()
+        final_messages = self._build_messages(messages, system_message)
+        final_options = self._build_options(options)
+        client = client or get_async_client(self.ollama_host)
+
+        last_error = None
+        attempts = 0
+
+        for attempt in range(max_retries):
+            try:
+                response = await client.chat(
+                    model=self.model_name,
+                    messages=final_messages,
+                    stream=False,
+                    format=self.schema,
+                    options=final_options,
+                    keep_alive=OLLAMA_KEEP_ALIVE
+                )
+                return response['message']['content']
+            except (ConnectionError, TimeoutError, ollama.ResponseError) as e:
+                last_error = e
+                attempts = attempt + 1
+                if not self._is_retriable(e):
+                    logger.error("Ollama request failed with a non-retriable error: %s", e)
+                    break
+                if attempt < max_retries - 1:
+                    wait_time = self._retry_delay(attempt)
+                    logger.warning(
+                        "Ollama request failed (attempt %d/%d). Retrying in %.1fs... Error: %s",
+                        attempt + 1, max_retries, wait_time, e
+                    )
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(
+                        "Ollama request failed after %d attempts. Last error: %s",
+                        max_retries, e
+                    )
 
         raise OllamaConnectionError(
-            f"Failed to get response from Ollama after {max_retries} attempts. "
+            f"Failed to get response from Ollama after {attempts} attempt(s). "
             f"Last error: {str(last_error)}"
         )
 
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Backoff delay before retrying after the given (0-based) attempt.
+
+        INITIAL_RETRY_DELAY * 2**attempt (attempts past MAX_RETRIES reuse the last
+        delay) with up to 0.5s of random jitter so concurrent workers do not retry
+        in lockstep. Read from the class, so subclasses can override either constant.
+        """
+        exponent = min(attempt, max(self.MAX_RETRIES - 1, 0))
+        return self.INITIAL_RETRY_DELAY * 2.0 ** exponent + random.uniform(0, 0.5)
+
+    @staticmethod
+    def _is_retriable(error: Exception) -> bool:
+        """
+        Whether a failed Ollama request is worth retrying.
+
+        Client errors (HTTP 4xx such as 400 bad request or 404 model not found)
+        are deterministic and fail fast; 429 (busy) and server/transport
+        errors are retried.
+        """
+        status_code = getattr(error, 'status_code', None)
+        if isinstance(status_code, int) and 400 <= status_code < 500 and status_code != 429:
+            return False
+        return True
+
+    @staticmethod
+    def _build_messages(
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Prepend the system message to messages unless one is already present.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            system_message: Optional system message to prepend
+
+        Returns:
+            Final list of messages to send to Ollama
+        """
+        if not system_message:
+            return messages
+        # Check if first message is already a system message
+        if messages and messages[0].get('role') == 'system':
+            return messages  # Use existing system message
+        return [{"role": "system", "content": system_message}] + messages
+
+    def _response_cache_key(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Response cache key for a chat request made with this agent's schema.
+
+        Args:
+            prompt: User prompt
+            system_message: System message sent with the prompt
+            options: The extra options passed to the chat call (merged like _build_options)
+
+        Returns:
+            Key for ResponseCache.get/set
+        """
+        return ResponseCache.make_key(
+            self.model_name, prompt, system_message,
+            schema=self.schema, options=self._build_options(options)
+        )
+
+    @staticmethod
+    def _build_options(options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Merge caller options over the default Ollama options.
+
+        Args:
+            options: Optional extra options (e.g. {"num_keep": 512})
+
+        Returns:
+            Options dict for Client.chat
+        """
+        # Lower temperature for more deterministic JSON output
+        final_options = {"temperature": 0}
+        if options:
+            final_options.update(options)
+        return final_options
+
     def parse_llm_response(self, response_text: str, filename: Optional[str] = None, messages: Optional[List[Dict[str, str]]] = None, retry_count: int = 0) -> Dict[str, Any]:
         """
         Parse JSON response from LLM, handling markdown code blocks and formatting issues.
@@ -197,7 +584,8 @@ class BaseAgent:
         {...}
         ```
 
-        This method extracts and parses the JSON, stripping markdown formatting
+        Responses produced with structured outputs are parsed directly. Otherwise
+        this method extracts and parses the JSON, stripping markdown formatting
         and attempting to fix common formatting issues. If all local fixes fail and
         the original messages are provided, it will ask the LLM to fix the JSON.
 
@@ -219,11 +607,21 @@ class BaseAgent:
             # Check if filename looks like a path (contains / or \)
             if '/' not in filename and '\\' not in filename and not filename.startswith('~'):
                 # If no path separator, it might be just a name
-                logger.debug(f"Filename appears to be relative or just a name: {filename}")
+                logger.debug("Filename appears to be relative or just a name: %s", filename)
             # Check if it's an absolute path
             elif not filename.startswith('/') and not filename.startswith('~') and not (len(filename) > 1 and filename[1] == ':'):
                 # Relative path - log a warning
-                logger.warning(f"Filename is relative, not absolute: {filename}")
+                logger.warning("Filename is relative, not absolute: %s", filename)
+
+        # Fast path: with structured outputs the response is plain schema-conforming JSON
+        try:
+            parsed = json_utils.loads(response_text)
+            if isinstance(parsed, dict):
+                if self.schema:
+                    self._schema_validator(parsed)
+                return parsed
+        except (json.JSONDecodeError, ValidationError):
+            pass
 
         # Use JSONParser to handle all JSON parsing and recovery
         return JSONParser.parse_json(
@@ -254,16 +652,14 @@ class BaseAgent:
 
             for schema_path in schema_paths:
                 if schema_path.exists():
-                    with open(schema_path, 'r', encoding='utf-8') as f:
-                        schema = json.load(f)
-                    logger.info(f"Loaded schema from {schema_path}")
+                    schema, self._schema_validator = _load_schema_file(schema_path)
                     return schema
 
-            logger.warning(f"Schema file not found: {schema_name}")
+            logger.warning("Schema file not found: %s", schema_name)
             return None
 
         except Exception as e:
-            logger.error(f"Error loading schema {schema_name}: {str(e)}")
+            logger.error("Error loading schema %s: %s", schema_name, e)
             return None
 
     def _validate_against_schema(self, data: Dict[str, Any], filename: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -285,12 +681,12 @@ class BaseAgent:
             return data
 
         try:
-            validate(instance=data, schema=self.schema)
-            logger.info(f"Data validation successful{' (file: ' + filename + ')' if filename else ''}")
+            self._schema_validator(data)
+            logger.info("Data validation successful%s", f" (file: {filename})" if filename else "")
             return data
         except ValidationError as e:
             file_context = f" (file: {filename})" if filename else ""
-            logger.error(f"Schema validation failed{file_context}: {str(e)}")
+            logger.error("Schema validation failed%s: %s", file_context, e)
             raise
 
     def _ensure_connection(self) -> None:
@@ -9,14 +9,19 @@ instructor library, with fallback strategies for malformed JSON.
 import json
 import re
 import logging
-from typing import Optional, Dict, List, Any, Type, TypeVar
+from typing import Optional, Dict, List, Any, Type, TypeVar, Tuple
 from json_repair import repair_json
 from jsonschema import validate, ValidationError
 
+from processor.utils import json_utils
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Optional ```json / ``` fence around the body, matched in a single scan
+_MARKDOWN_FENCE_RE = re.compile(r"^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$", re.S)
+
 
 class JSONParser:
     """Robust JSON parser for LLM responses with multiple recovery strategies.
@@ -73,55 +78,55 @@ class JSONParser:
 
         # Attempt 1: Direct JSON parsing
         try:
-            parsed = json.loads(text)
+            parsed = json_utils.loads(text)
             JSONParser._validate_against_schema(parsed, schema, file_context)
             return parsed
         except json.JSONDecodeError as e:
-            logger.warning(f"First attempt to parse JSON failed{file_context}: {str(e)}. Attempting to fix...")
-            logger.warning(f"Failed to parse text{file_context}:\n{text} <-----")
+            logger.warning("First attempt to parse JSON failed%s: %s. Attempting to fix...", file_context, e)
+            logger.warning("Failed to parse text%s:\n%s <-----", file_context, text)
 
         # Attempt 2: Use json_repair library
         try:
-            logger.info(f"Attempting json_repair{file_context}...")
+            logger.info("Attempting json_repair%s...", file_context)
             text_fixed = repair_json(text)
-            result = json.loads(text_fixed)
-            logger.info(f"Successfully repaired JSON{file_context} using json_repair")
+            result = json_utils.loads(text_fixed)
+            logger.info("Successfully repaired JSON%s using json_repair", file_context)
             JSONParser._validate_against_schema(result, schema, file_context)
             return result
         except Exception as repair_error:
-            logger.warning(f"json_repair attempt failed{file_context}: {str(repair_error)}")
+            logger.warning("json_repair attempt failed%s: %s", file_context, repair_error)
 
         # Attempt 3: Manual fixes (smart quotes, trailing commas)
         text_fixed = JSONParser._apply_manual_fixes(text)
 
         try:
-            result = json.loads(text_fixed)
-            logger.info(f"Successfully parsed JSON after manual fixes{file_context}")
+            result = json_utils.loads(text_fixed)
+            logger.info("Successfully parsed JSON after manual fixes%s", file_context)
             JSONParser._validate_against_schema(result, schema, file_context)
             return result
         except json.JSONDecodeError as e2:
-            logger.warning(f"Second attempt failed{file_context}: {str(e2)}. Trying to extract JSON object...")
-            logger.debug(f"Failed to parse fixed text{file_context}:\n{text_fixed}")
+            logger.warning("Second attempt failed%s: %s. Trying to extract JSON object...", file_context, e2)
+            logger.debug("Failed to parse fixed text%s:\n%s", file_context, text_fixed)
 
         # Attempt 4: Extract JSON object by finding balanced braces
         extracted_text = JSONParser._extract_json_object(text_fixed)
         if extracted_text:
             try:
-                result = json.loads(extracted_text)
-                logger.info(f"Successfully parsed extracted JSON object{file_context}")
+                result = json_utils.loads(extracted_text)
+                logger.info("Successfully parsed extracted JSON object%s", file_context)
                 JSONParser._validate_against_schema(result, schema, file_context)
                 return result
             except json.JSONDecodeError as e3:
-                logger.error(f"Failed to parse JSON after extracting object{file_context}: {str(e3)}")
-                logger.debug(f"Extracted text was:\n{extracted_text}")
+                logger.error("Failed to parse JSON after extracting object%s: %s", file_context, e3)
+                logger.debug("Extracted text was:\n%s", extracted_text)
 
-        logger.error(f"Failed to parse JSON response after all fix attempts{file_context}")
-        logger.error(f"Original response text{file_context}:\n{response_text}")
-        logger.error(f"Fixed text{file_context}:\n{text_fixed}")
+        logger.error("Failed to parse JSON response after all fix attempts%s", file_context)
+        logger.error("Original response text%s:\n%s", file_context, response_text)
+        logger.error("Fixed text%s:\n%s", file_context, text_fixed)
 
         # Attempt 5: Ask LLM to fix the JSON
         if messages and chat_function and retry_count < 2:  # Allow 2 retries
-            logger.warning(f"Asking LLM to fix malformed JSON{file_context} (attempt {retry_count + 1}/2)...")
+            logger.warning("Asking LLM to fix malformed JSON%s (attempt %s/2)...", file_context, retry_count + 1)
             try:
                 # Build retry message with schema requirements if available
                 validation_error_msg = ""
@@ -153,7 +158,7 @@ CRITICAL: Fix and return ONLY valid JSON that:
 
                 retry_response = chat_function(retry_messages)
 
-                logger.info(f"LLM provided retry response{file_context}, attempting to parse...")
+                logger.info("LLM provided retry response%s, attempting to parse...", file_context)
                 return JSONParser.parse_json(
                     retry_response,
                     filename=filename,
@@ -164,7 +169,7 @@ CRITICAL: Fix and return ONLY valid JSON that:
                 )
 
             except Exception as retry_error:
-                logger.error(f"LLM retry also failed{file_context}: {str(retry_error)}")
+                logger.error("LLM retry also failed%s: %s", file_context, retry_error)
 
         raise ValueError(f"Could not parse JSON{file_context} after all recovery attempts")
 
@@ -178,17 +183,8 @@ CRITICAL: Fix and return ONLY valid JSON that:
         Returns:
             Text with markdown wrappers removed
         """
-        text = text.strip()
-
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-
-        if text.endswith("```"):
-            text = text[:-3]
-
-        return text.strip()
+        match = _MARKDOWN_FENCE_RE.match(text)
+        return match.group(1) if match else text.strip()
 
     @staticmethod
     def _apply_manual_fixes(text: str) -> str:
@@ -254,9 +250,9 @@ CRITICAL: Fix and return ONLY valid JSON that:
 
         try:
             validate(instance=data, schema=schema)
-            logger.info(f"Data validation successful{file_context}")
+            logger.info("Data validation successful%s", file_context)
         except ValidationError as e:
-            logger.warning(f"Schema validation failed{file_context}: {str(e)}")
+            logger.warning("Schema validation failed%s: %s", file_context, e)
             raise
 
     @staticmethod
@@ -313,53 +309,53 @@ CRITICAL: Fix and return ONLY valid JSON that:
 
         # Attempt 1: Direct parsing with instructor validation
         try:
-            logger.info(f"Parsing with instructor{file_context}...")
+            logger.info("Parsing with instructor%s...", file_context)
             # Use instructor's validation on the JSON text
-            parsed_json = json.loads(text)
+            parsed_json = json_utils.loads(text)
             validated = output_model(**parsed_json)
-            logger.info(f"Successfully validated JSON with instructor{file_context}")
+            logger.info("Successfully validated JSON with instructor%s", file_context)
             return validated
         except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"Instructor validation failed{file_context}: {str(e)}")
+            logger.warning("Instructor validation failed%s: %s", file_context, e)
 
         # Attempt 2: Try with json_repair
         try:
-            logger.info(f"Attempting json_repair for instructor validation{file_context}...")
+            logger.info("Attempting json_repair for instructor validation%s...", file_context)
             text_fixed = repair_json(text)
-            parsed_json = json.loads(text_fixed)
+            parsed_json = json_utils.loads(text_fixed)
             validated = output_model(**parsed_json)
-            logger.info(f"Successfully validated repaired JSON with instructor{file_context}")
+            logger.info("Successfully validated repaired JSON with instructor%s", file_context)
             return validated
         except Exception as e:
-            logger.warning(f"Repaired JSON instructor validation failed{file_context}: {str(e)}")
+            logger.warning("Repaired JSON instructor validation failed%s: %s", file_context, e)
 
         # Attempt 3: Manual fixes and validation
         try:
             text_fixed = JSONParser._apply_manual_fixes(text)
-            parsed_json = json.loads(text_fixed)
+            parsed_json = json_utils.loads(text_fixed)
             validated = output_model(**parsed_json)
-            logger.info(f"Successfully validated manually fixed JSON with instructor{file_context}")
+            logger.info("Successfully validated manually fixed JSON with instructor%s", file_context)
             return validated
         except Exception as e:
-            logger.warning(f"Manual fixes instructor validation failed{file_context}: {str(e)}")
+            logger.warning("Manual fixes instructor validation failed%s: %s", file_context, e)
 
         # Attempt 4: Extract and validate
         try:
             extracted_text = JSONParser._extract_json_object(text_fixed)
             if extracted_text:
-                parsed_json = json.loads(extracted_text)
+                parsed_json = json_utils.loads(extracted_text)
                 validated = output_model(**parsed_json)
-                logger.info(f"Successfully validated extracted JSON with instructor{file_context}")
+                logger.info("Successfully validated extracted JSON with instructor%s", file_context)
                 return validated
         except Exception as e:
-            logger.warning(f"Extracted JSON instructor validation failed{file_context}: {str(e)}")
+            logger.warning("Extracted JSON instructor validation failed%s: %s", file_context, e)
 
-        logger.error(f"Failed to parse and validate with instructor after all attempts{file_context}")
-        logger.error(f"Original response text{file_context}:\n{response_text}")
+        logger.error("Failed to parse and validate with instructor after all attempts%s", file_context)
+        logger.error("Original response text%s:\n%s", file_context, response_text)
 
         # Attempt 5: Ask LLM to fix
         if messages and chat_function and retry_count < 2:  # Allow 2 retries
-            logger.warning(f"Asking LLM to fix malformed JSON for instructor validation{file_context} (attempt {retry_count + 1}/2)...")
+            logger.warning("Asking LLM to fix malformed JSON for instructor validation%s (attempt %s/2)...", file_context, retry_count + 1)
             try:
                 retry_content = f"""You previously returned malformed JSON. Here is what you returned:
 
@@ -383,7 +379,7 @@ CRITICAL: Fix and return ONLY valid JSON that:
 
                 retry_response = chat_function(retry_messages)
 
-                logger.info(f"LLM provided retry response for instructor validation{file_context}")
+                logger.info("LLM provided retry response for instructor validation%s", file_context)
                 return JSONParser.parse_with_instructor(
                     retry_response,
                     output_model,
@@ -394,6 +390,156 @@ CRITICAL: Fix and return ONLY valid JSON that:
                 )
 
             except Exception as retry_error:
-                logger.error(f"LLM retry with instructor validation also failed{file_context}: {str(retry_error)}")
+                logger.error("LLM retry with instructor validation also failed%s: %s", file_context, retry_error)
 
         raise ValueError(f"Could not parse and validate JSON with instructor{file_context} after all recovery attempts")
+
+
+class IncrementalObjectParser:
+    """Incrementally parse the top-level members of a streamed JSON object.
+
+    Text is fed chunk by chunk (e.g. tokens streamed from Ollama); every time a
+    top-level ``"key": value`` member is complete it is decoded and returned,
+    so callers can act on early fields before generation finishes. Only the
+    members are decoded here; the caller should still parse/validate the full
+    text once the stream ends.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Feed a chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            List of (key, value) pairs for members completed by this chunk
+        """
+        self._text += chunk
+        completed: List[Tuple[str, Any]] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                continue
+
+            if c == '"':
+                self._in_string = True
+            elif c in '{[':
+                self._depth += 1
+                if self._depth == 1 and c == '{':
+                    self._member_start = i + 1
+            elif c in '}]':
+                if self._depth == 1:
+                    self._emit(text, i, completed)
+                self._depth -= 1
+            elif c == ',' and self._depth == 1:
+                self._emit(text, i, completed)
+                self._member_start = i + 1
+
+        self._pos = len(text)
+        return completed
+
+    def _emit(self, text: str, end: int, completed: List[Tuple[str, Any]]) -> None:
+        """Decode the member between the current start and end, if any."""
+        if self._member_start is None:
+            return
+        member = text[self._member_start:end].strip()
+        self._member_start = None
+        if not member:
+            return
+        try:
+            decoded = json_utils.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            logger.debug("Could not decode streamed member: %s", member[:100])
+            return
+        completed.extend(decoded.items())
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._text
+
+
+class IncrementalArrayParser:
+    """Incrementally parse the items of an array nested in a streamed JSON object.
+
+    Intended for responses shaped like ``{"results": [{...}, {...}]}``: every
+    time an item of the array is closed it is decoded and returned, so callers
+    can handle ``results[0]`` while the model is still generating the rest.
+    As with IncrementalObjectParser, the full text should still be parsed
+    once the stream ends.
+    """
+
+    # Depth of the array items: top-level object (1) -> array (2) -> item (3)
+    ITEM_DEPTH = 3
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Feed a chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            List of array items completed by this chunk
+        """
+        self._text += chunk
+        completed: List[Any] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                continue
+
+            if c == '"':
+                self._in_string = True
+            elif c in '{[':
+                self._depth += 1
+                if self._depth == self.ITEM_DEPTH:
+                    self._item_start = i
+            elif c in '}]':
+                if self._depth == self.ITEM_DEPTH and self._item_start is not None:
+                    item = text[self._item_start:i + 1]
+                    self._item_start = None
+                    try:
+                        completed.append(json_utils.loads(item))
+                    except json.JSONDecodeError:
+                        logger.debug("Could not decode streamed array item: %s", item[:100])
+                self._depth -= 1
+
+        self._pos = len(text)
+        return completed
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._text
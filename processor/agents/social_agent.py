@@ -6,11 +6,64 @@ This agent analyzes application materials to identify social media presence on
 Facebook, Instagram, TikTok, and LinkedIn.
 """
 
+import re
 import json
+import asyncio
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+
+import ollama
 
 from processor.agents.base_agent import BaseAgent
+from processor.utils.response_cache import ResponseCache
+
+
+# Only the beginning of each document goes into the prompt, so only that much is read
+MAX_RESUME_CHARS = 3000
+MAX_ESSAY_CHARS = 2000
+
+# The social profile JSON is well under 800 tokens; capping decode length bounds latency
+SOCIAL_NUM_PREDICT = 768
+SOCIAL_CHAT_OPTIONS = {"num_predict": SOCIAL_NUM_PREDICT}
+
+PLATFORMS = ("facebook", "instagram", "tiktok", "linkedin")
+
+# Profile URLs per platform; group 1 is the handle
+_PLATFORM_URL_RES = {
+    "facebook": re.compile(r'(?:https?://)?(?:www\.|m\.)?(?:facebook|fb)\.com/([\w.\-]+)', re.IGNORECASE),
+    "instagram": re.compile(r'(?:https?://)?(?:www\.)?instagram\.com/([\w.\-]+)', re.IGNORECASE),
+    "tiktok": re.compile(r'(?:https?://)?(?:www\.)?tiktok\.com/(@[\w.\-]+)', re.IGNORECASE),
+    "linkedin": re.compile(r'(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/([\w\-%]+)', re.IGNORECASE),
+}
+
+# First path segments that are not profile handles (groups, posts, share links, ...).
+# A link like facebook.com/groups/... is left to the LLM instead of being taken as a
+# profile; LinkedIn and TikTok patterns already require /in/ and /@ respectively, and
+# other linkedin.com links stay in the text as a mention, which also defers to the LLM.
+_NON_PROFILE_PATHS = {
+    "facebook": frozenset({
+        "groups", "pages", "events", "share", "sharer", "sharer.php", "profile.php", "people",
+        "watch", "reel", "photo", "photo.php", "media", "story.php", "permalink.php",
+        "marketplace", "hashtag", "gaming", "login", "help", "policies",
+    }),
+    "instagram": frozenset({"p", "reel", "reels", "tv", "stories", "explore", "accounts", "direct"}),
+    "tiktok": frozenset(),
+    "linkedin": frozenset(),
+}
+
+# Anything that might refer to a profile without a full URL (platform names, @handles
+# not part of an email address); when present the LLM has to interpret the text
+_PLATFORM_MENTION_RE = re.compile(r'\b(?:facebook|fb|instagram|insta|ig|tik\s?tok|linked\s?in)\b', re.IGNORECASE)
+_HANDLE_RE = re.compile(r'(?<![\w.])@[A-Za-z0-9_.]{2,}')
+
+
+def _read_head(path: Path, max_chars: int) -> Optional[str]:
+    """Read up to max_chars characters of a text file, or None if it does not exist."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read(max_chars)
+    except FileNotFoundError:
+        return None
 
 
 class SocialAgent(BaseAgent):
@@ -25,27 +78,30 @@ class SocialAgent(BaseAgent):
             ollama_host: Optional custom Ollama host URL (default: http://localhost:11434)
         """
         super().__init__(model_name=model_name, ollama_host=ollama_host, schema_name="social_agent_schema.json")
+        # Parsed responses keyed by request (see _response_cache_key) so reruns skip the LLM call
+        self.response_cache = ResponseCache.from_env()
     
-    def analyze_social_presence(
+    def _build_prompt(
         self,
         resume: Optional[Dict],
         essays: List[Dict],
         application_profile: Dict,
         text_files_base_path: Optional[Path] = None,
         additional_criteria: Optional[str] = None
-    ) -> Dict:
+    ) -> Tuple[str, str, str]:
         """
-        Analyze application materials to identify social media presence.
-        
+        Build the social presence prompt from the application materials.
+
         Args:
             resume: Resume attachment with extracted text (if available)
             essays: List of essay attachments with extracted text
             application_profile: The application profile for context
             text_files_base_path: Base path where extracted text files are stored
             additional_criteria: Optional additional criteria to consider when analyzing
-            
+
         Returns:
-            Dictionary with social presence profile including platforms found and links
+            Tuple of (prompt, source file names for debugging output, resume and essay
+            text included in the prompt)
         """
         # Get applicant name from application profile for context
         profile_data = application_profile.get('profile', {})
@@ -60,9 +116,7 @@ class SocialAgent(BaseAgent):
                 else:
                     text_path = Path(resume['extracted_text_file'])
                 
-                if text_path.exists():
-                    with open(text_path, 'r', encoding='utf-8') as f:
-                        resume_text = f.read()
+                resume_text = _read_head(text_path, MAX_RESUME_CHARS) or ""
             except Exception as e:
                 resume_text = f"\nNote: Could not read resume: {e}\n"
         
@@ -73,7 +127,8 @@ class SocialAgent(BaseAgent):
             essays = [essays] if essays else []
 
         if essays:
-            essay_texts = "\n\nEssays:\n"
+            # Collect the sections and join once instead of growing a string per essay
+            essay_parts = ["\n\nEssays:\n"]
             for i, essay in enumerate(essays, 1):
                 # Ensure essay is a dict before calling .get()
                 if not isinstance(essay, dict):
@@ -85,12 +140,12 @@ class SocialAgent(BaseAgent):
                         else:
                             text_path = Path(essay['extracted_text_file'])
                         
-                        if text_path.exists():
-                            with open(text_path, 'r', encoding='utf-8') as f:
-                                essay_text = f.read()
-                                essay_texts += f"\nEssay {i} ({essay.get('filename', 'unknown')}):\n{essay_text[:2000]}\n"
+                        essay_text = _read_head(text_path, MAX_ESSAY_CHARS)
+                        if essay_text is not None:
+                            essay_parts.append(f"\nEssay {i} ({essay.get('filename', 'unknown')}):\n{essay_text}\n")
                     except Exception as e:
-                        essay_texts += f"\nEssay {i}: Error reading file: {e}\n"
+                        essay_parts.append(f"\nEssay {i}: Error reading file: {e}\n")
+            essay_texts = "".join(essay_parts)
         else:
             essay_texts = "\n\nNo essays found."
         
@@ -130,7 +185,7 @@ Look for:
 - References to social media activity or content
 
 Resume:
-{resume_text[:3000] if resume_text else "No resume found."}
+{resume_text[:MAX_RESUME_CHARS] if resume_text else "No resume found."}
 {essay_texts}{criteria_section}
 
 Based on the application materials{', and the additional criteria provided above' if additional_criteria else ''}, provide a JSON response with the following structure:
@@ -190,27 +245,148 @@ CRITICAL JSON FORMAT REQUIREMENTS:
 - All scores must be integers between 0 and 100
 - The response must be parseable by json.loads() without any preprocessing"""
 
-        try:
-            # Build full file path for debugging (use absolute paths)
-            file_paths = []
-            if essays:
-                for essay in essays:
-                    if isinstance(essay, dict) and text_files_base_path and essay.get('extracted_text_file'):
-                        file_path = text_files_base_path / essay['extracted_text_file']
-                        file_paths.append(str(file_path.resolve() if hasattr(file_path, 'resolve') else file_path.absolute()))
-            if resume and isinstance(resume, dict) and text_files_base_path and resume.get('extracted_text_file'):
-                file_path = text_files_base_path / resume['extracted_text_file']
-                file_paths.append(str(file_path.resolve() if hasattr(file_path, 'resolve') else file_path.absolute()))
-
-            full_filename = " | ".join(file_paths) if file_paths else (applicant_name if applicant_name else "unknown")
+        # Build full file path for debugging (use absolute paths)
+        file_paths = []
+        if essays:
+            for essay in essays:
+                if isinstance(essay, dict) and text_files_base_path and essay.get('extracted_text_file'):
+                    file_path = text_files_base_path / essay['extracted_text_file']
+                    file_paths.append(str(file_path.resolve() if hasattr(file_path, 'resolve') else file_path.absolute()))
+        if resume and isinstance(resume, dict) and text_files_base_path and resume.get('extracted_text_file'):
+            file_path = text_files_base_path / resume['extracted_text_file']
+            file_paths.append(str(file_path.resolve() if hasattr(file_path, 'resolve') else file_path.absolute()))
+
+        full_filename = " | ".join(file_paths) if file_paths else (applicant_name if applicant_name else "unknown")
+
+        materials = f"{resume_text[:MAX_RESUME_CHARS]}\n{essay_texts}"
+        return prompt, full_filename, materials
+
+    @staticmethod
+    def _profile_from_links(materials: str) -> Optional[Dict]:
+        """
+        Build the social profile directly from profile URLs found in the materials.
+
+        Finding profile links is pattern matching, so when the text contains only
+        full profile URLs (or no social media references at all) the result is
+        determined without the LLM. Returns None if the text mentions a platform or
+        an @handle outside of a URL, or links to a non-profile page (a group, post,
+        share link, ...), which need the LLM to interpret.
+
+        Args:
+            materials: Resume and essay text that would be sent to the LLM
+
+        Returns:
+            Social profile dictionary, or None if the LLM is needed
+        """
+        platforms_found = {}
+        remaining = materials
+        for platform, pattern in _PLATFORM_URL_RES.items():
+            match = pattern.search(materials)
+            if match and match.group(1).lower() in _NON_PROFILE_PATHS[platform]:
+                return None
+            if match:
+                link = match.group(0)
+                platforms_found[platform] = {
+                    "present": True,
+                    "link": link if link.lower().startswith("http") else f"https://{link}",
+                    "handle": match.group(1),
+                    "evidence": "Profile link found in the resume or essays",
+                }
+                remaining = pattern.sub(" ", remaining)
+            else:
+                platforms_found[platform] = {
+                    "present": False,
+                    "link": None,
+                    "handle": None,
+                    "evidence": "No profile link or mention found in the resume or essays",
+                }
+
+        if _PLATFORM_MENTION_RE.search(remaining) or _HANDLE_RE.search(remaining):
+            return None
+
+        found = [platform for platform in PLATFORMS if platforms_found[platform]["present"]]
+        has_linkedin = platforms_found["linkedin"]["present"]
+        # Fixed scoring rule for this link-only case (the LLM scores the other cases with
+        # its own judgement): 25 points per platform with a profile link, professional
+        # presence all-or-nothing on a LinkedIn profile link, overall their average
+        social_score = 25 * len(found)
+        professional_score = 100 if has_linkedin else 0
+        overall_score = (social_score + professional_score) // 2
+
+        if found:
+            summary = f"The application materials link to the applicant's {', '.join(found)} profile(s)."
+        else:
+            summary = "The application materials do not mention any social media profiles."
+
+        return {
+            "summary": summary,
+            "profile_features": {
+                "platforms_found": platforms_found,
+                "total_platforms": len(found),
+                "has_professional_presence": has_linkedin,
+                "notes": "Determined from profile links in the resume and essays",
+            },
+            "scores": {
+                "social_presence_score": social_score,
+                "professional_presence_score": professional_score,
+                "overall_score": overall_score,
+            },
+            "score_breakdown": {
+                "social_presence_score_reasoning": f"{len(found)} of 4 platforms found (25 points each)",
+                "professional_presence_score_reasoning": (
+                    "LinkedIn profile found" if has_linkedin else "No LinkedIn profile found"
+                ),
+                "overall_score_reasoning": "Average of the social and professional presence scores",
+            },
+        }
+
+    def analyze_social_presence(
+        self,
+        resume: Optional[Dict],
+        essays: List[Dict],
+        application_profile: Dict,
+        text_files_base_path: Optional[Path] = None,
+        additional_criteria: Optional[str] = None
+    ) -> Dict:
+        """
+        Analyze application materials to identify social media presence.
+        
+        Args:
+            resume: Resume attachment with extracted text (if available)
+            essays: List of essay attachments with extracted text
+            application_profile: The application profile for context
+            text_files_base_path: Base path where extracted text files are stored
+            additional_criteria: Optional additional criteria to consider when analyzing
+            
+        Returns:
+            Dictionary with social presence profile including platforms found and links
+        """
+        prompt, full_filename, materials = self._build_prompt(
+            resume, essays, application_profile, text_files_base_path, additional_criteria
+        )
+
+        # Unambiguous cases are decided from the profile links alone (criteria may change the scoring)
+        if not additional_criteria:
+            result = self._profile_from_links(materials)
+            if result is not None:
+                return result
 
+        cache_key = self._response_cache_key(prompt, self.system_message, SOCIAL_CHAT_OPTIONS)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
             # Prepare messages for potential retry
             messages = [{"role": "user", "content": prompt}]
 
-            response_text = self._chat_with_retry(messages, system_message=self.system_message)
+            response_text = self._chat_with_retry(
+                messages, system_message=self.system_message, options=SOCIAL_CHAT_OPTIONS
+            )
 
             # Use BaseAgent's JSON parsing method (handles markdown extraction and retry)
             result = self.parse_llm_response(response_text, filename=full_filename, messages=messages)
+            self.response_cache.set(cache_key, result)
             return result
 
         except ValueError as e:
@@ -218,3 +394,61 @@ CRITICAL JSON FORMAT REQUIREMENTS:
         except Exception as e:
             raise RuntimeError(f"Error analyzing social presence: {str(e)}")
 
+    async def analyze_social_presence_async(
+        self,
+        resume: Optional[Dict],
+        essays: List[Dict],
+        application_profile: Dict,
+        text_files_base_path: Optional[Path] = None,
+        additional_criteria: Optional[str] = None,
+        client: Optional[ollama.AsyncClient] = None
+    ) -> Dict:
+        """
+        Async version of analyze_social_presence using ollama.AsyncClient.
+
+        Several applicants can be analyzed concurrently with asyncio.gather; the
+        Ollama server overlaps them up to its OLLAMA_NUM_PARALLEL setting.
+
+        Args:
+            resume: Resume attachment with extracted text (if available)
+            essays: List of essay attachments with extracted text
+            application_profile: The application profile for context
+            text_files_base_path: Base path where extracted text files are stored
+            additional_criteria: Optional additional criteria to consider when analyzing
+            client: Optional AsyncClient shared across concurrent requests
+
+        Returns:
+            Dictionary with social presence profile including platforms found and links
+        """
+        # Reads the resume/essay text files, keep it off the event loop
+        prompt, full_filename, materials = await asyncio.to_thread(
+            self._build_prompt, resume, essays, application_profile, text_files_base_path, additional_criteria
+        )
+
+        if not additional_criteria:
+            result = self._profile_from_links(materials)
+            if result is not None:
+                return result
+
+        cache_key = self._response_cache_key(prompt, self.system_message, SOCIAL_CHAT_OPTIONS)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            messages = [{"role": "user", "content": prompt}]
+
+            response_text = await self._achat_with_retry(
+                messages, system_message=self.system_message, client=client, options=SOCIAL_CHAT_OPTIONS
+            )
+
+            result = await asyncio.to_thread(
+                self.parse_llm_response, response_text, full_filename, messages
+            )
+            self.response_cache.set(cache_key, result)
+            return result
+
+        except ValueError as e:
+            raise RuntimeError(f"Failed to parse JSON response: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"Error analyzing social presence: {str(e)}")
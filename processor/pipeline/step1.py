@@ -8,11 +8,12 @@ extracting information and generating profiles using Ollama.
 
 import os
 import sys
-import json
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, Union
 from dotenv import load_dotenv
 
 # Ensure project root is on sys.path so `processor` package can be imported
@@ -24,8 +25,12 @@ if str(project_root) not in sys.path:
 from processor.utils.process_application import (
     ApplicationFileProcessor,
     DoclingTextExtractor,
-    AttachmentClassifier
+    AttachmentClassifier,
+    get_docling_device
 )
+from docling.datamodel.accelerator_options import AcceleratorDevice
+
+from processor.utils import json_utils
 
 # Import logging utilities
 from processor.utils.logging_utils import execution_logger, log_exception, log_summary
@@ -37,6 +42,18 @@ from processor.utils.processing_pool import ProcessingPool
 load_dotenv()
 
 
+def _read_criteria_file(criteria_file: Path) -> Optional[str]:
+    """Read and strip a criteria file, or return None if it is missing or unreadable."""
+    try:
+        with open(criteria_file, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Could not read {criteria_file.name}: {e}")
+        return None
+
+
 def load_personal_criteria(scholarship_folder: str) -> Optional[str]:
     """
     Load personal criteria from input/personal_criteria.txt in the scholarship folder.
@@ -47,17 +64,7 @@ def load_personal_criteria(scholarship_folder: str) -> Optional[str]:
     Returns:
         Criteria text as string, or None if file doesn't exist
     """
-    scholarship_path = Path(scholarship_folder)
-    criteria_file = scholarship_path / "input" / "personal_criteria.txt"
-    
-    if criteria_file.exists():
-        try:
-            with open(criteria_file, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except Exception as e:
-            print(f"Warning: Could not read personal_criteria.txt: {e}")
-            return None
-    return None
+    return _read_criteria_file(Path(scholarship_folder) / "input" / "personal_criteria.txt")
 
 
 def load_recommendation_criteria(scholarship_folder: str) -> Optional[str]:
@@ -70,17 +77,7 @@ def load_recommendation_criteria(scholarship_folder: str) -> Optional[str]:
     Returns:
         Criteria text as string, or None if file doesn't exist
     """
-    scholarship_path = Path(scholarship_folder)
-    criteria_file = scholarship_path / "input" / "recommendation_criteria.txt"
-    
-    if criteria_file.exists():
-        try:
-            with open(criteria_file, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except Exception as e:
-            print(f"Warning: Could not read recommendation_criteria.txt: {e}")
-            return None
-    return None
+    return _read_criteria_file(Path(scholarship_folder) / "input" / "recommendation_criteria.txt")
 
 
 def load_application_criteria(scholarship_folder: str) -> Optional[str]:
@@ -93,17 +90,7 @@ def load_application_criteria(scholarship_folder: str) -> Optional[str]:
     Returns:
         Criteria text as string, or None if file doesn't exist
     """
-    scholarship_path = Path(scholarship_folder)
-    criteria_file = scholarship_path / "input" / "application_criteria.txt"
-    
-    if criteria_file.exists():
-        try:
-            with open(criteria_file, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except Exception as e:
-            print(f"Warning: Could not read application_criteria.txt: {e}")
-            return None
-    return None
+    return _read_criteria_file(Path(scholarship_folder) / "input" / "application_criteria.txt")
 
 
 def process_single_application(
@@ -111,7 +98,9 @@ def process_single_application(
     model_name: str,
     output_dir: Optional[str] = None,
     scholarship_folder_name: Optional[str] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    extractor: Optional[DoclingTextExtractor] = None,
+    attachment_threads: int = 1
 ) -> dict:
     """
     Process a single application folder.
@@ -122,6 +111,9 @@ def process_single_application(
         output_dir: Base output directory for JSON files
         scholarship_folder_name: Name of the scholarship folder to append to output path
         verbose: Whether to print progress messages
+        extractor: Optional DoclingTextExtractor to reuse across applications
+            (default: a new one for this application)
+        attachment_threads: Number of attachments to extract text from concurrently
         
     Returns:
         Dictionary with processing result including success status and output file path
@@ -150,7 +142,7 @@ def process_single_application(
         # Step 2: Get application form
         if verbose:
             print("\n2. Identifying application form...")
-        app_form_path = processor.get_application_form()
+        app_form_path, attachments = processor.partition()
         if not app_form_path:
             error_msg = f"ERROR: No application form found in {folder_path}"
             if verbose:
@@ -161,17 +153,6 @@ def process_single_application(
                 "error": error_msg
             }
         
-        # Check if application form is empty or zero bytes
-        if app_form_path.stat().st_size == 0:
-            error_msg = f"ERROR: Application form is empty (zero bytes): {app_form_path.name}"
-            if verbose:
-                print(f"   {error_msg}")
-            return {
-                "success": False,
-                "folder": application_folder,
-                "error": error_msg
-            }
-        
         if verbose:
             print(f"   Application form: {app_form_path.name}")
         
@@ -179,9 +160,7 @@ def process_single_application(
         if verbose:
             print("\n3. Extracting text from application form using docling...")
         try:
-            # Note: 'extractor' is created once per function call (reused for all files in this folder)
-            # to avoid expensive DocumentConverter re-initialization
-            if 'extractor' not in locals():
+            if extractor is None:
                 extractor = DoclingTextExtractor()
             extracted_text = extractor.extract_text(app_form_path)
             if verbose:
@@ -200,7 +179,6 @@ def process_single_application(
         # Step 4: Process attachments
         if verbose:
             print("\n4. Processing attachments...")
-        attachments = processor.get_attachments()
         # Only process the first four attachments:
         #  - 1 and 2: recommendation letters
         #  - 3: resume
@@ -221,44 +199,45 @@ def process_single_application(
             output_path = base_output_dir / application_folder
         output_path.mkdir(parents=True, exist_ok=True)
         
+        # Extract all attachments up front (concurrently if requested); classification
+        # below still runs in attachment order. Zero-byte files were already skipped
+        # by list_files during the folder scan.
+        # The text goes straight to {stem}.txt (only when not blank); only its length and
+        # a snippet for classification are kept.
+        extracted = _extract_attachments(extractor, attachments, output_path, attachment_threads)
+        
         for i, attachment_path in enumerate(attachments, 1):
-            # Skip empty or zero-byte files
-            if attachment_path.stat().st_size == 0:
-                if verbose:
-                    print(f"   Skipping empty file (zero bytes): {attachment_path.name}")
-                continue
-            
             if verbose:
                 print(f"   Processing attachment {i}/{len(attachments)}: {attachment_path.name}")
             
-            # Extract text from attachment
-            attachment_text = ""
+            text_snippet = ""
+            text_length = 0
             text_file_path = None
             try:
-                attachment_text = extractor.extract_text(attachment_path)
+                outcome = extracted[attachment_path]
+                if isinstance(outcome, Exception):
+                    raise outcome
+                text_length, text_snippet = outcome
                 if verbose:
-                    print(f"      Extracted {len(attachment_text)} characters")
+                    print(f"      Extracted {text_length} characters")
                 
-                # Save extracted text to .txt file if text was extracted
-                if attachment_text.strip():
-                    # Create text filename based on original filename
-                    text_filename = attachment_path.stem + ".txt"
-                    text_file_path = output_path / text_filename
-                    with open(text_file_path, 'w', encoding='utf-8') as f:
-                        f.write(attachment_text)
+                if text_snippet.strip():
+                    text_file_path = output_path / (attachment_path.stem + ".txt")
                     if verbose:
                         print(f"      Saved text to: {text_file_path.name}")
                 
             except Exception as e:
                 if verbose:
                     print(f"      Warning: Could not extract text: {str(e)}")
-                attachment_text = ""
+                text_snippet = ""
+                text_length = 0
             
             # Classify attachment
             try:
                 classification = classifier.classify_attachment(
                     attachment_path, 
-                    attachment_text, 
+                    text_snippet, 
+                    text_length,
                     attachment_path.name
                 )
                 # Add text file path if text was saved
@@ -276,9 +255,9 @@ def process_single_application(
                     "confidence": "low",
                     "reasoning": f"Classification error: {str(e)}",
                     "file_extension": attachment_path.suffix.lower(),
-                    "has_text": len(attachment_text) > 0,
+                    "has_text": text_length > 0,
                     "is_image": attachment_path.suffix.lower() in ['.png', '.jpg', '.jpeg'],
-                    "text_length": len(attachment_text)
+                    "text_length": text_length
                 }
                 if text_file_path:
                     error_classification['extracted_text_file'] = text_file_path.name
@@ -290,8 +269,7 @@ def process_single_application(
         
         # Save application form extracted text
         application_form_text_file = output_path / "application_form_text.txt"
-        with open(application_form_text_file, 'w', encoding='utf-8') as f:
-            f.write(extracted_text)
+        application_form_text_file.write_bytes(extracted_text.encode('utf-8'))
         
         # Build lists of processed vs ignored files for transparency in Step 2+
         # All files discovered in the application folder (non-empty, matching pattern)
@@ -319,8 +297,7 @@ def process_single_application(
             "ignored_files": ignored_files,
         }
         application_form_data_file = output_path / "application_form_data.json"
-        with open(application_form_data_file, 'w') as f:
-            json.dump(application_form_data, f, indent=2)
+        application_form_data_file.write_bytes(json_utils.dumps_bytes(application_form_data, indent=True))
         
         # Save attachments separately
         attachments_file = output_path / "attachments.json"
@@ -329,8 +306,7 @@ def process_single_application(
             "total_attachments": len(classified_attachments),
             "attachments": classified_attachments
         }
-        with open(attachments_file, 'w') as f:
-            json.dump(attachments_data, f, indent=2)
+        attachments_file.write_bytes(json_utils.dumps_bytes(attachments_data, indent=True))
         
         if verbose:
             print(f"   Saved application form text to: {application_form_text_file.name}")
@@ -357,26 +333,121 @@ def process_single_application(
         }
 
 
+def _extract_attachments(
+    extractor: DoclingTextExtractor,
+    attachment_paths: List[Path],
+    output_path: Path,
+    threads: int = 1
+) -> Dict[Path, Union[Tuple[int, str], Exception]]:
+    """
+    Extract text from attachments into {output_path}/{stem}.txt, up to `threads` at a time.
+
+    Sequential by default. With threads > 1 the attachments are converted at the
+    same time on the process's shared DocumentConverter, which docling does not
+    document as thread-safe, so this is opt-in (--attachment-threads).
+    Only the text length and a snippet for classification are kept in memory.
+
+    Args:
+        extractor: DoclingTextExtractor to use for every attachment
+        attachment_paths: Attachments to extract
+        output_path: Directory for the extracted .txt files
+        threads: Maximum number of concurrent extractions (1 = sequential)
+
+    Returns:
+        Dictionary mapping each path to (text length, snippet), or to the exception raised
+    """
+    def extract(path: Path) -> Union[Tuple[int, str], Exception]:
+        try:
+            return extractor.extract_text_to_file(
+                path, output_path / (path.stem + ".txt"), AttachmentClassifier.SNIPPET_CHARS
+            )
+        except Exception as e:
+            return e
+
+    threads = max(1, min(threads, len(attachment_paths)))
+    if threads == 1:
+        return {path: extract(path) for path in attachment_paths}
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return dict(zip(attachment_paths, executor.map(extract, attachment_paths)))
+
+
+@lru_cache(maxsize=1)
+def _get_worker_extractor() -> DoclingTextExtractor:
+    """The DoclingTextExtractor shared by all applications handled in this process."""
+    return DoclingTextExtractor()
+
+
+def _can_share_models_by_fork() -> bool:
+    """
+    Whether docling models loaded in the main process can be inherited by forked workers.
+
+    Opt-in (DOCLING_FORK_WORKERS=true) and Linux-only: forking a process that has
+    torch loaded can deadlock in OpenMP and is unsafe on macOS. Also requires CPU
+    inference, since a CUDA/MPS context does not survive fork, so GPU runs keep
+    loading the models in each worker.
+    """
+    if os.getenv("DOCLING_FORK_WORKERS", "false").lower() not in ("1", "true", "yes"):
+        return False
+    if not sys.platform.startswith("linux"):
+        return False
+    device = get_docling_device()
+    if device == AcceleratorDevice.CPU:
+        return True
+    if device != AcceleratorDevice.AUTO:
+        return False
+    try:
+        import torch
+    except ImportError:
+        return True
+    return not (torch.cuda.is_available() or torch.backends.mps.is_available())
+
+
+# Settings shared by every application in a run, set once per worker by _init_worker
+_WORKER_MODEL_NAME: Optional[str] = None
+_WORKER_ATTACHMENT_THREADS: int = 1
+
+
+def _init_worker(model_name: str, attachment_threads: int):
+    """
+    Pool initializer: store the run settings and create the worker's extractor.
+
+    Args:
+        model_name: Ollama model name to use
+        attachment_threads: Number of attachments to extract concurrently
+    """
+    global _WORKER_MODEL_NAME, _WORKER_ATTACHMENT_THREADS
+    _WORKER_MODEL_NAME = model_name
+    _WORKER_ATTACHMENT_THREADS = attachment_threads
+    try:
+        _get_worker_extractor().warm_up()
+    except Exception as e:
+        # The first conversion will load the models (and report the error) instead
+        print(f"Warning: Could not preload docling models: {str(e)}")
+
+
 def _worker_process_application(args_tuple) -> dict:
     """
     Worker function for multiprocessing.
 
     Must be at module level (not nested) to be picklable.
     Accepts a tuple of arguments since multiprocessing map can only pass one argument per worker.
+    Settings common to all applications come from _init_worker.
 
     Args:
-        args_tuple: (folder_path, model_name, output_dir, scholarship_folder_name, verbose)
+        args_tuple: (folder_path, output_dir, scholarship_folder_name)
 
     Returns:
         Result dictionary from process_single_application
     """
-    folder_path, model_name, output_dir, scholarship_folder_name, verbose = args_tuple
+    folder_path, output_dir, scholarship_folder_name = args_tuple
     return process_single_application(
         folder_path=folder_path,
-        model_name=model_name,
+        model_name=_WORKER_MODEL_NAME,
         output_dir=output_dir,
         scholarship_folder_name=scholarship_folder_name,
-        verbose=False  # Disable verbose in worker to avoid log spam
+        verbose=False,  # Disable verbose in worker to avoid log spam
+        extractor=_get_worker_extractor(),
+        attachment_threads=_WORKER_ATTACHMENT_THREADS
     )
 
 
@@ -459,6 +530,13 @@ Examples:
         help="Number of worker processes for parallel processing (default: 0 = sequential). Set to > 0 to enable multiprocessing. Text extraction is CPU-bound so use up to CPU count."
     )
 
+    parser.add_argument(
+        "--attachment-threads",
+        type=int,
+        default=1,
+        help="Number of attachments per application to extract text from concurrently (default: 1 = sequential). Applies within each worker process; threads share one docling converter."
+    )
+
     args = parser.parse_args()
     
     # Start timing for total processing time
@@ -526,20 +604,20 @@ Examples:
         # Process a specific folder
         application_folders = [args.application_folder]
     else:
-        # Get all subdirectories (application folders) from Applications subfolder
-        application_folders = [
-            item.name for item in applications_path.iterdir()
-            if item.is_dir() and not item.name.startswith('.')
-        ]
+        # Get all subdirectories (application folders) from Applications subfolder.
+        # scandir entries know their type from the directory read, so no stat per folder.
+        with os.scandir(applications_path) as entries:
+            application_folders = [
+                entry.name for entry in entries
+                if not entry.name.startswith('.') and entry.is_dir()
+            ]
         # Sort folders: numeric folders first (sorted numerically), then non-numeric (sorted alphabetically)
-        def sort_key(folder_name):
-            """Sort key: numeric folders sorted as integers, non-numeric sorted alphabetically."""
-            if folder_name.isdigit():
-                return (0, int(folder_name))  # Numeric folders first, sorted by integer value
-            else:
-                return (1, folder_name)  # Non-numeric folders after, sorted alphabetically
-        
-        application_folders.sort(key=sort_key)
+        numeric_folders, named_folders = [], []
+        for folder_name in application_folders:
+            (numeric_folders if folder_name.isdigit() else named_folders).append(folder_name)
+        numeric_folders.sort(key=int)
+        named_folders.sort()
+        application_folders = numeric_folders + named_folders
         
         # Apply limit (default is 0 = all, unless --limit N is specified)
         if args.all:
@@ -579,6 +657,15 @@ Examples:
             print(f"Output directory: {output_dir}/{{application_folder}}/application_profile.json")
         print("=" * 60)
     
+    # With several concurrent conversions (workers x attachment threads), split the CPU
+    # threads between them unless configured explicitly
+    concurrent_conversions = max(1, args.workers) * max(1, args.attachment_threads)
+    if concurrent_conversions > 1 and not os.getenv("DOCLING_NUM_THREADS"):
+        os.environ["DOCLING_NUM_THREADS"] = str(max(1, (os.cpu_count() or 1) // concurrent_conversions))
+    if verbose:
+        print(f"Docling device: {get_docling_device().value} "
+              f"({os.getenv('DOCLING_NUM_THREADS', '4')} CPU threads per process)")
+
     # Process each application folder
     if verbose and args.workers > 0:
         print(f"\nUsing {args.workers} worker processes for parallel processing")
@@ -588,27 +675,59 @@ Examples:
     worker_args = [
         (
             str(applications_path / app_folder),
-            model_name,
             output_dir,
-            scholarship_folder_name,
-            verbose
+            scholarship_folder_name
         )
         for app_folder in application_folders
     ]
 
-    # Process using pool
-    with ProcessingPool(num_workers=args.workers, use_threading=False, verbose=verbose) as pool:
+    # Each worker loads docling once in _init_worker. With DOCLING_FORK_WORKERS on Linux/CPU,
+    # only load the model weights here (no conversion runs in this process, so no inference
+    # thread pools exist yet) and fork the pool straight after, so the workers share the
+    # parent's copy (copy-on-write) instead of each holding their own.
+    start_method = None
+    if args.workers > 0 and _can_share_models_by_fork():
+        start_method = "fork"
+        if verbose:
+            print("Loading docling models before starting workers (shared via fork)")
+        try:
+            _get_worker_extractor().warm_up()
+        except Exception as e:
+            print(f"Warning: Could not preload docling models: {str(e)}")
+
+    with ProcessingPool(
+        num_workers=args.workers,
+        use_threading=False,
+        verbose=verbose,
+        initializer=_init_worker,
+        initargs=(model_name, args.attachment_threads),
+        start_method=start_method
+    ) as pool:
         if verbose and len(application_folders) > 1:
             print(f"Processing {len(application_folders)} applications...")
-        results = pool.map_unordered(
-            _worker_process_application,
-            worker_args,
-            show_progress=verbose
-        )
-
-    # Count results
-    successful = sum(1 for r in results if r.get("success", False))
-    failed = len(results) - successful
+        # Stream each result to run_results.ndjson as it completes and keep only counters
+        # (and failures) in memory; an interrupted run still leaves a partial record
+        run_output_dir = Path(output_dir) / scholarship_folder_name if scholarship_folder_name else Path(output_dir)
+        run_output_dir.mkdir(parents=True, exist_ok=True)
+        results_file = run_output_dir / "run_results.ndjson"
+        total = 0
+        successful = 0
+        failed_results = []
+        with open(results_file, 'wb') as f:
+            for result in pool.imap_unordered(
+                _worker_process_application,
+                worker_args,
+                show_progress=verbose
+            ):
+                f.write(json_utils.dumps_bytes(result, default=str) + b"\n")
+                f.flush()
+                total += 1
+                if result.get("success", False):
+                    successful += 1
+                else:
+                    failed_results.append(result)
+
+    failed = len(failed_results)
     
     # Calculate total processing time
     total_elapsed_time = time.time() - main_start_time
@@ -617,34 +736,34 @@ Examples:
     print("\n" + "=" * 60)
     print("Processing Summary")
     print("=" * 60)
-    print(f"Total processed: {len(results)}")
+    print(f"Total processed: {total}")
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
     print(f"Total processing time: {total_elapsed_time:.2f}s ({total_elapsed_time/60:.2f} minutes)")
-    if len(results) > 0:
-        avg_time = total_elapsed_time / len(results)
+    if total > 0:
+        avg_time = total_elapsed_time / total
         print(f"Average time per application: {avg_time:.2f}s ({avg_time/60:.2f} minutes)")
     
     if failed > 0:
         print("\nFailed applications:")
-        for result in results:
-            if not result["success"]:
-                print(f"  - {result['folder']}: {result.get('error', 'Unknown error')}")
+        for result in failed_results:
+            print(f"  - {result.get('folder', result.get('item'))}: {result.get('error', 'Unknown error')}")
     
+    print(f"Per-application results: {results_file}")
     print("=" * 60)
     
     # Log summary
     summary = {
-        "total_processed": len(results),
+        "total_processed": total,
         "successful": successful,
         "failed": failed,
         "total_processing_time_seconds": round(total_elapsed_time, 2),
         "total_processing_time_minutes": round(total_elapsed_time / 60, 2)
     }
-    if len(results) > 0:
-        summary["average_time_per_application_seconds"] = round(total_elapsed_time / len(results), 2)
+    if total > 0:
+        summary["average_time_per_application_seconds"] = round(total_elapsed_time / total, 2)
     if failed > 0:
-        failed_folders = [r['folder'] for r in results if not r["success"]]
+        failed_folders = [r.get('folder', r.get('item')) for r in failed_results]
         summary["failed_folders"] = failed_folders
     
     log_summary("step1.py", summary)
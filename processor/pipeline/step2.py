@@ -24,13 +24,15 @@ And generates:
 """
 
 import os
+import re
 import sys
-import json
 import argparse
+import threading
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from dotenv import load_dotenv
+from typing import Optional, List, Dict, Any, Tuple
 
 # Add project root to Python path to allow imports
 project_root = Path(__file__).parent.parent.parent
@@ -48,203 +50,182 @@ from processor.utils.logging_utils import execution_logger, log_exception, log_s
 
 # Import multiprocessing support
 from processor.utils.processing_pool import ProcessingPool
+from processor.utils import json_utils
+from processor.utils.env import load_env
 
-# Load environment variables from .env file
-load_dotenv()
 
+# Filename keywords marking an 'unknown' attachment as academic (transcripts, grade summaries, etc.)
+_ACADEMIC_KEYWORDS_RE = re.compile(
+    r'transcript|grade|gpa|academic|diploma|degree|certificate|report card'
+)
 
-def load_personal_criteria_from_output(output_dir: Path) -> Optional[str]:
+
+@lru_cache(maxsize=1)
+def _get_input_data_dir() -> str:
+    """INPUT_DATA_DIR (default data/2026), read once per process after loading .env."""
+    load_env()
+    return os.getenv("INPUT_DATA_DIR", "data/2026")
+
+
+def read_criteria_text(criteria_file: Path) -> str:
     """
-    Try to find personal_criteria.txt by looking for input folder relative to output directory.
-    Assumes output is at: {scholarship}/output/ and input is at: {scholarship}/input/
-    
-    Args:
-        output_dir: Path to the output directory
-        
-    Returns:
-        Criteria text as string, or None if file doesn't exist
+    Read a criteria file, stripped of surrounding whitespace.
+
+    Contents are cached by resolved path, so each file is read from disk once per run
+    however many scholarships or applications use it. Read errors are not cached.
     """
-    # Try to find the scholarship folder by going up from output directory
-    # Common structure: scholarship_folder/output/ or scholarship_folder/applications/output/
-    current = output_dir.resolve()
-    
-    # Look for input folder at various levels
-    possible_paths = [
-        current.parent / "input" / "personal_criteria.txt",  # output/../input/
-        current.parent.parent / "input" / "personal_criteria.txt",  # output/../../input/
-        current.parent.parent.parent / "input" / "personal_criteria.txt",  # output/../../../input/
-    ]
-    
-    for criteria_file in possible_paths:
-        if criteria_file.exists():
-            try:
-                with open(criteria_file, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read personal_criteria.txt from {criteria_file}: {e}")
-                return None
-    
-    return None
+    return _read_criteria_text_cached(str(Path(criteria_file).resolve()))
+
 
+@lru_cache(maxsize=None)
+def _read_criteria_text_cached(resolved_path: str) -> str:
+    return Path(resolved_path).read_text(encoding='utf-8').strip()
 
-def load_recommendation_criteria_from_output(output_dir: Path) -> Optional[str]:
+
+@lru_cache(maxsize=None)
+def _find_input_dirs(output_dir: Path) -> Tuple[Path, ...]:
     """
-    Try to find recommendation_criteria.txt by looking for input folder relative to output directory.
-    Assumes output is at: {scholarship}/output/ and input is at: {scholarship}/input/
-    
-    Args:
-        output_dir: Path to the output directory
-        
-    Returns:
-        Criteria text as string, or None if file doesn't exist
+    Existing input/ folders one to three levels above the output directory (old structure),
+    nearest first. Looked up once per output directory.
     """
-    # Try to find the scholarship folder by going up from output directory
-    # Common structure: scholarship_folder/output/ or scholarship_folder/applications/output/
-    current = output_dir.resolve()
-    
-    # Look for input folder at various levels
-    possible_paths = [
-        current.parent / "input" / "recommendation_criteria.txt",  # output/../input/
-        current.parent.parent / "input" / "recommendation_criteria.txt",  # output/../../input/
-        current.parent.parent.parent / "input" / "recommendation_criteria.txt",  # output/../../../input/
-    ]
-    
-    for criteria_file in possible_paths:
-        if criteria_file.exists():
-            try:
-                with open(criteria_file, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read recommendation_criteria.txt from {criteria_file}: {e}")
-                return None
-    
-    return None
+    input_dirs = []
+    folder = os.path.realpath(output_dir)
+    for _ in range(3):
+        folder = os.path.dirname(folder)
+        input_dir = os.path.join(folder, "input")
+        if os.path.isdir(input_dir):
+            input_dirs.append(Path(input_dir))
+    return tuple(input_dirs)
 
 
-def load_academic_criteria_from_output(output_dir: Path, scholarship_folder_name: Optional[str] = None) -> Optional[str]:
+# Criteria files in an input/ folder, by the profile they apply to
+CRITERIA_FILES = {
+    "personal": "personal_criteria.txt",
+    "recommendation": "recommendation_criteria.txt",
+    "application": "application_criteria.txt",
+    "academic": "academic_criteria.txt",
+    "social": "social_criteria.txt",
+}
+
+
+def read_criteria_dir(input_dir: Path, criteria: Dict[str, Optional[str]], verbose: bool = False) -> None:
     """
-    Try to find academic_criteria.txt by looking for input folder.
-    New structure: {OUTPUT_DATA_DIR}/{scholarship_folder_name}/{application_folder}/
-                   {INPUT_DATA_DIR}/{scholarship_folder_name}/input/
-    
+    Read the criteria files present in an input/ folder into criteria.
+
+    The folder is listed once; keys of CRITERIA_FILES that already have a value
+    in criteria are left alone. Unreadable files are reported and skipped.
+
     Args:
-        output_dir: Path to the output directory (base OUTPUT_DATA_DIR)
-        scholarship_folder_name: Name of the scholarship folder (e.g., 'Delaney_Wings')
+        input_dir: input/ folder to read from
+        criteria: Mapping from CRITERIA_FILES keys to criteria text, updated in place
+        verbose: Print each file that is loaded
     """
-    if scholarship_folder_name:
-        # Use INPUT_DATA_DIR to construct path
-        input_data_dir = os.getenv("INPUT_DATA_DIR", "data/2026")
-        criteria_path = Path(input_data_dir) / scholarship_folder_name / "input" / "academic_criteria.txt"
-        if criteria_path.exists():
-            try:
-                with open(criteria_path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read academic_criteria.txt from {criteria_path}: {e}")
-                return None
-    
-    # Fallback: Try to find by going up from output directory (old structure)
-    current = output_dir.resolve()
-    possible_paths = [
-        current.parent / "input" / "academic_criteria.txt",
-        current.parent.parent / "input" / "academic_criteria.txt",
-        current.parent.parent.parent / "input" / "academic_criteria.txt",
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read academic_criteria.txt from {path}: {e}")
-                continue
-    
-    return None
+    wanted = {filename: key for key, filename in CRITERIA_FILES.items() if criteria.get(key) is None}
+    try:
+        entries = [entry for entry in os.scandir(input_dir) if entry.name in wanted and entry.is_file()]
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            criteria[wanted[entry.name]] = read_criteria_text(Path(entry.path))
+            if verbose:
+                print(f"Loaded {entry.name} from: {entry.path}")
+        except Exception as e:
+            print(f"Warning: Could not read {entry.name} from {entry.path}: {e}")
 
 
-def load_social_criteria_from_output(output_dir: Path, scholarship_folder_name: Optional[str] = None) -> Optional[str]:
+def load_all_criteria_from_output(
+    output_dir: Path,
+    scholarship_folder_name: Optional[str] = None
+) -> Dict[str, Optional[str]]:
     """
-    Try to find social_criteria.txt by looking for input folder.
-    New structure: {OUTPUT_DATA_DIR}/{scholarship_folder_name}/{application_folder}/
-                   {INPUT_DATA_DIR}/{scholarship_folder_name}/input/
-    
+    Load every criteria file for a scholarship.
+
+    New structure: {INPUT_DATA_DIR}/{scholarship_folder_name}/input/
+    Old structure (fallback for files not found there): the nearest input/ folder
+    one to three levels above the output directory that has the file.
+
     Args:
-        output_dir: Path to the output directory (base OUTPUT_DATA_DIR)
+        output_dir: Path to the output directory
         scholarship_folder_name: Name of the scholarship folder (e.g., 'Delaney_Wings')
+
+    Returns:
+        Dictionary mapping each CRITERIA_FILES key to its text, or None if no file was found
     """
+    criteria: Dict[str, Optional[str]] = dict.fromkeys(CRITERIA_FILES)
     if scholarship_folder_name:
-        # Use INPUT_DATA_DIR to construct path
-        input_data_dir = os.getenv("INPUT_DATA_DIR", "data/2026")
-        criteria_path = Path(input_data_dir) / scholarship_folder_name / "input" / "social_criteria.txt"
-        if criteria_path.exists():
-            try:
-                with open(criteria_path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read social_criteria.txt from {criteria_path}: {e}")
-                return None
-    
-    # Fallback: Try to find by going up from output directory (old structure)
-    current = output_dir.resolve()
-    possible_paths = [
-        current.parent / "input" / "social_criteria.txt",
-        current.parent.parent / "input" / "social_criteria.txt",
-        current.parent.parent.parent / "input" / "social_criteria.txt",
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read social_criteria.txt from {path}: {e}")
-                continue
-    
-    return None
+        read_criteria_dir(Path(_get_input_data_dir()) / scholarship_folder_name / "input", criteria)
+    for input_dir in _find_input_dirs(Path(output_dir)):
+        if all(text is not None for text in criteria.values()):
+            break
+        read_criteria_dir(input_dir, criteria)
+    return criteria
+
+
+def load_personal_criteria_from_output(output_dir: Path, scholarship_folder_name: Optional[str] = None) -> Optional[str]:
+    """Load personal_criteria.txt for a scholarship (see load_all_criteria_from_output)."""
+    return load_all_criteria_from_output(output_dir, scholarship_folder_name)["personal"]
+
+
+def load_recommendation_criteria_from_output(output_dir: Path, scholarship_folder_name: Optional[str] = None) -> Optional[str]:
+    """Load recommendation_criteria.txt for a scholarship (see load_all_criteria_from_output)."""
+    return load_all_criteria_from_output(output_dir, scholarship_folder_name)["recommendation"]
+
+
+def load_academic_criteria_from_output(output_dir: Path, scholarship_folder_name: Optional[str] = None) -> Optional[str]:
+    """Load academic_criteria.txt for a scholarship (see load_all_criteria_from_output)."""
+    return load_all_criteria_from_output(output_dir, scholarship_folder_name)["academic"]
+
+
+def load_social_criteria_from_output(output_dir: Path, scholarship_folder_name: Optional[str] = None) -> Optional[str]:
+    """Load social_criteria.txt for a scholarship (see load_all_criteria_from_output)."""
+    return load_all_criteria_from_output(output_dir, scholarship_folder_name)["social"]
 
 
 def load_application_criteria_from_output(output_dir: Path, scholarship_folder_name: Optional[str] = None) -> Optional[str]:
+    """Load application_criteria.txt for a scholarship (see load_all_criteria_from_output)."""
+    return load_all_criteria_from_output(output_dir, scholarship_folder_name)["application"]
+
+
+def _coerce_score(value: Any) -> float:
     """
-    Try to find application_criteria.txt by looking for input folder.
-    New structure: {OUTPUT_DATA_DIR}/{scholarship_folder_name}/{application_folder}/
-                   {INPUT_DATA_DIR}/{scholarship_folder_name}/input/
-    
-    Args:
-        output_dir: Path to the output directory (base OUTPUT_DATA_DIR)
-        scholarship_folder_name: Name of the scholarship folder (e.g., 'Delaney_Wings')
+    Convert a profile score to a number.
+
+    Numeric strings (e.g. "85") are parsed; anything else that is not a number
+    ('N/A', None, malformed text) counts as 0.
     """
-    if scholarship_folder_name:
-        # Use INPUT_DATA_DIR to construct path
-        input_data_dir = os.getenv("INPUT_DATA_DIR", "data/2026")
-        criteria_path = Path(input_data_dir) / scholarship_folder_name / "input" / "application_criteria.txt"
-        if criteria_path.exists():
-            try:
-                with open(criteria_path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read application_criteria.txt from {criteria_path}: {e}")
-                return None
-    
-    # Fallback: Try to find by going up from output directory (old structure)
-    current = output_dir.resolve()
-    possible_paths = [
-        current.parent / "input" / "application_criteria.txt",
-        current.parent.parent / "input" / "application_criteria.txt",
-        current.parent.parent.parent / "input" / "application_criteria.txt",
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            except Exception as e:
-                print(f"Warning: Could not read application_criteria.txt from {path}: {e}")
-                continue
-    
-    return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return 0
+    return 0
+
+
+# Agents by (class, model, PID); see _get_agent
+_AGENTS: Dict[Tuple[type, str, int], Any] = {}
+_AGENTS_LOCK = threading.Lock()
+
+
+def _get_agent(agent_class: type, model_name: str) -> Any:
+    """
+    Return this process's agent of agent_class for model_name, creating it on first use.
+
+    Agents hold no per-application state, so one instance is reused for every
+    application a process handles. Keyed by PID so forked pool workers build their
+    own agents instead of reusing clients inherited from the parent. Creation is
+    locked so concurrent threads do not each build (and validate) their own copy.
+    """
+    key = (agent_class, model_name, os.getpid())
+    agent = _AGENTS.get(key)
+    if agent is None:
+        with _AGENTS_LOCK:
+            agent = _AGENTS.get(key)
+            if agent is None:
+                agent = _AGENTS[key] = agent_class(model_name=model_name)
+    return agent
 
 
 def process_single_application_step2(
@@ -325,8 +306,7 @@ def process_single_application_step2(
         
         if has_new_format:
             # New format: load from separate files
-            with open(application_form_data_file, 'r', encoding='utf-8') as f:
-                application_form_data = json.load(f)
+            application_form_data = json_utils.loads(application_form_data_file.read_bytes())
             
             with open(application_form_text_file, 'r', encoding='utf-8') as f:
                 extracted_text = f.read()
@@ -336,13 +316,12 @@ def process_single_application_step2(
                 print(f"   Loaded new format: application_form_data.json and application_form_text.txt")
         else:
             # Old format: extract from application_profile.json
-            with open(old_application_profile_file, 'r', encoding='utf-8') as f:
-                old_profile = json.load(f)
+            old_profile = json_utils.loads(old_application_profile_file.read_bytes())
             
             # Extract text from old profile (we'll need to reconstruct it)
             # For old format, we'll use the profile summary and try to extract text
             # This is a fallback - ideally users should re-run step1
-            extracted_text = old_profile.get('summary', '') + "\n\n" + json.dumps(old_profile.get('profile', {}), indent=2)
+            extracted_text = old_profile.get('summary', '') + "\n\n" + json_utils.dumps(old_profile.get('profile', {}), indent=True)
             
             # Try to get file list from old profile if available
             file_list = []
@@ -352,8 +331,7 @@ def process_single_application_step2(
             if verbose:
                 print(f"   Loaded old format: application_profile.json (consider re-running step1 for full functionality)")
         
-        with open(attachments_file, 'r', encoding='utf-8') as f:
-            attachments_data = json.load(f)
+        attachments_data = json_utils.loads(attachments_file.read_bytes())
         
         classified_attachments = attachments_data.get('attachments', [])
         
@@ -372,7 +350,9 @@ def process_single_application_step2(
 
         try:
             agent_start = time.time()
-            application_agent = ApplicationAgent(model_name=model_name)
+            # Form extraction is schema-constrained, so a smaller model can be used for it
+            application_model = os.getenv("APPLICATION_AGENT_MODEL") or model_name
+            application_agent = _get_agent(ApplicationAgent, application_model)
             agent_init_time = time.time() - agent_start
             if verbose:
                 print(f"   [DEBUG] ApplicationAgent initialization: {agent_init_time:.2f}s")
@@ -387,20 +367,11 @@ def process_single_application_step2(
             if verbose:
                 print(f"   [DEBUG] analyze_application() call: {analyze_time:.2f}s")
 
-            # Save application profile
-            save_start = time.time()
-            with open(application_profile_file, 'w') as f:
-                json.dump(application_profile, f, indent=2)
-            save_time = time.time() - save_start
-            if verbose:
-                print(f"   [DEBUG] Saving application_profile.json: {save_time:.2f}s")
-
             step_elapsed = time.time() - step_start
             if verbose:
                 overall_score = application_profile.get('scores', {}).get('overall_score',
                     application_profile.get('score', {}).get('completeness_score', 'N/A'))  # Backward compatibility
                 print(f"   Application profile generated (overall score: {overall_score})")
-                print(f"   Saved to: {application_profile_file.name}")
                 print(f"   [TIMING] Step 2 (Application Profile): {step_elapsed:.2f}s")
         except Exception as e:
             error_msg = f"Warning: Failed to generate application profile: {str(e)}"
@@ -413,25 +384,73 @@ def process_single_application_step2(
                 "score": {}
             }
         
-        # Step 3: Generate Personal Profile
+        # Steps 3-6: the personal, recommendation, academic and social agents only depend on
+        # the application profile, so their (I/O-bound) LLM calls run concurrently. The
+        # profiles are saved afterwards, together with application_profile.json.
         step_start = time.time()
-        if verbose:
-            print("\n3. Generating Personal Profile...")
         
-        # Filter attachments by category
-        essays = [att for att in classified_attachments if att.get('category') == 'essay']
-        resume = next((att for att in classified_attachments if att.get('category') == 'resume'), None)
+        # Sort attachments by category in a single pass
+        essays = []
+        resume = None
+        recommendations = []
+        # Potential academic attachments (transcripts, grade summaries, etc.)
+        academic_attachments = []
+        for att in classified_attachments:
+            category = att.get('category')
+            if category == 'essay':
+                essays.append(att)
+            elif category == 'resume':
+                if resume is None:
+                    resume = att
+            elif category == 'recommendation':
+                recommendations.append(att)
+            # Include if it's classified as unknown and has academic keywords, or if explicitly academic
+            elif category == 'unknown':
+                if _ACADEMIC_KEYWORDS_RE.search(att.get('filename', '').lower()):
+                    academic_attachments.append(att)
+            # Also check if the category might be academic (for future expansion)
+            elif category == 'transcript' or category == 'academic':
+                academic_attachments.append(att)
         
         if verbose:
-            print(f"   Found {len(essays)} essay(s) and {'1 resume' if resume else 'no resume'}")
+            print("\n3-6. Generating Personal, Recommendation, Academic and Social Profiles (concurrently)...")
+            print(f"   Found {len(essays)} essay(s), {'1 resume' if resume else 'no resume'}, "
+                  f"{len(recommendations)} recommendation letter(s) and {len(academic_attachments)} academic document(s)")
         
-        # Only process if we have essays or resume
-        if essays or resume:
+        # Set when the personal or recommendation agent fails, so the academic and social
+        # agents skip their LLM calls if they have not started them yet
+        failed = threading.Event()
+        # Verbose output of each agent, printed as one block per agent instead of
+        # interleaving across the threads
+        agent_logs: Dict[str, List[str]] = {name: [] for name in ("personal", "recommendation", "academic", "social")}
+        
+        def print_agent_logs(*names: str):
+            for name in names:
+                for line in agent_logs[name]:
+                    print(line)
+        
+        def generate_personal_profile() -> Dict[str, Any]:
+            log = agent_logs['personal'].append
+            # Only process if we have essays or resume
+            if not (essays or resume):
+                if verbose:
+                    log("   No essays or resume found - creating empty personal profile")
+                return {
+                    "summary": "No essays or resume available for personal profile analysis",
+                    "profile_features": {},
+                    "scores": {
+                        "motivation_score": 0,
+                        "goals_clarity_score": 0,
+                        "character_service_leadership_score": 0,
+                        "overall_score": 0
+                    },
+                    "score_breakdown": {}
+                }
             agent_start = time.time()
-            personal_agent = PersonalAgent(model_name=model_name)
+            personal_agent = _get_agent(PersonalAgent, model_name)
             agent_init_time = time.time() - agent_start
             if verbose:
-                print(f"   [DEBUG] PersonalAgent initialization: {agent_init_time:.2f}s")
+                log(f"   [DEBUG] PersonalAgent initialization: {agent_init_time:.2f}s")
             
             analyze_start = time.time()
             personal_profile = personal_agent.analyze_personal_profile(
@@ -443,56 +462,33 @@ def process_single_application_step2(
             )
             analyze_time = time.time() - analyze_start
             if verbose:
-                print(f"   [DEBUG] analyze_personal_profile() call: {analyze_time:.2f}s")
+                log(f"   [DEBUG] analyze_personal_profile() call: {analyze_time:.2f}s")
                 overall_score = personal_profile.get('scores', {}).get('overall_score', 'N/A')
-                print(f"   Personal profile generated (overall score: {overall_score})")
-        else:
-            if verbose:
-                print("   No essays or resume found - creating empty personal profile")
-            personal_profile = {
-                "summary": "No essays or resume available for personal profile analysis",
-                "profile_features": {},
-                "scores": {
-                    "motivation_score": 0,
-                    "goals_clarity_score": 0,
-                    "character_service_leadership_score": 0,
-                    "overall_score": 0
-                },
-                "score_breakdown": {}
-            }
-        
-        # Save personal profile
-        save_start = time.time()
-        personal_profile_file = output_path / "personal_profile.json"
-        with open(personal_profile_file, 'w') as f:
-            json.dump(personal_profile, f, indent=2)
-        save_time = time.time() - save_start
-        if verbose:
-            print(f"\n   Personal profile saved to: {personal_profile_file}")
-            print(f"   [DEBUG] Saving personal_profile.json: {save_time:.2f}s")
-        
-        step_elapsed = time.time() - step_start
-        if verbose:
-            print(f"   [TIMING] Step 3 (Personal Profile): {step_elapsed:.2f}s")
-        
-        # Step 4: Generate Recommendation Profile
-        step_start = time.time()
-        if verbose:
-            print("\n4. Generating Recommendation Profile...")
-        
-        # Filter attachments by category for recommendations
-        recommendations = [att for att in classified_attachments if att.get('category') == 'recommendation']
-        
-        if verbose:
-            print(f"   Found {len(recommendations)} recommendation letter(s)")
+                log(f"   Personal profile generated (overall score: {overall_score})")
+            return personal_profile
         
-        # Only process if we have recommendations
-        if recommendations:
+        def generate_recommendation_profile() -> Dict[str, Any]:
+            log = agent_logs['recommendation'].append
+            # Only process if we have recommendations
+            if not recommendations:
+                if verbose:
+                    log("   No recommendation letters found - creating empty recommendation profile")
+                return {
+                    "summary": "No recommendation letters available for recommendation profile analysis",
+                    "profile_features": {},
+                    "scores": {
+                        "average_support_strength_score": 0,
+                        "consistency_of_support_score": 0,
+                        "depth_of_endorsement_score": 0,
+                        "overall_score": 0
+                    },
+                    "score_breakdown": {}
+                }
             agent_start = time.time()
-            recommendation_agent = RecommendationAgent(model_name=model_name)
+            recommendation_agent = _get_agent(RecommendationAgent, model_name)
             agent_init_time = time.time() - agent_start
             if verbose:
-                print(f"   [DEBUG] RecommendationAgent initialization: {agent_init_time:.2f}s")
+                log(f"   [DEBUG] RecommendationAgent initialization: {agent_init_time:.2f}s")
             
             analyze_start = time.time()
             recommendation_profile = recommendation_agent.analyze_recommendation_profile(
@@ -503,189 +499,132 @@ def process_single_application_step2(
             )
             analyze_time = time.time() - analyze_start
             if verbose:
-                print(f"   [DEBUG] analyze_recommendation_profile() call: {analyze_time:.2f}s")
+                log(f"   [DEBUG] analyze_recommendation_profile() call: {analyze_time:.2f}s")
                 overall_score = recommendation_profile.get('scores', {}).get('overall_score', 'N/A')
-                print(f"   Recommendation profile generated (overall score: {overall_score})")
-        else:
-            if verbose:
-                print("   No recommendation letters found - creating empty recommendation profile")
-            recommendation_profile = {
-                "summary": "No recommendation letters available for recommendation profile analysis",
-                "profile_features": {},
-                "scores": {
-                    "average_support_strength_score": 0,
-                    "consistency_of_support_score": 0,
-                    "depth_of_endorsement_score": 0,
-                    "overall_score": 0
-                },
-                "score_breakdown": {}
-            }
-        
-        # Save recommendation profile
-        save_start = time.time()
-        recommendation_profile_file = output_path / "recommendation_profile.json"
-        with open(recommendation_profile_file, 'w') as f:
-            json.dump(recommendation_profile, f, indent=2)
-        save_time = time.time() - save_start
-        if verbose:
-            print(f"\n   Recommendation profile saved to: {recommendation_profile_file}")
-            print(f"   [DEBUG] Saving recommendation_profile.json: {save_time:.2f}s")
-        
-        step_elapsed = time.time() - step_start
-        if verbose:
-            print(f"   [TIMING] Step 4 (Recommendation Profile): {step_elapsed:.2f}s")
-        
-        # Step 5: Generate Academic Profile
-        step_start = time.time()
-        if verbose:
-            print("\n5. Generating Academic Profile...")
-        
-        # Get resume for education section
-        resume = next((att for att in classified_attachments if att.get('category') == 'resume'), None)
-        
-        # Filter for potential academic attachments (transcripts, grade summaries, etc.)
-        academic_keywords = ['transcript', 'grade', 'gpa', 'academic', 'diploma', 'degree', 'certificate', 'report card']
-        academic_attachments = []
-        for att in classified_attachments:
-            filename_lower = att.get('filename', '').lower()
-            # Include if it's classified as unknown and has academic keywords, or if explicitly academic
-            if (att.get('category') == 'unknown' and 
-                any(keyword in filename_lower for keyword in academic_keywords)):
-                academic_attachments.append(att)
-            # Also check if the category might be academic (for future expansion)
-            elif att.get('category') == 'transcript' or att.get('category') == 'academic':
-                academic_attachments.append(att)
-        
-        if verbose:
-            print(f"   Found {'1 resume' if resume else 'no resume'} and {len(academic_attachments)} academic document(s)")
+                log(f"   Recommendation profile generated (overall score: {overall_score})")
+            return recommendation_profile
         
-        # Process academic profile (always try, even without attachments, as resume and application form have info)
-        try:
-            agent_start = time.time()
-            academic_agent = AcademicAgent(model_name=model_name)
-            agent_init_time = time.time() - agent_start
-            if verbose:
-                print(f"   [DEBUG] AcademicAgent initialization: {agent_init_time:.2f}s")
-            
-            analyze_start = time.time()
-            academic_profile = academic_agent.analyze_academic_profile(
-                resume=resume,
-                academic_attachments=academic_attachments,
-                application_profile=application_profile,
-                text_files_base_path=output_path,
-                additional_criteria=academic_criteria
-            )
-            analyze_time = time.time() - analyze_start
-            if verbose:
-                print(f"   [DEBUG] analyze_academic_profile() call: {analyze_time:.2f}s")
-                overall_score = academic_profile.get('scores', {}).get('overall_score', 'N/A')
-                print(f"   Academic profile generated (overall score: {overall_score})")
-        except Exception as e:
-            error_msg = f"Warning: Failed to generate academic profile: {str(e)}"
-            if verbose:
-                print(f"   {error_msg}")
-            academic_profile = {
-                "error": error_msg,
-                "summary": "Academic profile generation failed",
-                "profile_features": {},
-                "scores": {},
-                "score_breakdown": {}
-            }
-        
-        # Save academic profile
-        save_start = time.time()
-        academic_profile_file = output_path / "academic_profile.json"
-        with open(academic_profile_file, 'w') as f:
-            json.dump(academic_profile, f, indent=2)
-        save_time = time.time() - save_start
-        if verbose:
-            print(f"\n   Academic profile saved to: {academic_profile_file}")
-            print(f"   [DEBUG] Saving academic_profile.json: {save_time:.2f}s")
-        
-        step_elapsed = time.time() - step_start
-        if verbose:
-            print(f"   [TIMING] Step 5 (Academic Profile): {step_elapsed:.2f}s")
-        
-        # Step 6: Generate Social Presence Profile
-        step_start = time.time()
-        if verbose:
-            print("\n6. Generating Social Presence Profile...")
-        
-        # Filter attachments by category for social analysis
-        essays = [att for att in classified_attachments if att.get('category') == 'essay']
-        resume = next((att for att in classified_attachments if att.get('category') == 'resume'), None)
+        def generate_academic_profile() -> Dict[str, Any]:
+            log = agent_logs['academic'].append
+            # Always try, even without attachments, as resume and application form have info
+            try:
+                agent_start = time.time()
+                academic_agent = _get_agent(AcademicAgent, model_name)
+                agent_init_time = time.time() - agent_start
+                if verbose:
+                    log(f"   [DEBUG] AcademicAgent initialization: {agent_init_time:.2f}s")
+                
+                if failed.is_set():
+                    return {}  # The application already failed; this result is discarded
+                
+                analyze_start = time.time()
+                academic_profile = academic_agent.analyze_academic_profile(
+                    resume=resume,
+                    academic_attachments=academic_attachments,
+                    application_profile=application_profile,
+                    text_files_base_path=output_path,
+                    additional_criteria=academic_criteria
+                )
+                analyze_time = time.time() - analyze_start
+                if verbose:
+                    log(f"   [DEBUG] analyze_academic_profile() call: {analyze_time:.2f}s")
+                    overall_score = academic_profile.get('scores', {}).get('overall_score', 'N/A')
+                    log(f"   Academic profile generated (overall score: {overall_score})")
+                return academic_profile
+            except Exception as e:
+                error_msg = f"Warning: Failed to generate academic profile: {str(e)}"
+                if verbose:
+                    log(f"   {error_msg}")
+                return {
+                    "error": error_msg,
+                    "summary": "Academic profile generation failed",
+                    "profile_features": {},
+                    "scores": {},
+                    "score_breakdown": {}
+                }
         
-        if verbose:
-            print(f"   Analyzing social media presence from {'1 resume' if resume else 'no resume'} and {len(essays)} essay(s)")
+        def generate_social_profile() -> Dict[str, Any]:
+            log = agent_logs['social'].append
+            # Always try, even without attachments, as application form may have info
+            try:
+                agent_start = time.time()
+                social_agent = _get_agent(SocialAgent, model_name)
+                agent_init_time = time.time() - agent_start
+                if verbose:
+                    log(f"   [DEBUG] SocialAgent initialization: {agent_init_time:.2f}s")
+                
+                if failed.is_set():
+                    return {}  # The application already failed; this result is discarded
+                
+                analyze_start = time.time()
+                social_profile = social_agent.analyze_social_presence(
+                    resume=resume,
+                    essays=essays,
+                    application_profile=application_profile,
+                    text_files_base_path=output_path,
+                    additional_criteria=social_criteria
+                )
+                analyze_time = time.time() - analyze_start
+                if verbose:
+                    log(f"   [DEBUG] analyze_social_presence() call: {analyze_time:.2f}s")
+                    overall_score = social_profile.get('scores', {}).get('overall_score', 'N/A')
+                    platforms_found = social_profile.get('profile_features', {}).get('total_platforms', 0)
+                    log(f"   Social profile generated (overall score: {overall_score}, platforms found: {platforms_found})")
+                return social_profile
+            except Exception as e:
+                error_msg = f"Warning: Failed to generate social profile: {str(e)}"
+                if verbose:
+                    log(f"   {error_msg}")
+                return {
+                    "error": error_msg,
+                    "summary": "Social profile generation failed",
+                    "profile_features": {},
+                    "scores": {},
+                    "score_breakdown": {}
+                }
         
-        # Process social profile (always try, even without attachments, as application form may have info)
+        # Personal and recommendation failures still fail the application (result() re-raises)
+        executor = ThreadPoolExecutor(max_workers=4)
         try:
-            agent_start = time.time()
-            social_agent = SocialAgent(model_name=model_name)
-            agent_init_time = time.time() - agent_start
-            if verbose:
-                print(f"   [DEBUG] SocialAgent initialization: {agent_init_time:.2f}s")
-            
-            analyze_start = time.time()
-            social_profile = social_agent.analyze_social_presence(
-                resume=resume,
-                essays=essays,
-                application_profile=application_profile,
-                text_files_base_path=output_path,
-                additional_criteria=social_criteria
-            )
-            analyze_time = time.time() - analyze_start
-            if verbose:
-                print(f"   [DEBUG] analyze_social_presence() call: {analyze_time:.2f}s")
-                overall_score = social_profile.get('scores', {}).get('overall_score', 'N/A')
-                platforms_found = social_profile.get('profile_features', {}).get('total_platforms', 0)
-                print(f"   Social profile generated (overall score: {overall_score}, platforms found: {platforms_found})")
-        except Exception as e:
-            error_msg = f"Warning: Failed to generate social profile: {str(e)}"
-            if verbose:
-                print(f"   {error_msg}")
-            social_profile = {
-                "error": error_msg,
-                "summary": "Social profile generation failed",
-                "profile_features": {},
-                "scores": {},
-                "score_breakdown": {}
-            }
-        
-        # Save social profile
-        save_start = time.time()
-        social_profile_file = output_path / "social_profile.json"
-        with open(social_profile_file, 'w') as f:
-            json.dump(social_profile, f, indent=2)
-        save_time = time.time() - save_start
+            personal_future = executor.submit(generate_personal_profile)
+            recommendation_future = executor.submit(generate_recommendation_profile)
+            academic_future = executor.submit(generate_academic_profile)
+            social_future = executor.submit(generate_social_profile)
+            wait([personal_future, recommendation_future], return_when=FIRST_EXCEPTION)
+            try:
+                personal_profile = personal_future.result()
+                recommendation_profile = recommendation_future.result()
+            except Exception:
+                failed.set()
+                if verbose:
+                    print_agent_logs("personal", "recommendation")
+                # application_profile.json is otherwise only written once all profiles are
+                # done; keep the step 2 application profile for the failed application
+                json_utils.dump_file(application_profile_file, application_profile, indent=True)
+                raise
+            academic_profile = academic_future.result()
+            social_profile = social_future.result()
+        finally:
+            # After a failure, drop agents that have not started and don't wait for the
+            # academic/social requests already in flight (their results are discarded)
+            executor.shutdown(wait=not failed.is_set(), cancel_futures=True)
         if verbose:
-            print(f"\n   Social profile saved to: {social_profile_file}")
-            print(f"   [DEBUG] Saving social_profile.json: {save_time:.2f}s")
+            print_agent_logs("personal", "recommendation", "academic", "social")
         
         step_elapsed = time.time() - step_start
         if verbose:
-            print(f"   [TIMING] Step 6 (Social Profile): {step_elapsed:.2f}s")
+            print(f"   [TIMING] Steps 3-6 (Personal, Recommendation, Academic, Social Profiles): {step_elapsed:.2f}s")
         
         # Calculate total score summary
         scores = {
-            "application": application_profile.get('scores', {}).get('overall_score', 
-                application_profile.get('score', {}).get('completeness_score', 0)),  # Backward compatibility
-            "personal": personal_profile.get('scores', {}).get('overall_score', 0),
-            "recommendation": recommendation_profile.get('scores', {}).get('overall_score', 0),
-            "academic": academic_profile.get('scores', {}).get('overall_score', 0),
-            "social": social_profile.get('scores', {}).get('overall_score', 0)
+            "application": _coerce_score(application_profile.get('scores', {}).get('overall_score',
+                application_profile.get('score', {}).get('completeness_score', 0))),  # Backward compatibility
+            "personal": _coerce_score(personal_profile.get('scores', {}).get('overall_score', 0)),
+            "recommendation": _coerce_score(recommendation_profile.get('scores', {}).get('overall_score', 0)),
+            "academic": _coerce_score(academic_profile.get('scores', {}).get('overall_score', 0)),
+            "social": _coerce_score(social_profile.get('scores', {}).get('overall_score', 0))
         }
         
-        # Convert string scores to numbers if needed
-        for key, value in scores.items():
-            if isinstance(value, str) and value != 'N/A':
-                try:
-                    scores[key] = float(value)
-                except (ValueError, TypeError):
-                    scores[key] = 0
-            elif not isinstance(value, (int, float)):
-                scores[key] = 0
-        
         total_score = sum(scores.values())
         max_possible_score = 500  # 5 profiles * 100 points each
         percentage = (total_score / max_possible_score * 100) if max_possible_score > 0 else 0
@@ -710,14 +649,29 @@ def process_single_application_step2(
         application_profile['social_profile'] = social_profile
         application_profile['total_score_summary'] = total_score_summary
         
+        # Save the five profiles (independent files, so the writes overlap)
         save_start = time.time()
-        with open(application_profile_file, 'w') as f:
-            json.dump(application_profile, f, indent=2)
+        personal_profile_file = output_path / "personal_profile.json"
+        recommendation_profile_file = output_path / "recommendation_profile.json"
+        academic_profile_file = output_path / "academic_profile.json"
+        social_profile_file = output_path / "social_profile.json"
+        profile_files = (
+            (application_profile_file, application_profile),
+            (personal_profile_file, personal_profile),
+            (recommendation_profile_file, recommendation_profile),
+            (academic_profile_file, academic_profile),
+            (social_profile_file, social_profile),
+        )
+        with ThreadPoolExecutor(max_workers=len(profile_files)) as executor:
+            # list() re-raises the first write error, if any
+            list(executor.map(lambda item: json_utils.dump_file(item[0], item[1], indent=True), profile_files))
         save_time = time.time() - save_start
         if verbose:
-            print(f"   Updated application_profile.json with all profiles (application, personal, recommendation, academic, social)")
+            for profile_file, _ in profile_files[1:]:
+                print(f"   Saved to: {profile_file}")
+            print(f"   Saved application_profile.json with all profiles (application, personal, recommendation, academic, social)")
             print(f"   Total score summary: {total_score_summary['total_score']}/{max_possible_score} ({total_score_summary['percentage']}%)")
-            print(f"   [DEBUG] Saving updated application_profile.json: {save_time:.2f}s")
+            print(f"   [DEBUG] Saving application, personal, recommendation, academic and social profiles: {save_time:.2f}s")
         
         # Overall timing summary
         overall_elapsed = time.time() - overall_start_time
@@ -764,6 +718,27 @@ def process_single_application_step2(
         }
 
 
+def _create_agents(model_name: str):
+    """
+    Create the step 2 agents before the first application is processed.
+
+    Agents are cached per process (see _get_agent), so calling this once before
+    opening the thread pool validates the Ollama connection, loads the schemas and
+    preloads the models once, rather than inside the first applications' timing.
+
+    Args:
+        model_name: Ollama model name to use
+    """
+    application_model = os.getenv("APPLICATION_AGENT_MODEL") or model_name
+    try:
+        _get_agent(ApplicationAgent, application_model)
+        for agent_class in (PersonalAgent, RecommendationAgent, AcademicAgent, SocialAgent):
+            _get_agent(agent_class, model_name)
+    except Exception as e:
+        # Agents that could not be created are retried (and the error reported) per application
+        print(f"Warning: Could not initialize agents: {str(e)}")
+
+
 def _worker_process_application_step2(args_tuple) -> dict:
     """
     Worker function for multiprocessing.
@@ -794,6 +769,7 @@ def _worker_process_application_step2(args_tuple) -> dict:
 
 def main():
     """Main function with command-line argument parsing."""
+    load_env()
     parser = argparse.ArgumentParser(
         description="Step 2: Generate Application, Personal, Recommendation, Academic, and Social Profiles from Step 1 results",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -861,6 +837,12 @@ Examples:
         help="Suppress verbose output (only show errors and summary)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the on-disk cache of LLM responses (same as LLM_CACHE_ENABLED=false)"
+    )
+
     parser.add_argument(
         "--workers",
         type=int,
@@ -870,6 +852,10 @@ Examples:
 
     args = parser.parse_args()
     
+    # Agents (including those created in worker processes) read this via ResponseCache.from_env()
+    if args.no_cache:
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+    
     # Start timing for total processing time
     main_start_time = time.time()
     
@@ -969,49 +955,21 @@ Examples:
             input_path = Path(args.input_dir)
         else:
             # Use INPUT_DATA_DIR/{scholarship_folder}/input
-            input_data_dir = os.getenv("INPUT_DATA_DIR", "data/2026")
+            input_data_dir = _get_input_data_dir()
             input_path = Path(input_data_dir) / scholarship_name / "input"
         
         # Load all criteria files
-        personal_criteria = None
-        recommendation_criteria = None
-        application_criteria = None
-        academic_criteria = None
-        social_criteria = None
-        
         if args.input_dir or input_path.exists():
-            for criteria_name, criteria_var in [
-                ("personal_criteria.txt", "personal_criteria"),
-                ("recommendation_criteria.txt", "recommendation_criteria"),
-                ("application_criteria.txt", "application_criteria"),
-                ("academic_criteria.txt", "academic_criteria"),
-                ("social_criteria.txt", "social_criteria"),
-            ]:
-                criteria_file = input_path / criteria_name
-                if criteria_file.exists():
-                    try:
-                        with open(criteria_file, 'r', encoding='utf-8') as f:
-                            if criteria_var == "personal_criteria":
-                                personal_criteria = f.read().strip()
-                            elif criteria_var == "recommendation_criteria":
-                                recommendation_criteria = f.read().strip()
-                            elif criteria_var == "application_criteria":
-                                application_criteria = f.read().strip()
-                            elif criteria_var == "academic_criteria":
-                                academic_criteria = f.read().strip()
-                            elif criteria_var == "social_criteria":
-                                social_criteria = f.read().strip()
-                        if verbose:
-                            print(f"Loaded {criteria_name} from: {criteria_file}")
-                    except Exception as e:
-                        print(f"Warning: Could not read {criteria_name} from {criteria_file}: {e}")
+            criteria = dict.fromkeys(CRITERIA_FILES)
+            read_criteria_dir(input_path, criteria, verbose=verbose)
         else:
             # Fallback: try old structure
-            personal_criteria = load_personal_criteria_from_output(output_dir, scholarship_name)
-            recommendation_criteria = load_recommendation_criteria_from_output(output_dir, scholarship_name)
-            application_criteria = load_application_criteria_from_output(output_dir, scholarship_name)
-            academic_criteria = load_academic_criteria_from_output(output_dir, scholarship_name)
-            social_criteria = load_social_criteria_from_output(output_dir, scholarship_name)
+            criteria = load_all_criteria_from_output(output_dir, scholarship_name)
+        personal_criteria = criteria["personal"]
+        recommendation_criteria = criteria["recommendation"]
+        application_criteria = criteria["application"]
+        academic_criteria = criteria["academic"]
+        social_criteria = criteria["social"]
         
         # Find application folders in this scholarship folder
         if args.application_folder:
@@ -1071,6 +1029,8 @@ Examples:
             if verbose:
                 print(f"\n  Using {args.workers} worker threads for parallel processing")
             
+            # Create the shared agents once, before the worker threads all need them
+            _create_agents(model_name)
             with ProcessingPool(num_workers=args.workers, use_threading=True, verbose=verbose) as pool:
                 if verbose and len(application_folders) > 1:
                     print(f"  Processing {len(application_folders)} applications...")
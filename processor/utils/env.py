@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Process-wide loading of the .env file.
+"""
+
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Load environment variables from .env, at most once per process.
+
+    Call this before reading settings from os.environ. Variables that are
+    already set in the environment are not overridden.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv()
@@ -6,10 +6,11 @@ Provides consistent error handling, recovery strategies, and result types
 across all processing steps and agents.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, Any, Dict
 from enum import Enum
-import json
+
+from processor.utils import json_utils
 
 
 class ErrorSeverity(Enum):
@@ -19,7 +20,11 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Plain dict lookup avoids the Enum.value descriptor on every serialization
+_SEVERITY_STR = {severity: severity.value for severity in ErrorSeverity}
+
+
+@dataclass(slots=True)
 class ErrorResult:
     """
     Standardized error result for consistent error handling across all steps.
@@ -46,17 +51,25 @@ class ErrorResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, handling Enum conversion."""
-        d = asdict(self)
-        d['severity'] = self.severity.value
-        return d
+        # Built directly: asdict() would recursively deep-copy every field
+        return {
+            'success': self.success,
+            'severity': _SEVERITY_STR[self.severity],
+            'message': self.message,
+            'error_type': self.error_type,
+            'context': self.context,
+            'details': self.details,
+            'recoverable': self.recoverable,
+            'source': self.source
+        }
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return json_utils.dumps(self.to_dict())
 
     def __str__(self) -> str:
         """String representation for logging."""
-        base = f"[{self.severity.value.upper()}] {self.message}"
+        base = f"[{_SEVERITY_STR[self.severity].upper()}] {self.message}"
         if self.context:
             base += f" (Context: {self.context})"
         if self.error_type:
@@ -64,7 +77,7 @@ class ErrorResult:
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessResult:
     """
     Standardized success result for consistent result handling across all steps.
@@ -92,7 +105,7 @@ class SuccessResult:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        return json_utils.dumps(self.to_dict(), default=str)
 
     def __str__(self) -> str:
         """String representation for logging."""
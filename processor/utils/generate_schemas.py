@@ -8,24 +8,62 @@ This script creates JSON Schema files for:
 - RecommendationAgent
 - AcademicAgent
 - SocialAgent
+
+This is a development tool: the generated files in schemas/ are committed and the
+agents load them directly, so nothing here runs when processing applications.
 """
 
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
-from dotenv import load_dotenv
+from typing import Dict, Any, List
 
-# Load environment variables
-load_dotenv()
+from processor.utils import json_utils
+from processor.utils.env import load_env
+from processor.utils.schema_validators import write_validator_module
 
 
 def get_schema_dir() -> Path:
     """Get the schema directory from environment variable or use default."""
+    load_env()
     schema_dir = os.getenv("SCHEMA_OUTPUT_DIR", "schemas")
     return Path(schema_dir)
 
 
+# Shared leaf nodes referenced throughout the schemas below. The schema dicts share these
+# objects, so they must be treated as read-only.
+_STRING = {"type": "string"}
+_NULLABLE_STRING = {"type": ["string", "null"]}
+_BOOLEAN = {"type": "boolean"}
+_INTEGER = {"type": "integer"}
+_SCORE = {"type": ["integer", "number"]}
+_STRING_LIST = {"type": "array", "items": _STRING}
+_STRING_OR_NUMBER = {"type": ["string", "number"]}
+
+# Required keys shared by the personal, recommendation, academic and social schemas
+_PROFILE_REQUIRED = ["summary", "profile_features", "scores"]
+_SCORES_REQUIRED = ["overall_score"]
+
+# Social media platform entry: either a details object or a plain boolean
+_PLATFORM = {
+    "type": ["object", "boolean"],
+    "oneOf": [
+        {
+            "type": "object",
+            "properties": {
+                "present": _BOOLEAN,
+                "link": _NULLABLE_STRING,
+                "handle": _NULLABLE_STRING,
+                "evidence": _STRING
+            }
+        },
+        _BOOLEAN
+    ]
+}
+
+
+@lru_cache(maxsize=1)
 def create_application_agent_schema() -> Dict[str, Any]:
     """Create JSON schema for ApplicationAgent output."""
     return {
@@ -37,72 +75,69 @@ def create_application_agent_schema() -> Dict[str, Any]:
             "profile": {
                 "type": "object",
                 "properties": {
-                    "wai_membership_number": {"type": ["string", "null"]},
-                    "wai_application_number": {"type": ["string", "null"]},
-                    "first_name": {"type": ["string", "null"]},
-                    "middle_name": {"type": ["string", "null"]},
-                    "last_name": {"type": ["string", "null"]},
-                    "email": {"type": ["string", "null"]},
-                    "membership_since": {"type": ["string", "null"]},
-                    "membership_expiration": {"type": ["string", "null"]},
+                    "wai_membership_number": _NULLABLE_STRING,
+                    "wai_application_number": _NULLABLE_STRING,
+                    "first_name": _NULLABLE_STRING,
+                    "middle_name": _NULLABLE_STRING,
+                    "last_name": _NULLABLE_STRING,
+                    "email": _NULLABLE_STRING,
+                    "membership_since": _NULLABLE_STRING,
+                    "membership_expiration": _NULLABLE_STRING,
                     "home_address": {
                         "type": "object",
                         "properties": {
-                            "country": {"type": ["string", "null"]},
-                            "address_1": {"type": ["string", "null"]},
-                            "address_2": {"type": ["string", "null"]},
-                            "city": {"type": ["string", "null"]},
-                            "state_province": {"type": ["string", "null"]},
-                            "zip_postal_code": {"type": ["string", "null"]},
-                            "home_phone": {"type": ["string", "null"]},
-                            "work_phone": {"type": ["string", "null"]}
+                            "country": _NULLABLE_STRING,
+                            "address_1": _NULLABLE_STRING,
+                            "address_2": _NULLABLE_STRING,
+                            "city": _NULLABLE_STRING,
+                            "state_province": _NULLABLE_STRING,
+                            "zip_postal_code": _NULLABLE_STRING,
+                            "home_phone": _NULLABLE_STRING,
+                            "work_phone": _NULLABLE_STRING
                         }
                     },
                     "school_information": {
                         "type": "object",
                         "properties": {
-                            "country": {"type": ["string", "null"]},
-                            "school_name": {"type": ["string", "null"]},
-                            "address_1": {"type": ["string", "null"]},
-                            "address_2": {"type": ["string", "null"]},
-                            "city": {"type": ["string", "null"]},
-                            "state_province": {"type": ["string", "null"]},
-                            "zip_postal_code": {"type": ["string", "null"]}
+                            "country": _NULLABLE_STRING,
+                            "school_name": _NULLABLE_STRING,
+                            "address_1": _NULLABLE_STRING,
+                            "address_2": _NULLABLE_STRING,
+                            "city": _NULLABLE_STRING,
+                            "state_province": _NULLABLE_STRING,
+                            "zip_postal_code": _NULLABLE_STRING
                         }
                     },
                     "completeness": {
                         "type": "object",
                         "properties": {
-                            "has_resume": {"type": "boolean"},
-                            "has_essay": {"type": "boolean"},
-                            "num_recommendation_letters": {"type": "integer"},
-                            "has_medical_certificate": {"type": "boolean"},
-                            "has_logbook": {"type": "boolean"},
-                            "num_attachments": {"type": "integer"}
+                            "has_resume": _BOOLEAN,
+                            "has_essay": _BOOLEAN,
+                            "num_recommendation_letters": _INTEGER,
+                            "has_medical_certificate": _BOOLEAN,
+                            "has_logbook": _BOOLEAN,
+                            "num_attachments": _INTEGER
                         }
                     }
                 },
                 "required": []
             },
-            "summary": {"type": "string"},
+            "summary": _STRING,
             "scores": {
                 "type": "object",
                 "properties": {
-                    "overall_score": {"type": ["integer", "number"]},
-                    "completeness_score": {"type": ["integer", "number"]},
+                    "overall_score": _SCORE,
+                    "completeness_score": _SCORE,
                     "score_breakdown": {
                         "type": "object",
                         "properties": {
-                            "profile_information": {"type": ["string", "number"]},
-                            "contact_information": {"type": ["string", "number"]},
-                            "school_information": {"type": ["string", "number"]},
-                            "supporting_documents": {"type": ["string", "number"]}
+                            "profile_information": _STRING_OR_NUMBER,
+                            "contact_information": _STRING_OR_NUMBER,
+                            "school_information": _STRING_OR_NUMBER,
+                            "supporting_documents": _STRING_OR_NUMBER
                         }
                     },
-                    "missing_items": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    }
+                    "missing_items": _STRING_LIST
                 },
                 "required": ["overall_score", "completeness_score"]
             }
@@ -111,6 +146,7 @@ def create_application_agent_schema() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def create_personal_agent_schema() -> Dict[str, Any]:
     """Create JSON schema for PersonalAgent output."""
     return {
@@ -119,56 +155,48 @@ def create_personal_agent_schema() -> Dict[str, Any]:
         "description": "Schema for PersonalAgent output structure",
         "type": "object",
         "properties": {
-            "summary": {"type": "string"},
+            "summary": _STRING,
             "profile_features": {
                 "type": "object",
                 "properties": {
-                    "motivation_summary": {"type": "string"},
-                    "career_goals_summary": {"type": "string"},
+                    "motivation_summary": _STRING,
+                    "career_goals_summary": _STRING,
                     "aviation_path_stage": {
                         "type": "string",
                         "enum": ["exploring", "training", "early_career", "professional", "other"]
                     },
-                    "community_service_summary": {"type": "string"},
-                    "leadership_roles": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "personal_character_indicators": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "alignment_with_wai": {"type": "string"},
-                    "unique_strengths": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    }
+                    "community_service_summary": _STRING,
+                    "leadership_roles": _STRING_LIST,
+                    "personal_character_indicators": _STRING_LIST,
+                    "alignment_with_wai": _STRING,
+                    "unique_strengths": _STRING_LIST
                 }
             },
             "scores": {
                 "type": "object",
                 "properties": {
-                    "motivation_score": {"type": ["integer", "number"]},
-                    "goals_clarity_score": {"type": ["integer", "number"]},
-                    "character_service_leadership_score": {"type": ["integer", "number"]},
-                    "overall_score": {"type": ["integer", "number"]}
+                    "motivation_score": _SCORE,
+                    "goals_clarity_score": _SCORE,
+                    "character_service_leadership_score": _SCORE,
+                    "overall_score": _SCORE
                 },
-                "required": ["overall_score"]
+                "required": _SCORES_REQUIRED
             },
             "score_breakdown": {
                 "type": "object",
                 "properties": {
-                    "motivation_score_reasoning": {"type": "string"},
-                    "goals_clarity_score_reasoning": {"type": "string"},
-                    "character_service_leadership_score_reasoning": {"type": "string"},
-                    "overall_score_reasoning": {"type": "string"}
+                    "motivation_score_reasoning": _STRING,
+                    "goals_clarity_score_reasoning": _STRING,
+                    "character_service_leadership_score_reasoning": _STRING,
+                    "overall_score_reasoning": _STRING
                 }
             }
         },
-        "required": ["summary", "profile_features", "scores"]
+        "required": _PROFILE_REQUIRED
     }
 
 
+@lru_cache(maxsize=1)
 def create_recommendation_agent_schema() -> Dict[str, Any]:
     """Create JSON schema for RecommendationAgent output."""
     return {
@@ -177,7 +205,7 @@ def create_recommendation_agent_schema() -> Dict[str, Any]:
         "description": "Schema for RecommendationAgent output structure",
         "type": "object",
         "properties": {
-            "summary": {"type": "string"},
+            "summary": _STRING,
             "profile_features": {
                 "type": "object",
                 "properties": {
@@ -190,19 +218,10 @@ def create_recommendation_agent_schema() -> Dict[str, Any]:
                                     "type": "string",
                                     "enum": ["instructor", "employer", "mentor", "colleague", "other"]
                                 },
-                                "relationship_duration": {"type": "string"},
-                                "key_strengths_mentioned": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "specific_examples": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "potential_concerns": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
+                                "relationship_duration": _STRING,
+                                "key_strengths_mentioned": _STRING_LIST,
+                                "specific_examples": _STRING_LIST,
+                                "potential_concerns": _STRING_LIST,
                                 "overall_tone": {
                                     "type": "string",
                                     "enum": ["very_positive", "positive", "neutral", "mixed"]
@@ -213,10 +232,7 @@ def create_recommendation_agent_schema() -> Dict[str, Any]:
                     "aggregate_analysis": {
                         "type": "object",
                         "properties": {
-                            "common_themes": {
-                                "type": "array",
-                                "items": {"type": "string"}
-                            },
+                            "common_themes": _STRING_LIST,
                             "strength_consistency": {
                                 "type": "string",
                                 "enum": ["high", "medium", "low"]
@@ -232,26 +248,27 @@ def create_recommendation_agent_schema() -> Dict[str, Any]:
             "scores": {
                 "type": "object",
                 "properties": {
-                    "average_support_strength_score": {"type": ["integer", "number"]},
-                    "consistency_of_support_score": {"type": ["integer", "number"]},
-                    "depth_of_endorsement_score": {"type": ["integer", "number"]},
-                    "overall_score": {"type": ["integer", "number"]}
+                    "average_support_strength_score": _SCORE,
+                    "consistency_of_support_score": _SCORE,
+                    "depth_of_endorsement_score": _SCORE,
+                    "overall_score": _SCORE
                 },
-                "required": ["overall_score"]
+                "required": _SCORES_REQUIRED
             },
             "score_breakdown": {
                 "type": "object",
                 "properties": {
-                    "average_support_strength_score_reasoning": {"type": "string"},
-                    "consistency_of_support_score_reasoning": {"type": "string"},
-                    "depth_of_endorsement_score_reasoning": {"type": "string"}
+                    "average_support_strength_score_reasoning": _STRING,
+                    "consistency_of_support_score_reasoning": _STRING,
+                    "depth_of_endorsement_score_reasoning": _STRING
                 }
             }
         },
-        "required": ["summary", "profile_features", "scores"]
+        "required": _PROFILE_REQUIRED
     }
 
 
+@lru_cache(maxsize=1)
 def create_academic_agent_schema() -> Dict[str, Any]:
     """Create JSON schema for AcademicAgent output."""
     return {
@@ -260,59 +277,48 @@ def create_academic_agent_schema() -> Dict[str, Any]:
         "description": "Schema for AcademicAgent output structure",
         "type": "object",
         "properties": {
-            "summary": {"type": "string"},
+            "summary": _STRING,
             "profile_features": {
                 "type": "object",
                 "properties": {
-                    "current_school_name": {"type": ["string", "null"]},
-                    "program": {"type": ["string", "null"]},
+                    "current_school_name": _NULLABLE_STRING,
+                    "program": _NULLABLE_STRING,
                     "education_level": {
                         "type": ["string", "null"],
                         "enum": ["high_school", "undergraduate", "graduate", "other", None]
                     },
-                    "gpa": {"type": ["string", "null"]},
-                    "academic_awards": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "relevant_courses": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "academic_trajectory": {"type": "string"},
-                    "strengths": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "areas_for_improvement": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    }
+                    "gpa": _NULLABLE_STRING,
+                    "academic_awards": _STRING_LIST,
+                    "relevant_courses": _STRING_LIST,
+                    "academic_trajectory": _STRING,
+                    "strengths": _STRING_LIST,
+                    "areas_for_improvement": _STRING_LIST
                 }
             },
             "scores": {
                 "type": "object",
                 "properties": {
-                    "academic_performance_score": {"type": ["integer", "number"]},
-                    "academic_relevance_score": {"type": ["integer", "number"]},
-                    "academic_readiness_score": {"type": ["integer", "number"]},
-                    "overall_score": {"type": ["integer", "number"]}
+                    "academic_performance_score": _SCORE,
+                    "academic_relevance_score": _SCORE,
+                    "academic_readiness_score": _SCORE,
+                    "overall_score": _SCORE
                 },
-                "required": ["overall_score"]
+                "required": _SCORES_REQUIRED
             },
             "score_breakdown": {
                 "type": "object",
                 "properties": {
-                    "academic_performance_score_reasoning": {"type": "string"},
-                    "academic_relevance_score_reasoning": {"type": "string"},
-                    "academic_readiness_score_reasoning": {"type": "string"}
+                    "academic_performance_score_reasoning": _STRING,
+                    "academic_relevance_score_reasoning": _STRING,
+                    "academic_readiness_score_reasoning": _STRING
                 }
             }
         },
-        "required": ["summary", "profile_features", "scores"]
+        "required": _PROFILE_REQUIRED
     }
 
 
+@lru_cache(maxsize=1)
 def create_social_agent_schema() -> Dict[str, Any]:
     """Create JSON schema for SocialAgent output."""
     return {
@@ -321,102 +327,74 @@ def create_social_agent_schema() -> Dict[str, Any]:
         "description": "Schema for SocialAgent output structure",
         "type": "object",
         "properties": {
-            "summary": {"type": "string"},
+            "summary": _STRING,
             "profile_features": {
                 "type": "object",
                 "properties": {
                     "platforms_found": {
                         "type": "object",
                         "properties": {
-                            "facebook": {
-                                "type": ["object", "boolean"],
-                                "oneOf": [
-                                    {
-                                        "type": "object",
-                                        "properties": {
-                                            "present": {"type": "boolean"},
-                                            "link": {"type": ["string", "null"]},
-                                            "handle": {"type": ["string", "null"]},
-                                            "evidence": {"type": "string"}
-                                        }
-                                    },
-                                    {"type": "boolean"}
-                                ]
-                            },
-                            "instagram": {
-                                "type": ["object", "boolean"],
-                                "oneOf": [
-                                    {
-                                        "type": "object",
-                                        "properties": {
-                                            "present": {"type": "boolean"},
-                                            "link": {"type": ["string", "null"]},
-                                            "handle": {"type": ["string", "null"]},
-                                            "evidence": {"type": "string"}
-                                        }
-                                    },
-                                    {"type": "boolean"}
-                                ]
-                            },
-                            "tiktok": {
-                                "type": ["object", "boolean"],
-                                "oneOf": [
-                                    {
-                                        "type": "object",
-                                        "properties": {
-                                            "present": {"type": "boolean"},
-                                            "link": {"type": ["string", "null"]},
-                                            "handle": {"type": ["string", "null"]},
-                                            "evidence": {"type": "string"}
-                                        }
-                                    },
-                                    {"type": "boolean"}
-                                ]
-                            },
-                            "linkedin": {
-                                "type": ["object", "boolean"],
-                                "oneOf": [
-                                    {
-                                        "type": "object",
-                                        "properties": {
-                                            "present": {"type": "boolean"},
-                                            "link": {"type": ["string", "null"]},
-                                            "handle": {"type": ["string", "null"]},
-                                            "evidence": {"type": "string"}
-                                        }
-                                    },
-                                    {"type": "boolean"}
-                                ]
-                            }
+                            "facebook": _PLATFORM,
+                            "instagram": _PLATFORM,
+                            "tiktok": _PLATFORM,
+                            "linkedin": _PLATFORM
                         }
                     },
-                    "total_platforms": {"type": "integer"},
-                    "has_professional_presence": {"type": "boolean"},
-                    "notes": {"type": "string"}
+                    "total_platforms": _INTEGER,
+                    "has_professional_presence": _BOOLEAN,
+                    "notes": _STRING
                 }
             },
             "scores": {
                 "type": "object",
                 "properties": {
-                    "social_presence_score": {"type": ["integer", "number"]},
-                    "professional_presence_score": {"type": ["integer", "number"]},
-                    "overall_score": {"type": ["integer", "number"]}
+                    "social_presence_score": _SCORE,
+                    "professional_presence_score": _SCORE,
+                    "overall_score": _SCORE
                 },
-                "required": ["overall_score"]
+                "required": _SCORES_REQUIRED
             },
             "score_breakdown": {
                 "type": "object",
                 "properties": {
-                    "social_presence_score_reasoning": {"type": "string"},
-                    "professional_presence_score_reasoning": {"type": "string"},
-                    "overall_score_reasoning": {"type": "string"}
+                    "social_presence_score_reasoning": _STRING,
+                    "professional_presence_score_reasoning": _STRING,
+                    "overall_score_reasoning": _STRING
                 }
             }
         },
-        "required": ["summary", "profile_features", "scores"]
+        "required": _PROFILE_REQUIRED
     }
 
 
+# All agent schemas keyed by file name, built once at import. The create_* functions are
+# cached too, so these dicts are shared and must not be modified by callers.
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "application_agent_schema.json": create_application_agent_schema(),
+    "personal_agent_schema.json": create_personal_agent_schema(),
+    "recommendation_agent_schema.json": create_recommendation_agent_schema(),
+    "academic_agent_schema.json": create_academic_agent_schema(),
+    "social_agent_schema.json": create_social_agent_schema()
+}
+
+def _write_schema(schema_dir: Path, filename: str, schema: Dict[str, Any]) -> List[str]:
+    """
+    Write one schema and its precompiled validator module.
+
+    Returns:
+        Names of the files created
+    """
+    schema_path = schema_dir / filename
+    schema_path.write_bytes(json_utils.dumps_bytes(schema, indent=True))
+    created = [filename]
+
+    # Precompiled validator used by the agents (requires fastjsonschema)
+    validator_path = write_validator_module(schema, schema_path)
+    if validator_path:
+        created.append(validator_path.name)
+    return created
+
+
 def main():
     """Generate all JSON schemas."""
     schema_dir = get_schema_dir()
@@ -424,19 +402,14 @@ def main():
     
     print(f"Generating JSON schemas in: {schema_dir}")
     
-    schemas = {
-        "application_agent_schema.json": create_application_agent_schema(),
-        "personal_agent_schema.json": create_personal_agent_schema(),
-        "recommendation_agent_schema.json": create_recommendation_agent_schema(),
-        "academic_agent_schema.json": create_academic_agent_schema(),
-        "social_agent_schema.json": create_social_agent_schema()
-    }
-    
-    for filename, schema in schemas.items():
-        schema_path = schema_dir / filename
-        with open(schema_path, 'w', encoding='utf-8') as f:
-            json.dump(schema, f, indent=2)
-        print(f"  Created: {filename}")
+    # The writes are independent and I/O bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(SCHEMAS)) as executor:
+        created = executor.map(
+            lambda item: _write_schema(schema_dir, *item), SCHEMAS.items()
+        )
+        for names in created:
+            for name in names:
+                print(f"  Created: {name}")
     
     print(f"\nAll schemas generated successfully in {schema_dir}")
 
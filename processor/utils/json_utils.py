@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Fast JSON encoding/decoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise, so callers get the same str-based API either way.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Raised by loads() for malformed input (orjson.JSONDecodeError subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize JSON text or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False
+) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: If True, pretty-print with 2-space indentation
+        default: Optional callable for objects that are not natively serializable
+        sort_keys: If True, sort dictionary keys (for a canonical encoding)
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, ensure_ascii=False, sort_keys=sort_keys
+    ).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize obj to a JSON string (see dumps_bytes)."""
+    return dumps_bytes(obj, indent=indent, default=default).decode('utf-8')
+
+
+def dump_file(
+    path: Union[str, os.PathLike],
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """
+    Serialize obj and write it to path, replacing any existing file.
+
+    The document is encoded in one go and written straight to the file
+    descriptor, without going through a buffered file object.
+
+    Args:
+        path: Destination file
+        obj: Object to serialize
+        indent: If True, pretty-print with 2-space indentation
+        default: Optional callable for objects that are not natively serializable
+    """
+    data = memoryview(dumps_bytes(obj, indent=indent, default=default))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
@@ -5,28 +5,105 @@ Logging utilities for tracking execution summaries, elapsed time, and exceptions
 
 import os
 import sys
+import atexit
+import time
+import threading
 import traceback
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
-from dotenv import load_dotenv
+from functools import lru_cache
 
-# Load environment variables
-load_dotenv()
+from processor.utils import json_utils
+from processor.utils.env import load_env
 
 
+@lru_cache(maxsize=1)
 def get_log_dir() -> Path:
-    """Get the log directory from environment variable or use default."""
-    log_dir = os.getenv("LOG_OUTPUT_DIR", "logs")
-    return Path(log_dir)
+    """Get the log directory from environment variable or use default, creating it on first use."""
+    load_env()
+    log_dir = Path(os.getenv("LOG_OUTPUT_DIR", "logs"))
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
 
 
+@lru_cache(maxsize=1)
 def get_log_file() -> Path:
     """Get the log file path."""
-    log_dir = get_log_dir()
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir / "output.log"
+    return get_log_dir() / "output.log"
+
+
+# Banner line framing execution_logger entries
+_SEP = "=" * 80 + "\n"
+
+# Log file handle shared by all logging functions, opened on first use. Line buffered so
+# entries reach the file promptly; the lock keeps multi-line entries from interleaving.
+_LOG_FH = None
+_LOG_PID = None
+_LOG_LOCK = threading.Lock()
+
+
+def _get_fh():
+    """Return the shared log file handle, (re)opening it in new or forked processes."""
+    global _LOG_FH, _LOG_PID
+    if _LOG_FH is None or _LOG_PID != os.getpid():
+        _LOG_FH = open(get_log_file(), 'a', buffering=1, encoding='utf-8')
+        _LOG_PID = os.getpid()
+        atexit.register(_LOG_FH.close)
+    return _LOG_FH
+
+
+# (second, formatted timestamp) of the last _ts() call
+_LAST_TS = (None, "")
+
+
+def _ts() -> str:
+    """Current local time as "YYYY-MM-DD HH:MM:SS", formatted at most once per second."""
+    global _LAST_TS
+    now = int(time.time())
+    second, text = _LAST_TS
+    if second != now:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _LAST_TS = (now, text)
+    return text
+
+
+@lru_cache(maxsize=1)
+def _want_traceback() -> bool:
+    """Whether tracebacks are logged; WAI_LOG_TB=0 records only exception type and message."""
+    load_env()
+    return os.getenv("WAI_LOG_TB", "1") != "0"
+
+
+def _format_traceback(exception: BaseException) -> str:
+    """Format an exception's traceback as a single string ("" when tracebacks are disabled)."""
+    if not _want_traceback():
+        return ""
+    return "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+
+
+def _traceback_section(exception: BaseException) -> str:
+    """The "Traceback:" block of a text log entry, if tracebacks are enabled."""
+    tb = _format_traceback(exception)
+    return f"Traceback:\n{tb}" if tb else ""
+
+
+def _write_log(text: str):
+    """Append text to the log file."""
+    with _LOG_LOCK:
+        _get_fh().write(text)
+
+
+def _json_errors() -> bool:
+    """Whether errors are logged as JSON lines (LOG_ERROR_FORMAT=jsonl) instead of prose."""
+    load_env()
+    return os.getenv("LOG_ERROR_FORMAT", "text").lower() == "jsonl"
+
+
+def _write_record(record: Dict[str, Any]):
+    """Append a record to the log file as a single JSON line."""
+    _write_log(json_utils.dumps(record, default=str) + "\n")
 
 
 def log_message(message: str, script_name: str = "unknown"):
@@ -37,11 +114,8 @@ def log_message(message: str, script_name: str = "unknown"):
         message: Message to log
         script_name: Name of the script generating the log
     """
-    log_file = get_log_file()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(f"[{timestamp}] [{script_name}] {message}\n")
+    timestamp = _ts()
+    _write_log(f"[{timestamp}] [{script_name}] {message}\n")
 
 
 def log_exception(exception: Exception, script_name: str = "unknown", context: str = ""):
@@ -53,16 +127,25 @@ def log_exception(exception: Exception, script_name: str = "unknown", context: s
         script_name: Name of the script where exception occurred
         context: Additional context about where the exception occurred
     """
-    log_file = get_log_file()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(f"[{timestamp}] [{script_name}] EXCEPTION: {context}\n")
-        f.write(f"Exception Type: {type(exception).__name__}\n")
-        f.write(f"Exception Message: {str(exception)}\n")
-        f.write("Traceback:\n")
-        traceback.print_exc(file=f)
-        f.write("\n")
+    timestamp = _ts()
+    if _json_errors():
+        _write_record({
+            "ts": timestamp,
+            "script": script_name,
+            "event": "EXCEPTION",
+            "context": context,
+            "type": type(exception).__name__,
+            "msg": str(exception),
+            "tb": _format_traceback(exception) or None,
+        })
+        return
+    _write_log(
+        f"[{timestamp}] [{script_name}] EXCEPTION: {context}\n"
+        f"Exception Type: {type(exception).__name__}\n"
+        f"Exception Message: {str(exception)}\n"
+        f"{_traceback_section(exception)}"
+        "\n"
+    )
 
 
 @contextmanager
@@ -80,43 +163,54 @@ def execution_logger(script_name: str, args: Optional[Dict[str, Any]] = None):
         args: Optional dictionary of command-line arguments
     """
     start_time = datetime.now()
-    log_file = get_log_file()
     
     # Log start
-    timestamp = start_time.strftime("%Y-%m-%d %H:%M:%S")
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(f"\n{'='*80}\n")
-        f.write(f"[{timestamp}] [{script_name}] EXECUTION STARTED\n")
-        if args:
-            f.write(f"Arguments: {args}\n")
-        f.write(f"{'='*80}\n")
+    timestamp = _ts()
+    _write_log(
+        f"\n{_SEP}"
+        f"[{timestamp}] [{script_name}] EXECUTION STARTED\n"
+        + (f"Arguments: {args}\n" if args else "")
+        + _SEP
+    )
     
     try:
         yield
         # Log successful completion
         end_time = datetime.now()
         elapsed = end_time - start_time
-        timestamp = end_time.strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _ts()
         
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(f"[{timestamp}] [{script_name}] EXECUTION COMPLETED\n")
-            f.write(f"Elapsed time: {elapsed.total_seconds():.2f} seconds ({elapsed})\n")
-            f.write(f"{'='*80}\n\n")
+        _write_log(
+            f"[{timestamp}] [{script_name}] EXECUTION COMPLETED\n"
+            f"Elapsed time: {elapsed.total_seconds():.2f} seconds ({elapsed})\n"
+            f"{_SEP}\n"
+        )
             
     except Exception as e:
         # Log exception and re-raise
         end_time = datetime.now()
         elapsed = end_time - start_time
-        timestamp = end_time.strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _ts()
         
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(f"[{timestamp}] [{script_name}] EXECUTION FAILED\n")
-            f.write(f"Elapsed time before failure: {elapsed.total_seconds():.2f} seconds ({elapsed})\n")
-            f.write(f"Exception Type: {type(e).__name__}\n")
-            f.write(f"Exception Message: {str(e)}\n")
-            f.write("Traceback:\n")
-            traceback.print_exc(file=f)
-            f.write(f"{'='*80}\n\n")
+        if _json_errors():
+            _write_record({
+                "ts": timestamp,
+                "script": script_name,
+                "event": "EXECUTION FAILED",
+                "elapsed_seconds": round(elapsed.total_seconds(), 2),
+                "type": type(e).__name__,
+                "msg": str(e),
+                "tb": _format_traceback(e) or None,
+            })
+            raise
+        _write_log(
+            f"[{timestamp}] [{script_name}] EXECUTION FAILED\n"
+            f"Elapsed time before failure: {elapsed.total_seconds():.2f} seconds ({elapsed})\n"
+            f"Exception Type: {type(e).__name__}\n"
+            f"Exception Message: {str(e)}\n"
+            f"{_traceback_section(e)}"
+            f"{_SEP}\n"
+        )
         
         raise
 
@@ -129,12 +223,9 @@ def log_summary(script_name: str, summary: Dict[str, Any]):
         script_name: Name of the script
         summary: Dictionary with summary information (e.g., {"total": 10, "successful": 8, "failed": 2})
     """
-    log_file = get_log_file()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(f"[{timestamp}] [{script_name}] SUMMARY:\n")
-        for key, value in summary.items():
-            f.write(f"  {key}: {value}\n")
-        f.write("\n")
+    timestamp = _ts()
+    lines = [f"[{timestamp}] [{script_name}] SUMMARY:\n"]
+    lines += [f"  {key}: {value}\n" for key, value in summary.items()]
+    lines.append("\n")
+    _write_log("".join(lines))
 
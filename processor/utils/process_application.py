@@ -15,12 +15,19 @@ import os
 import re
 import json
 import sys
+import hashlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Literal
 
 from dotenv import load_dotenv
-from docling.document_converter import DocumentConverter
-from docling.datamodel.base_models import InputFormat  # noqa: F401 (kept for future use)
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode, TableStructureOptions
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 
 import instructor
 from openai import OpenAI
@@ -28,13 +35,15 @@ from openai import OpenAI
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class ApplicationFileProcessor:
     """Process files in an application folder and identify the application form."""
     
     # Use case‑insensitive regex instead of listing every case variant.
     FILE_PATTERN = re.compile(
-        r'^(\d+)_(\d+)(?:_(\d+))?\.(pdf|docx|png|jpg|jpeg)$',
+        r'^(\d+)_(\d+)(?:_(\d+))?\.(pdf|docx|png|jpe?g)$',
         re.IGNORECASE,
     )
     
@@ -42,59 +51,143 @@ class ApplicationFileProcessor:
         self.folder_path = Path(folder_path)
         if not self.folder_path.exists():
             raise ValueError(f"Folder does not exist: {folder_path}")
+        # Result of the folder scan, shared by list_files/get_application_form/get_attachments
+        self._files_cache: Optional[List[Tuple[str, Optional[int]]]] = None
     
     def list_files(self) -> List[Tuple[str, Optional[int]]]:
         """
         List all files in the folder and parse their naming convention.
-        Skips empty or zero-byte files.
+        Skips empty or zero-byte files, so callers need not stat the returned paths
+        again. The folder is scanned once per instance.
         
         Returns:
             List of tuples: (filename, attachment_index)
             attachment_index is None for the application form, 1+ for attachments
         """
+        if self._files_cache is not None:
+            return list(self._files_cache)
         files = []
-        for file_path in self.folder_path.iterdir():
-            if file_path.is_file():
+        # scandir entries carry the file type from the directory read, so only
+        # matching files need a stat() call for their size
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                match = self.FILE_PATTERN.match(entry.name)
+                if not match:
+                    continue
                 # Skip empty or zero-byte files
-                if file_path.stat().st_size == 0:
+                if entry.stat().st_size == 0:
                     continue
-                match = self.FILE_PATTERN.match(file_path.name)
-                if match:
-                    membership_num, app_num, attachment_idx, ext = match.groups()
-                    attachment_index = int(attachment_idx) if attachment_idx else None
-                    files.append((file_path.name, attachment_index))
-        return files
+                membership_num, app_num, attachment_idx, ext = match.groups()
+                attachment_index = int(attachment_idx) if attachment_idx else None
+                files.append((entry.name, attachment_index))
+        self._files_cache = files
+        return list(files)
     
+    def partition(self) -> Tuple[Optional[Path], List[Path]]:
+        """
+        Split the folder into the application form and its attachments in one pass.
+
+        Returns:
+            Tuple of (application form path or None, attachment paths sorted by
+            attachment index, then name)
+        """
+        app_forms = []
+        attachments = []
+        for name, idx in self.list_files():
+            if idx is None:
+                app_forms.append(name)
+            else:
+                attachments.append((idx, name))
+
+        # The application form is the last one by filename (as per user's requirement)
+        app_form = self.folder_path / max(app_forms) if app_forms else None
+        attachments.sort()  # Sort by index, then name
+        return app_form, [self.folder_path / name for _, name in attachments]
+
     def get_application_form(self) -> Optional[Path]:
         """
         Get the application form file (the one without attachment index).
         According to the design doc, this should be the last file when sorted.
         """
-        files = self.list_files()
-        # Filter for application form (attachment_index is None)
-        app_forms = [(name, idx) for name, idx in files if idx is None]
-        
-        if not app_forms:
-            return None
-        
-        # Sort by filename and get the last one (as per user's requirement)
-        app_forms.sort(key=lambda x: x[0])
-        app_form_name = app_forms[-1][0]
-        return self.folder_path / app_form_name
+        return self.partition()[0]
     
     def get_attachments(self) -> List[Path]:
         """Get all attachment files (files with attachment index >= 1)."""
-        files = self.list_files()
-        attachments = [(name, idx) for name, idx in files if idx is not None]
-        attachments.sort(key=lambda x: (x[1], x[0]))  # Sort by index, then name
-        return [self.folder_path / name for name, _ in attachments]
+        return self.partition()[1]
+
+
+def get_docling_device() -> AcceleratorDevice:
+    """
+    Device for the docling models from DOCLING_DEVICE (auto, cpu, cuda or mps; default: auto).
+
+    auto picks CUDA or MPS when available and falls back to CPU.
+    """
+    name = os.getenv("DOCLING_DEVICE", "auto").strip().lower()
+    try:
+        return AcceleratorDevice(name)
+    except ValueError:
+        logger.warning("Unknown DOCLING_DEVICE %r, using auto", name)
+        return AcceleratorDevice.AUTO
 
 
 class DoclingTextExtractor:
     """Extract text from PDFs using docling."""
 
-    def __init__(self):
-        self.converter = DocumentConverter()
+    # DocumentConverters (and their loaded models) shared by all extractors in the
+    # process, keyed by the OCR setting
+    _converters: Dict[bool, DocumentConverter] = {}
+
+    def __init__(self, ocr: Optional[bool] = None, cache_dir: Optional[Path] = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            ocr: Run OCR on PDF pages (needed for scanned documents). If None, uses
+                 DOCLING_OCR (default: true). Disabling it is much faster for PDFs
+                 that have a text layer.
+            cache_dir: Directory for cached extracted text, keyed by file content.
+                       If None, uses DOCLING_CACHE_DIR (default: .cache/docling);
+                       DOCLING_CACHE_ENABLED=false disables the cache.
+        """
+        if ocr is None:
+            ocr = os.getenv("DOCLING_OCR", "true").lower() not in ("0", "false", "no")
+        self.ocr = ocr
+        self.converter = self._get_converter(ocr)
+
+        if cache_dir is None and os.getenv("DOCLING_CACHE_ENABLED", "true").lower() not in ("0", "false", "no"):
+            cache_dir = Path(os.getenv("DOCLING_CACHE_DIR", ".cache/docling"))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    @classmethod
+    def _get_converter(cls, ocr: bool) -> DocumentConverter:
+        """Return the shared converter for an OCR setting, building it on first use."""
+        converter = cls._converters.get(ocr)
+        if converter is None:
+            pipeline_options = PdfPipelineOptions(
+                do_ocr=ocr,
+                do_table_structure=True,
+                table_structure_options=TableStructureOptions(mode=TableFormerMode.FAST, do_cell_matching=True),
+                accelerator_options=AcceleratorOptions(
+                    num_threads=int(os.getenv("DOCLING_NUM_THREADS", "4")),
+                    device=get_docling_device(),
+                ),
+            )
+            converter = DocumentConverter(
+                format_options={
+                    InputFormat.PDF: PdfFormatOption(
+                        backend=PyPdfiumDocumentBackend,
+                        pipeline_options=pipeline_options,
+                    )
+                }
+            )
+            cls._converters[ocr] = converter
+        return converter
+
+    def warm_up(self):
+        """Load the PDF pipeline models now instead of on the first conversion."""
+        self._get_converter(self.ocr).initialize_pipeline(InputFormat.PDF)
 
     def _clean_extracted_text(self, text: str, min_word_length: int = 2) -> str:
         """
@@ -148,16 +241,105 @@ class DoclingTextExtractor:
 
         return result.strip()
 
-    def extract_text(self, file_path: Path) -> str:
+    def extract_text(self, file_path: Path, force_refresh: bool = False) -> str:
         """
         Extract text from a PDF file using docling.
 
+        Results are cached on disk by file content (and OCR setting), so re-running
+        the pipeline on unchanged files skips docling entirely.
+
         Args:
             file_path: Path to the PDF file
+            force_refresh: If True, ignore any cached text and re-extract
 
         Returns:
             Cleaned extracted text as a string
         """
+        cache_path, hit = self._lookup_cache(file_path, force_refresh)
+        if hit:
+            # Bytes round trip: read_text would translate any \r or \r\n in the text
+            return cache_path.read_bytes().decode('utf-8')
+
+        text = self._convert(file_path)
+        if cache_path is not None:
+            self._store_cache(cache_path, file_path, text)
+        return text
+
+    def extract_text_to_file(self, file_path: Path, dst_path: Path, preview_chars: int = 2000) -> Tuple[int, str]:
+        """
+        Extract text from a file and write it to dst_path, returning only a preview.
+
+        On a cache hit the cached text is copied in chunks without holding it all in
+        memory. dst_path is only written when the text is not blank.
+
+        Args:
+            file_path: Path to the PDF file
+            dst_path: Text file to write
+            preview_chars: Maximum length of the returned preview
+
+        Returns:
+            Tuple of (length of the extracted text, its first preview_chars characters
+            after leading whitespace)
+        """
+        cache_path, hit = self._lookup_cache(file_path)
+        if hit:
+            return self._copy_text(cache_path, dst_path, preview_chars)
+
+        text = self._convert(file_path)
+        if cache_path is not None:
+            self._store_cache(cache_path, file_path, text)
+        preview = text.lstrip()[:preview_chars]
+        if preview.strip():
+            dst_path.write_bytes(text.encode('utf-8'))
+        return len(text), preview
+
+    @staticmethod
+    def _copy_text(src_path: Path, dst_path: Path, preview_chars: int) -> Tuple[int, str]:
+        """Stream a text file to dst_path (removed again if blank); see extract_text_to_file."""
+        total = 0
+        preview = ""
+        with open(src_path, 'r', encoding='utf-8', newline='') as src, open(dst_path, 'w', encoding='utf-8', newline='') as dst:
+            for chunk in iter(lambda: src.read(1 << 16), ""):
+                dst.write(chunk)
+                total += len(chunk)
+                if len(preview) < preview_chars:
+                    if not preview:
+                        chunk = chunk.lstrip()
+                    preview += chunk[:preview_chars - len(preview)]
+        if not preview.strip():
+            dst_path.unlink()
+        return total, preview
+
+    def _lookup_cache(self, file_path: Path, force_refresh: bool = False) -> Tuple[Optional[Path], bool]:
+        """Return (cache file for file_path or None if caching is off, whether it already holds the text)."""
+        if self.cache_dir is None:
+            return None, False
+        try:
+            cache_path = self._cache_path(Path(file_path))
+            return cache_path, not force_refresh and cache_path.exists()
+        except OSError as e:
+            logger.warning("Text cache unavailable for %s: %s", file_path, e)
+            return None, False
+
+    def _store_cache(self, cache_path: Path, file_path: Path, text: str):
+        """Write extracted text to the cache atomically; errors are logged and ignored."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(text.encode('utf-8'))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache extracted text for %s: %s", file_path, e)
+
+    def _cache_path(self, file_path: Path) -> Path:
+        """Cache file for the extracted text of a file, keyed by its content and the OCR setting."""
+        digest = hashlib.sha256(file_path.read_bytes())
+        digest.update(b"\0ocr" if self.ocr else b"\0no-ocr")
+        key = digest.hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.md"
+
+    def _convert(self, file_path: Path) -> str:
+        """Run docling on a file and clean the result."""
         try:
             result = self.converter.convert(str(file_path))
             # Get the text content from the document
@@ -179,6 +361,54 @@ class DoclingTextExtractor:
         except Exception as e:
             raise RuntimeError(f"Failed to extract text from {file_path}: {str(e)}")
 
+    def extract_many(self, paths: List[Path], workers: Optional[int] = None) -> Dict[Path, str]:
+        """
+        Extract text from several files in parallel worker processes.
+
+        Each worker builds its own DocumentConverter once and reuses it for all
+        the files it is given. Use this for large batches of documents from a
+        single process; Step 1 already runs one process per application, so it
+        calls extract_text directly.
+
+        Args:
+            paths: Files to extract text from
+            workers: Number of worker processes (default: half the CPU count).
+                     Keep this low on a GPU, each worker loads its own models.
+
+        Returns:
+            Dictionary mapping each path to its extracted text
+
+        Raises:
+            RuntimeError: If extraction fails for any file
+        """
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) // 2)
+        workers = min(workers, len(paths))
+        if workers <= 1:
+            return {path: self.extract_text(path) for path in paths}
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_extract_worker,
+            initargs=(self.ocr, self.cache_dir)
+        ) as executor:
+            return dict(zip(paths, executor.map(_extract_in_worker, paths)))
+
+
+# Per-process extractor used by DoclingTextExtractor.extract_many workers
+_WORKER_EXTRACTOR: Optional[DoclingTextExtractor] = None
+
+
+def _init_extract_worker(ocr: bool, cache_dir: Optional[Path]) -> None:
+    """Build the worker's extractor (and its DocumentConverter) once at startup."""
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = DoclingTextExtractor(ocr=ocr, cache_dir=cache_dir)
+
+
+def _extract_in_worker(path: Path) -> str:
+    """Extract text from one file using the worker's extractor."""
+    return _WORKER_EXTRACTOR.extract_text(path)
+
 
 class AttachmentClassifier:
     """
@@ -198,13 +428,27 @@ class AttachmentClassifier:
         self.model_name = model_name
         self.ollama_host = ollama_host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
-    def classify_attachment(self, file_path: Path, extracted_text: str, filename: str) -> Dict:
+    # Length of the extracted-text snippet callers pass to classify_attachment
+    SNIPPET_CHARS = 2000
+
+    def classify_attachment(
+        self,
+        file_path: Path,
+        extracted_text_snippet: str,
+        extracted_text_len: int,
+        filename: str,
+    ) -> Dict:
         """
         Classify an attachment file into one of the categories using naming convention.
     
+        Only a snippet of the extracted text is needed, so callers can free the
+        full text once it has been written to disk.
+    
         Args:
             file_path: Path to the attachment file.
-            extracted_text: Extracted text from the file (unused but kept for compatibility).
+            extracted_text_snippet: Leading text of the extraction with leading whitespace
+                stripped, at most SNIPPET_CHARS characters (e.g. ``text.lstrip()[:SNIPPET_CHARS]``).
+            extracted_text_len: Length of the full extracted text.
             filename: Name of the file.
     
         Returns:
@@ -213,7 +457,7 @@ class AttachmentClassifier:
         # Determine file type from extension
         file_ext = file_path.suffix.lower()
         is_image = file_ext in [".png", ".jpg", ".jpeg"]
-        has_text = len(extracted_text.strip()) > 0
+        has_text = bool(extracted_text_snippet.strip())
     
         # Infer attachment index from filename using the same FILE_PATTERN as ApplicationFileProcessor
         attachment_index: Optional[int] = None
@@ -258,7 +502,7 @@ class AttachmentClassifier:
             "file_extension": file_ext,
             "has_text": has_text,
             "is_image": is_image,
-            "text_length": len(extracted_text) if extracted_text else 0,
+            "text_length": extracted_text_len,
         }
     
         return result
@@ -8,8 +8,9 @@ number of worker processes. Supports both single-process and multi-process execu
 
 import os
 import logging
+import multiprocessing
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-from typing import Callable, List, Any, Optional, Dict
+from typing import Callable, Iterator, List, Any, Optional, Dict
 from functools import partial
 
 
@@ -41,7 +42,10 @@ class ProcessingPool:
         self,
         num_workers: Optional[int] = None,
         use_threading: bool = False,
-        verbose: bool = True
+        verbose: bool = True,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: tuple = (),
+        start_method: Optional[str] = None
     ):
         """
         Initialize the processing pool.
@@ -55,10 +59,19 @@ class ProcessingPool:
                           If False, use ProcessPoolExecutor (for CPU-bound tasks).
                           Only applies if num_workers > 0.
             verbose: Enable logging of pool status
+            initializer: Optional callable run once in each worker before it takes
+                        any items (once in the current process in sequential mode),
+                        e.g. to load models shared by every item
+            initargs: Arguments passed to initializer
+            start_method: Optional multiprocessing start method for worker processes
+                        ("fork", "spawn" or "forkserver"; default: the platform default)
         """
         self.num_workers = num_workers
         self.use_threading = use_threading
         self.verbose = verbose
+        self.initializer = initializer
+        self.initargs = initargs
+        self.start_method = start_method
         self.executor = None
         self.use_sequential = (num_workers is None or num_workers <= 0)
 
@@ -78,9 +91,17 @@ class ProcessingPool:
         """Context manager entry."""
         if not self.use_sequential:
             if self.use_threading:
-                self.executor = ThreadPoolExecutor(max_workers=self.num_workers)
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.num_workers, initializer=self.initializer, initargs=self.initargs
+                )
             else:
-                self.executor = ProcessPoolExecutor(max_workers=self.num_workers)
+                mp_context = multiprocessing.get_context(self.start_method) if self.start_method else None
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.num_workers, mp_context=mp_context,
+                    initializer=self.initializer, initargs=self.initargs
+                )
+        elif self.initializer is not None:
+            self.initializer(*self.initargs)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -109,17 +130,39 @@ class ProcessingPool:
         Returns:
             List of results (order may differ from input if using parallel execution)
         """
+        return list(self.imap_unordered(func, iterable, show_progress))
+
+    def imap_unordered(
+        self,
+        func: Callable,
+        iterable: List[Any],
+        show_progress: bool = False
+    ) -> Iterator[Any]:
+        """
+        Like map_unordered, but yield each result as soon as it is available.
+
+        Lets callers stream results (e.g. to a file) without keeping them all in memory.
+        Failed items yield {"success": False, "error": ..., "item": ...}.
+
+        Args:
+            func: Function to apply to each item
+            iterable: List of items to process
+            show_progress: If True, print progress updates (requires tqdm)
+
+        Yields:
+            Results (order may differ from input if using parallel execution)
+        """
         if self.use_sequential:
-            return self._sequential_map(func, iterable, show_progress)
+            return self._sequential_iter(func, iterable, show_progress)
         else:
-            return self._parallel_map(func, iterable, show_progress)
+            return self._parallel_iter(func, iterable, show_progress)
 
-    def _sequential_map(
+    def _sequential_iter(
         self,
         func: Callable,
         iterable: List[Any],
         show_progress: bool = False
-    ) -> List[Any]:
+    ) -> Iterator[Any]:
         """
         Process items sequentially (fallback for num_workers=0).
 
@@ -128,11 +171,9 @@ class ProcessingPool:
             iterable: Items to process
             show_progress: Show progress updates
 
-        Returns:
-            List of results in same order as input
+        Yields:
+            Results in same order as input
         """
-        results = []
-
         if show_progress:
             try:
                 from tqdm import tqdm
@@ -145,24 +186,21 @@ class ProcessingPool:
 
         for item in iterator:
             try:
-                result = func(item)
-                results.append(result)
+                yield func(item)
             except Exception as e:
                 logger.error(f"Error processing {item}: {str(e)}")
-                results.append({
+                yield {
                     "success": False,
                     "error": str(e),
                     "item": str(item)
-                })
-
-        return results
+                }
 
-    def _parallel_map(
+    def _parallel_iter(
         self,
         func: Callable,
         iterable: List[Any],
         show_progress: bool = False
-    ) -> List[Any]:
+    ) -> Iterator[Any]:
         """
         Process items in parallel using executor.
 
@@ -171,10 +209,9 @@ class ProcessingPool:
             iterable: Items to process
             show_progress: Show progress updates
 
-        Returns:
-            List of results (may be in different order than input)
+        Yields:
+            Results as they complete (may be in different order than input)
         """
-        results = []
         futures = {
             self.executor.submit(func, item): item
             for item in iterable
@@ -195,19 +232,16 @@ class ProcessingPool:
             futures_iter = as_completed(futures)
 
         for future in futures_iter:
-            item = futures[future]
+            item = futures.pop(future)
             try:
-                result = future.result()
-                results.append(result)
+                yield future.result()
             except Exception as e:
                 logger.error(f"Error processing {item}: {str(e)}")
-                results.append({
+                yield {
                     "success": False,
                     "error": str(e),
                     "item": str(item)
-                })
-
-        return results
+                }
 
     def map_with_callback(
         self,
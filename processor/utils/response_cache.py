@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for parsed LLM responses.
+
+Entries are keyed by a SHA256 of (model name, system message, output schema,
+generation options, prompt) so that
+re-running an analysis on an unchanged application package skips the Ollama
+call entirely. Each entry is a small JSON file written atomically, which makes
+the cache safe to share between worker processes and across runs.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from processor.utils import json_utils
+
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every existing cache entry
+CACHE_VERSION = "2"
+
+
+class ResponseCache:
+    """
+    Exact-match cache of parsed agent responses stored as JSON files.
+
+    Usage:
+        cache = ResponseCache.from_env()
+        key = cache.make_key(model_name, prompt, system_message, schema, options)
+        result = cache.get(key)
+        if result is None:
+            result = run_llm(...)
+            cache.set(key, result)
+    """
+
+    def __init__(self, cache_dir: Path, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cache entries are stored
+            enabled: If False, get() always misses and set() is a no-op
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """
+        Create a cache configured from environment variables.
+
+        LLM_CACHE_DIR sets the directory (default: .cache/llm) and
+        LLM_CACHE_ENABLED=false disables caching.
+        """
+        cache_dir = Path(os.getenv("LLM_CACHE_DIR", ".cache/llm"))
+        enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+        return cls(cache_dir, enabled=enabled)
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        prompt: str,
+        system_message: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        Covers everything that shapes the response: the model, system message and
+        prompt, plus the output schema (Ollama's format) and the generation options,
+        so changing either invalidates earlier entries. CACHE_VERSION is mixed in so
+        a change to the stored format can invalidate the whole cache.
+        """
+        digest = hashlib.sha256()
+        digest.update(CACHE_VERSION.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((system_message or "").encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(json_utils.dumps_bytes(schema, sort_keys=True))
+        digest.update(b"\0")
+        digest.update(json_utils.dumps_bytes(options, sort_keys=True))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small on large runs
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            The cached dictionary, or None on a miss or unreadable entry
+        """
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            return json_utils.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a response. Errors are logged and otherwise ignored.
+        """
+        if not self.enabled:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(json_utils.dumps_bytes(value))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Could not write cache entry %s: %s", path, e)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Compiled JSON schema validators for agent outputs.
+
+fastjsonschema turns a schema into straight-line Python code specialized to
+its exact shape, which validates far faster than jsonschema walking the
+schema dict on every call. generate_schemas.py writes these validators as
+<schema name>_validator.py modules next to the JSON schemas; when no
+up-to-date module exists the schema is compiled in memory instead.
+
+If the optional jsonschema-rs package (native Rust validator) is installed
+it is preferred over both. Without either, a reusable jsonschema validator
+is returned.
+
+All validators raise jsonschema.ValidationError so callers do not need to
+know which implementation is in use.
+"""
+
+import logging
+import importlib.util
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
+
+try:
+    import jsonschema_rs
+except ImportError:  # pragma: no cover - optional dependency
+    jsonschema_rs = None
+
+
+logger = logging.getLogger(__name__)
+
+Validator = Callable[[Any], None]
+
+
+def validator_module_path(schema_path: Path) -> Path:
+    """Path of the generated validator module for a schema file."""
+    schema_path = Path(schema_path)
+    return schema_path.with_name(f"{schema_path.stem}_validator.py")
+
+
+def write_validator_module(schema: Dict[str, Any], schema_path: Path) -> Optional[Path]:
+    """
+    Generate the validator module for a schema next to its JSON file.
+
+    Args:
+        schema: JSON schema
+        schema_path: Path of the schema's JSON file
+
+    Returns:
+        Path of the written module, or None if fastjsonschema is not installed
+    """
+    if fastjsonschema is None:
+        return None
+    module_path = validator_module_path(schema_path)
+    code = fastjsonschema.compile_to_code(schema)
+    with open(module_path, 'w', encoding='utf-8') as f:
+        f.write(code)
+    return module_path
+
+
+def _import_validator_module(module_path: Path) -> Optional[Validator]:
+    """Import a generated validator module and return its validate function."""
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, "validate", None)
+
+
+def load_validator(schema: Dict[str, Any], schema_path: Optional[Path] = None) -> Validator:
+    """
+    Build a validate(instance) function for a schema.
+
+    Args:
+        schema: JSON schema
+        schema_path: Optional path of the schema's JSON file; a generated
+                     validator module next to it is used if it is not older
+                     than the schema (fastjsonschema only)
+
+    Returns:
+        Callable raising jsonschema.ValidationError for invalid instances
+    """
+    if jsonschema_rs is not None:
+        native = jsonschema_rs.validator_for(schema)
+
+        def _validate_native(instance: Any) -> None:
+            try:
+                native.validate(instance)
+            except jsonschema_rs.ValidationError as e:
+                raise ValidationError(str(e)) from None
+
+        return _validate_native
+
+    if fastjsonschema is None:
+        # Build the validator once rather than re-checking the schema on every call
+        return validator_for(schema)(schema).validate
+
+    compiled = None
+    if schema_path is not None:
+        module_path = validator_module_path(schema_path)
+        try:
+            if module_path.stat().st_mtime >= Path(schema_path).stat().st_mtime:
+                compiled = _import_validator_module(module_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Could not load validator module %s: %s", module_path, e)
+    if compiled is None:
+        compiled = fastjsonschema.compile(schema)
+
+    def _validate(instance: Any) -> None:
+        try:
+            compiled(instance)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValidationError(str(e)) from None
+
+    return _validate
@@ -0,0 +1,153 @@
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Academic Agent Output Schema', 'description': 'Schema for AcademicAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'current_school_name': {'type': ['string', 'null']}, 'program': {'type': ['string', 'null']}, 'education_level': {'type': ['string', 'null']}, 'gpa': {'type': ['string', 'null']}, 'academic_awards': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'relevant_courses': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'academic_trajectory': {'type': ['string', 'null']}, 'strengths': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'areas_for_improvement': {'type': 'array', 'items': {'type': ['string', 'null']}}}}, 'scores': {'type': 'object', 'properties': {'academic_performance_score': {'type': ['integer', 'number']}, 'academic_relevance_score': {'type': ['integer', 'number']}, 'academic_readiness_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'academic_performance_score_reasoning': {'type': 'string'}, 'academic_relevance_score_reasoning': {'type': 'string'}, 'academic_readiness_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['summary', 'profile_features', 'scores']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Academic Agent Output Schema', 'description': 'Schema for AcademicAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'current_school_name': {'type': ['string', 'null']}, 'program': {'type': ['string', 'null']}, 'education_level': {'type': ['string', 'null']}, 'gpa': {'type': ['string', 'null']}, 'academic_awards': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'relevant_courses': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'academic_trajectory': {'type': ['string', 'null']}, 'strengths': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'areas_for_improvement': {'type': 'array', 'items': {'type': ['string', 'null']}}}}, 'scores': {'type': 'object', 'properties': {'academic_performance_score': {'type': ['integer', 'number']}, 'academic_relevance_score': {'type': ['integer', 'number']}, 'academic_readiness_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'academic_performance_score_reasoning': {'type': 'string'}, 'academic_relevance_score_reasoning': {'type': 'string'}, 'academic_readiness_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='required')
+        data_keys = set(data.keys())
+        if "summary" in data_keys:
+            data_keys.remove("summary")
+            data__summary = data["summary"]
+            if not isinstance(data__summary, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary must be string", value=data__summary, name="" + (name_prefix or "data") + ".summary", definition={'type': 'string'}, rule='type')
+        if "profile_features" in data_keys:
+            data_keys.remove("profile_features")
+            data__profilefeatures = data["profile_features"]
+            if not isinstance(data__profilefeatures, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features must be object", value=data__profilefeatures, name="" + (name_prefix or "data") + ".profile_features", definition={'type': 'object', 'properties': {'current_school_name': {'type': ['string', 'null']}, 'program': {'type': ['string', 'null']}, 'education_level': {'type': ['string', 'null']}, 'gpa': {'type': ['string', 'null']}, 'academic_awards': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'relevant_courses': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'academic_trajectory': {'type': ['string', 'null']}, 'strengths': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'areas_for_improvement': {'type': 'array', 'items': {'type': ['string', 'null']}}}}, rule='type')
+            data__profilefeatures_is_dict = isinstance(data__profilefeatures, dict)
+            if data__profilefeatures_is_dict:
+                data__profilefeatures_keys = set(data__profilefeatures.keys())
+                if "current_school_name" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("current_school_name")
+                    data__profilefeatures__currentschoolname = data__profilefeatures["current_school_name"]
+                    if not isinstance(data__profilefeatures__currentschoolname, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.current_school_name must be string or null", value=data__profilefeatures__currentschoolname, name="" + (name_prefix or "data") + ".profile_features.current_school_name", definition={'type': ['string', 'null']}, rule='type')
+                if "program" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("program")
+                    data__profilefeatures__program = data__profilefeatures["program"]
+                    if not isinstance(data__profilefeatures__program, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.program must be string or null", value=data__profilefeatures__program, name="" + (name_prefix or "data") + ".profile_features.program", definition={'type': ['string', 'null']}, rule='type')
+                if "education_level" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("education_level")
+                    data__profilefeatures__educationlevel = data__profilefeatures["education_level"]
+                    if not isinstance(data__profilefeatures__educationlevel, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.education_level must be string or null", value=data__profilefeatures__educationlevel, name="" + (name_prefix or "data") + ".profile_features.education_level", definition={'type': ['string', 'null']}, rule='type')
+                if "gpa" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("gpa")
+                    data__profilefeatures__gpa = data__profilefeatures["gpa"]
+                    if not isinstance(data__profilefeatures__gpa, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.gpa must be string or null", value=data__profilefeatures__gpa, name="" + (name_prefix or "data") + ".profile_features.gpa", definition={'type': ['string', 'null']}, rule='type')
+                if "academic_awards" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("academic_awards")
+                    data__profilefeatures__academicawards = data__profilefeatures["academic_awards"]
+                    if not isinstance(data__profilefeatures__academicawards, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.academic_awards must be array", value=data__profilefeatures__academicawards, name="" + (name_prefix or "data") + ".profile_features.academic_awards", definition={'type': 'array', 'items': {'type': ['string', 'null']}}, rule='type')
+                    data__profilefeatures__academicawards_is_list = isinstance(data__profilefeatures__academicawards, (list, tuple))
+                    if data__profilefeatures__academicawards_is_list:
+                        data__profilefeatures__academicawards_len = len(data__profilefeatures__academicawards)
+                        for data__profilefeatures__academicawards_x, data__profilefeatures__academicawards_item in enumerate(data__profilefeatures__academicawards):
+                            if not isinstance(data__profilefeatures__academicawards_item, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.academic_awards[{data__profilefeatures__academicawards_x}]".format(**locals()) + " must be string or null", value=data__profilefeatures__academicawards_item, name="" + (name_prefix or "data") + ".profile_features.academic_awards[{data__profilefeatures__academicawards_x}]".format(**locals()) + "", definition={'type': ['string', 'null']}, rule='type')
+                if "relevant_courses" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("relevant_courses")
+                    data__profilefeatures__relevantcourses = data__profilefeatures["relevant_courses"]
+                    if not isinstance(data__profilefeatures__relevantcourses, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.relevant_courses must be array", value=data__profilefeatures__relevantcourses, name="" + (name_prefix or "data") + ".profile_features.relevant_courses", definition={'type': 'array', 'items': {'type': ['string', 'null']}}, rule='type')
+                    data__profilefeatures__relevantcourses_is_list = isinstance(data__profilefeatures__relevantcourses, (list, tuple))
+                    if data__profilefeatures__relevantcourses_is_list:
+                        data__profilefeatures__relevantcourses_len = len(data__profilefeatures__relevantcourses)
+                        for data__profilefeatures__relevantcourses_x, data__profilefeatures__relevantcourses_item in enumerate(data__profilefeatures__relevantcourses):
+                            if not isinstance(data__profilefeatures__relevantcourses_item, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.relevant_courses[{data__profilefeatures__relevantcourses_x}]".format(**locals()) + " must be string or null", value=data__profilefeatures__relevantcourses_item, name="" + (name_prefix or "data") + ".profile_features.relevant_courses[{data__profilefeatures__relevantcourses_x}]".format(**locals()) + "", definition={'type': ['string', 'null']}, rule='type')
+                if "academic_trajectory" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("academic_trajectory")
+                    data__profilefeatures__academictrajectory = data__profilefeatures["academic_trajectory"]
+                    if not isinstance(data__profilefeatures__academictrajectory, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.academic_trajectory must be string or null", value=data__profilefeatures__academictrajectory, name="" + (name_prefix or "data") + ".profile_features.academic_trajectory", definition={'type': ['string', 'null']}, rule='type')
+                if "strengths" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("strengths")
+                    data__profilefeatures__strengths = data__profilefeatures["strengths"]
+                    if not isinstance(data__profilefeatures__strengths, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.strengths must be array", value=data__profilefeatures__strengths, name="" + (name_prefix or "data") + ".profile_features.strengths", definition={'type': 'array', 'items': {'type': ['string', 'null']}}, rule='type')
+                    data__profilefeatures__strengths_is_list = isinstance(data__profilefeatures__strengths, (list, tuple))
+                    if data__profilefeatures__strengths_is_list:
+                        data__profilefeatures__strengths_len = len(data__profilefeatures__strengths)
+                        for data__profilefeatures__strengths_x, data__profilefeatures__strengths_item in enumerate(data__profilefeatures__strengths):
+                            if not isinstance(data__profilefeatures__strengths_item, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.strengths[{data__profilefeatures__strengths_x}]".format(**locals()) + " must be string or null", value=data__profilefeatures__strengths_item, name="" + (name_prefix or "data") + ".profile_features.strengths[{data__profilefeatures__strengths_x}]".format(**locals()) + "", definition={'type': ['string', 'null']}, rule='type')
+                if "areas_for_improvement" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("areas_for_improvement")
+                    data__profilefeatures__areasforimprovement = data__profilefeatures["areas_for_improvement"]
+                    if not isinstance(data__profilefeatures__areasforimprovement, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.areas_for_improvement must be array", value=data__profilefeatures__areasforimprovement, name="" + (name_prefix or "data") + ".profile_features.areas_for_improvement", definition={'type': 'array', 'items': {'type': ['string', 'null']}}, rule='type')
+                    data__profilefeatures__areasforimprovement_is_list = isinstance(data__profilefeatures__areasforimprovement, (list, tuple))
+                    if data__profilefeatures__areasforimprovement_is_list:
+                        data__profilefeatures__areasforimprovement_len = len(data__profilefeatures__areasforimprovement)
+                        for data__profilefeatures__areasforimprovement_x, data__profilefeatures__areasforimprovement_item in enumerate(data__profilefeatures__areasforimprovement):
+                            if not isinstance(data__profilefeatures__areasforimprovement_item, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.areas_for_improvement[{data__profilefeatures__areasforimprovement_x}]".format(**locals()) + " must be string or null", value=data__profilefeatures__areasforimprovement_item, name="" + (name_prefix or "data") + ".profile_features.areas_for_improvement[{data__profilefeatures__areasforimprovement_x}]".format(**locals()) + "", definition={'type': ['string', 'null']}, rule='type')
+        if "scores" in data_keys:
+            data_keys.remove("scores")
+            data__scores = data["scores"]
+            if not isinstance(data__scores, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must be object", value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'academic_performance_score': {'type': ['integer', 'number']}, 'academic_relevance_score': {'type': ['integer', 'number']}, 'academic_readiness_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, rule='type')
+            data__scores_is_dict = isinstance(data__scores, dict)
+            if data__scores_is_dict:
+                data__scores__missing_keys = set(['overall_score']) - data__scores.keys()
+                if data__scores__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must contain " + (str(sorted(data__scores__missing_keys)) + " properties"), value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'academic_performance_score': {'type': ['integer', 'number']}, 'academic_relevance_score': {'type': ['integer', 'number']}, 'academic_readiness_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, rule='required')
+                data__scores_keys = set(data__scores.keys())
+                if "academic_performance_score" in data__scores_keys:
+                    data__scores_keys.remove("academic_performance_score")
+                    data__scores__academicperformancescore = data__scores["academic_performance_score"]
+                    if not isinstance(data__scores__academicperformancescore, (int, int, float, Decimal)) and not (isinstance(data__scores__academicperformancescore, float) and data__scores__academicperformancescore.is_integer()) or isinstance(data__scores__academicperformancescore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.academic_performance_score must be integer or number", value=data__scores__academicperformancescore, name="" + (name_prefix or "data") + ".scores.academic_performance_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "academic_relevance_score" in data__scores_keys:
+                    data__scores_keys.remove("academic_relevance_score")
+                    data__scores__academicrelevancescore = data__scores["academic_relevance_score"]
+                    if not isinstance(data__scores__academicrelevancescore, (int, int, float, Decimal)) and not (isinstance(data__scores__academicrelevancescore, float) and data__scores__academicrelevancescore.is_integer()) or isinstance(data__scores__academicrelevancescore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.academic_relevance_score must be integer or number", value=data__scores__academicrelevancescore, name="" + (name_prefix or "data") + ".scores.academic_relevance_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "academic_readiness_score" in data__scores_keys:
+                    data__scores_keys.remove("academic_readiness_score")
+                    data__scores__academicreadinessscore = data__scores["academic_readiness_score"]
+                    if not isinstance(data__scores__academicreadinessscore, (int, int, float, Decimal)) and not (isinstance(data__scores__academicreadinessscore, float) and data__scores__academicreadinessscore.is_integer()) or isinstance(data__scores__academicreadinessscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.academic_readiness_score must be integer or number", value=data__scores__academicreadinessscore, name="" + (name_prefix or "data") + ".scores.academic_readiness_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "overall_score" in data__scores_keys:
+                    data__scores_keys.remove("overall_score")
+                    data__scores__overallscore = data__scores["overall_score"]
+                    if not isinstance(data__scores__overallscore, (int, int, float, Decimal)) and not (isinstance(data__scores__overallscore, float) and data__scores__overallscore.is_integer()) or isinstance(data__scores__overallscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.overall_score must be integer or number", value=data__scores__overallscore, name="" + (name_prefix or "data") + ".scores.overall_score", definition={'type': ['integer', 'number']}, rule='type')
+        if "score_breakdown" in data_keys:
+            data_keys.remove("score_breakdown")
+            data__scorebreakdown = data["score_breakdown"]
+            if not isinstance(data__scorebreakdown, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown must be object", value=data__scorebreakdown, name="" + (name_prefix or "data") + ".score_breakdown", definition={'type': 'object', 'properties': {'academic_performance_score_reasoning': {'type': 'string'}, 'academic_relevance_score_reasoning': {'type': 'string'}, 'academic_readiness_score_reasoning': {'type': 'string'}}}, rule='type')
+            data__scorebreakdown_is_dict = isinstance(data__scorebreakdown, dict)
+            if data__scorebreakdown_is_dict:
+                data__scorebreakdown_keys = set(data__scorebreakdown.keys())
+                if "academic_performance_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("academic_performance_score_reasoning")
+                    data__scorebreakdown__academicperformancescorereasoning = data__scorebreakdown["academic_performance_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__academicperformancescorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.academic_performance_score_reasoning must be string", value=data__scorebreakdown__academicperformancescorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.academic_performance_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "academic_relevance_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("academic_relevance_score_reasoning")
+                    data__scorebreakdown__academicrelevancescorereasoning = data__scorebreakdown["academic_relevance_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__academicrelevancescorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.academic_relevance_score_reasoning must be string", value=data__scorebreakdown__academicrelevancescorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.academic_relevance_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "academic_readiness_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("academic_readiness_score_reasoning")
+                    data__scorebreakdown__academicreadinessscorereasoning = data__scorebreakdown["academic_readiness_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__academicreadinessscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.academic_readiness_score_reasoning must be string", value=data__scorebreakdown__academicreadinessscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.academic_readiness_score_reasoning", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
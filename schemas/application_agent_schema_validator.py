@@ -0,0 +1,262 @@
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Application Agent Output Schema', 'description': 'Schema for ApplicationAgent output structure', 'type': 'object', 'properties': {'profile': {'type': 'object', 'properties': {'wai_membership_number': {'type': ['string', 'null']}, 'wai_application_number': {'type': ['string', 'null']}, 'first_name': {'type': ['string', 'null']}, 'middle_name': {'type': ['string', 'null']}, 'last_name': {'type': ['string', 'null']}, 'email': {'type': ['string', 'null']}, 'membership_since': {'type': ['string', 'null']}, 'membership_expiration': {'type': ['string', 'null']}, 'home_address': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}, 'home_phone': {'type': ['string', 'null']}, 'work_phone': {'type': ['string', 'null']}}}, 'school_information': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'school_name': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}}}, 'completeness': {'type': 'object', 'properties': {'has_resume': {'type': 'boolean'}, 'has_essay': {'type': 'boolean'}, 'num_recommendation_letters': {'type': ['integer', 'null']}, 'has_medical_certificate': {'type': ['boolean', 'null']}, 'has_logbook': {'type': ['boolean', 'null']}, 'num_attachments': {'type': ['integer', 'null']}}}}, 'required': []}, 'summary': {'type': 'string'}, 'scores': {'type': 'object', 'properties': {'overall_score': {'type': ['integer', 'number']}, 'completeness_score': {'type': ['integer', 'number']}, 'score_breakdown': {'type': 'object', 'properties': {'profile_information': {'type': ['string', 'number']}, 'contact_information': {'type': ['string', 'number']}, 'school_information': {'type': ['string', 'number']}, 'supporting_documents': {'type': ['string', 'number']}}}, 'missing_items': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_score', 'completeness_score']}}, 'required': ['profile', 'summary', 'scores']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['profile', 'summary', 'scores']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Application Agent Output Schema', 'description': 'Schema for ApplicationAgent output structure', 'type': 'object', 'properties': {'profile': {'type': 'object', 'properties': {'wai_membership_number': {'type': ['string', 'null']}, 'wai_application_number': {'type': ['string', 'null']}, 'first_name': {'type': ['string', 'null']}, 'middle_name': {'type': ['string', 'null']}, 'last_name': {'type': ['string', 'null']}, 'email': {'type': ['string', 'null']}, 'membership_since': {'type': ['string', 'null']}, 'membership_expiration': {'type': ['string', 'null']}, 'home_address': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}, 'home_phone': {'type': ['string', 'null']}, 'work_phone': {'type': ['string', 'null']}}}, 'school_information': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'school_name': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}}}, 'completeness': {'type': 'object', 'properties': {'has_resume': {'type': 'boolean'}, 'has_essay': {'type': 'boolean'}, 'num_recommendation_letters': {'type': ['integer', 'null']}, 'has_medical_certificate': {'type': ['boolean', 'null']}, 'has_logbook': {'type': ['boolean', 'null']}, 'num_attachments': {'type': ['integer', 'null']}}}}, 'required': []}, 'summary': {'type': 'string'}, 'scores': {'type': 'object', 'properties': {'overall_score': {'type': ['integer', 'number']}, 'completeness_score': {'type': ['integer', 'number']}, 'score_breakdown': {'type': 'object', 'properties': {'profile_information': {'type': ['string', 'number']}, 'contact_information': {'type': ['string', 'number']}, 'school_information': {'type': ['string', 'number']}, 'supporting_documents': {'type': ['string', 'number']}}}, 'missing_items': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_score', 'completeness_score']}}, 'required': ['profile', 'summary', 'scores']}, rule='required')
+        data_keys = set(data.keys())
+        if "profile" in data_keys:
+            data_keys.remove("profile")
+            data__profile = data["profile"]
+            if not isinstance(data__profile, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile must be object", value=data__profile, name="" + (name_prefix or "data") + ".profile", definition={'type': 'object', 'properties': {'wai_membership_number': {'type': ['string', 'null']}, 'wai_application_number': {'type': ['string', 'null']}, 'first_name': {'type': ['string', 'null']}, 'middle_name': {'type': ['string', 'null']}, 'last_name': {'type': ['string', 'null']}, 'email': {'type': ['string', 'null']}, 'membership_since': {'type': ['string', 'null']}, 'membership_expiration': {'type': ['string', 'null']}, 'home_address': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}, 'home_phone': {'type': ['string', 'null']}, 'work_phone': {'type': ['string', 'null']}}}, 'school_information': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'school_name': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}}}, 'completeness': {'type': 'object', 'properties': {'has_resume': {'type': 'boolean'}, 'has_essay': {'type': 'boolean'}, 'num_recommendation_letters': {'type': ['integer', 'null']}, 'has_medical_certificate': {'type': ['boolean', 'null']}, 'has_logbook': {'type': ['boolean', 'null']}, 'num_attachments': {'type': ['integer', 'null']}}}}, 'required': []}, rule='type')
+            data__profile_is_dict = isinstance(data__profile, dict)
+            if data__profile_is_dict:
+                data__profile__missing_keys = set([]) - data__profile.keys()
+                if data__profile__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile must contain " + (str(sorted(data__profile__missing_keys)) + " properties"), value=data__profile, name="" + (name_prefix or "data") + ".profile", definition={'type': 'object', 'properties': {'wai_membership_number': {'type': ['string', 'null']}, 'wai_application_number': {'type': ['string', 'null']}, 'first_name': {'type': ['string', 'null']}, 'middle_name': {'type': ['string', 'null']}, 'last_name': {'type': ['string', 'null']}, 'email': {'type': ['string', 'null']}, 'membership_since': {'type': ['string', 'null']}, 'membership_expiration': {'type': ['string', 'null']}, 'home_address': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}, 'home_phone': {'type': ['string', 'null']}, 'work_phone': {'type': ['string', 'null']}}}, 'school_information': {'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'school_name': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}}}, 'completeness': {'type': 'object', 'properties': {'has_resume': {'type': 'boolean'}, 'has_essay': {'type': 'boolean'}, 'num_recommendation_letters': {'type': ['integer', 'null']}, 'has_medical_certificate': {'type': ['boolean', 'null']}, 'has_logbook': {'type': ['boolean', 'null']}, 'num_attachments': {'type': ['integer', 'null']}}}}, 'required': []}, rule='required')
+                data__profile_keys = set(data__profile.keys())
+                if "wai_membership_number" in data__profile_keys:
+                    data__profile_keys.remove("wai_membership_number")
+                    data__profile__waimembershipnumber = data__profile["wai_membership_number"]
+                    if not isinstance(data__profile__waimembershipnumber, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.wai_membership_number must be string or null", value=data__profile__waimembershipnumber, name="" + (name_prefix or "data") + ".profile.wai_membership_number", definition={'type': ['string', 'null']}, rule='type')
+                if "wai_application_number" in data__profile_keys:
+                    data__profile_keys.remove("wai_application_number")
+                    data__profile__waiapplicationnumber = data__profile["wai_application_number"]
+                    if not isinstance(data__profile__waiapplicationnumber, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.wai_application_number must be string or null", value=data__profile__waiapplicationnumber, name="" + (name_prefix or "data") + ".profile.wai_application_number", definition={'type': ['string', 'null']}, rule='type')
+                if "first_name" in data__profile_keys:
+                    data__profile_keys.remove("first_name")
+                    data__profile__firstname = data__profile["first_name"]
+                    if not isinstance(data__profile__firstname, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.first_name must be string or null", value=data__profile__firstname, name="" + (name_prefix or "data") + ".profile.first_name", definition={'type': ['string', 'null']}, rule='type')
+                if "middle_name" in data__profile_keys:
+                    data__profile_keys.remove("middle_name")
+                    data__profile__middlename = data__profile["middle_name"]
+                    if not isinstance(data__profile__middlename, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.middle_name must be string or null", value=data__profile__middlename, name="" + (name_prefix or "data") + ".profile.middle_name", definition={'type': ['string', 'null']}, rule='type')
+                if "last_name" in data__profile_keys:
+                    data__profile_keys.remove("last_name")
+                    data__profile__lastname = data__profile["last_name"]
+                    if not isinstance(data__profile__lastname, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.last_name must be string or null", value=data__profile__lastname, name="" + (name_prefix or "data") + ".profile.last_name", definition={'type': ['string', 'null']}, rule='type')
+                if "email" in data__profile_keys:
+                    data__profile_keys.remove("email")
+                    data__profile__email = data__profile["email"]
+                    if not isinstance(data__profile__email, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.email must be string or null", value=data__profile__email, name="" + (name_prefix or "data") + ".profile.email", definition={'type': ['string', 'null']}, rule='type')
+                if "membership_since" in data__profile_keys:
+                    data__profile_keys.remove("membership_since")
+                    data__profile__membershipsince = data__profile["membership_since"]
+                    if not isinstance(data__profile__membershipsince, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.membership_since must be string or null", value=data__profile__membershipsince, name="" + (name_prefix or "data") + ".profile.membership_since", definition={'type': ['string', 'null']}, rule='type')
+                if "membership_expiration" in data__profile_keys:
+                    data__profile_keys.remove("membership_expiration")
+                    data__profile__membershipexpiration = data__profile["membership_expiration"]
+                    if not isinstance(data__profile__membershipexpiration, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.membership_expiration must be string or null", value=data__profile__membershipexpiration, name="" + (name_prefix or "data") + ".profile.membership_expiration", definition={'type': ['string', 'null']}, rule='type')
+                if "home_address" in data__profile_keys:
+                    data__profile_keys.remove("home_address")
+                    data__profile__homeaddress = data__profile["home_address"]
+                    if not isinstance(data__profile__homeaddress, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address must be object", value=data__profile__homeaddress, name="" + (name_prefix or "data") + ".profile.home_address", definition={'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}, 'home_phone': {'type': ['string', 'null']}, 'work_phone': {'type': ['string', 'null']}}}, rule='type')
+                    data__profile__homeaddress_is_dict = isinstance(data__profile__homeaddress, dict)
+                    if data__profile__homeaddress_is_dict:
+                        data__profile__homeaddress_keys = set(data__profile__homeaddress.keys())
+                        if "country" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("country")
+                            data__profile__homeaddress__country = data__profile__homeaddress["country"]
+                            if not isinstance(data__profile__homeaddress__country, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.country must be string or null", value=data__profile__homeaddress__country, name="" + (name_prefix or "data") + ".profile.home_address.country", definition={'type': ['string', 'null']}, rule='type')
+                        if "address_1" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("address_1")
+                            data__profile__homeaddress__address1 = data__profile__homeaddress["address_1"]
+                            if not isinstance(data__profile__homeaddress__address1, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.address_1 must be string or null", value=data__profile__homeaddress__address1, name="" + (name_prefix or "data") + ".profile.home_address.address_1", definition={'type': ['string', 'null']}, rule='type')
+                        if "address_2" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("address_2")
+                            data__profile__homeaddress__address2 = data__profile__homeaddress["address_2"]
+                            if not isinstance(data__profile__homeaddress__address2, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.address_2 must be string or null", value=data__profile__homeaddress__address2, name="" + (name_prefix or "data") + ".profile.home_address.address_2", definition={'type': ['string', 'null']}, rule='type')
+                        if "city" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("city")
+                            data__profile__homeaddress__city = data__profile__homeaddress["city"]
+                            if not isinstance(data__profile__homeaddress__city, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.city must be string or null", value=data__profile__homeaddress__city, name="" + (name_prefix or "data") + ".profile.home_address.city", definition={'type': ['string', 'null']}, rule='type')
+                        if "state_province" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("state_province")
+                            data__profile__homeaddress__stateprovince = data__profile__homeaddress["state_province"]
+                            if not isinstance(data__profile__homeaddress__stateprovince, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.state_province must be string or null", value=data__profile__homeaddress__stateprovince, name="" + (name_prefix or "data") + ".profile.home_address.state_province", definition={'type': ['string', 'null']}, rule='type')
+                        if "zip_postal_code" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("zip_postal_code")
+                            data__profile__homeaddress__zippostalcode = data__profile__homeaddress["zip_postal_code"]
+                            if not isinstance(data__profile__homeaddress__zippostalcode, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.zip_postal_code must be string or null", value=data__profile__homeaddress__zippostalcode, name="" + (name_prefix or "data") + ".profile.home_address.zip_postal_code", definition={'type': ['string', 'null']}, rule='type')
+                        if "home_phone" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("home_phone")
+                            data__profile__homeaddress__homephone = data__profile__homeaddress["home_phone"]
+                            if not isinstance(data__profile__homeaddress__homephone, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.home_phone must be string or null", value=data__profile__homeaddress__homephone, name="" + (name_prefix or "data") + ".profile.home_address.home_phone", definition={'type': ['string', 'null']}, rule='type')
+                        if "work_phone" in data__profile__homeaddress_keys:
+                            data__profile__homeaddress_keys.remove("work_phone")
+                            data__profile__homeaddress__workphone = data__profile__homeaddress["work_phone"]
+                            if not isinstance(data__profile__homeaddress__workphone, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.home_address.work_phone must be string or null", value=data__profile__homeaddress__workphone, name="" + (name_prefix or "data") + ".profile.home_address.work_phone", definition={'type': ['string', 'null']}, rule='type')
+                if "school_information" in data__profile_keys:
+                    data__profile_keys.remove("school_information")
+                    data__profile__schoolinformation = data__profile["school_information"]
+                    if not isinstance(data__profile__schoolinformation, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information must be object", value=data__profile__schoolinformation, name="" + (name_prefix or "data") + ".profile.school_information", definition={'type': 'object', 'properties': {'country': {'type': ['string', 'null']}, 'school_name': {'type': ['string', 'null']}, 'address_1': {'type': ['string', 'null']}, 'address_2': {'type': ['string', 'null']}, 'city': {'type': ['string', 'null']}, 'state_province': {'type': ['string', 'null']}, 'zip_postal_code': {'type': ['string', 'null']}}}, rule='type')
+                    data__profile__schoolinformation_is_dict = isinstance(data__profile__schoolinformation, dict)
+                    if data__profile__schoolinformation_is_dict:
+                        data__profile__schoolinformation_keys = set(data__profile__schoolinformation.keys())
+                        if "country" in data__profile__schoolinformation_keys:
+                            data__profile__schoolinformation_keys.remove("country")
+                            data__profile__schoolinformation__country = data__profile__schoolinformation["country"]
+                            if not isinstance(data__profile__schoolinformation__country, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information.country must be string or null", value=data__profile__schoolinformation__country, name="" + (name_prefix or "data") + ".profile.school_information.country", definition={'type': ['string', 'null']}, rule='type')
+                        if "school_name" in data__profile__schoolinformation_keys:
+                            data__profile__schoolinformation_keys.remove("school_name")
+                            data__profile__schoolinformation__schoolname = data__profile__schoolinformation["school_name"]
+                            if not isinstance(data__profile__schoolinformation__schoolname, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information.school_name must be string or null", value=data__profile__schoolinformation__schoolname, name="" + (name_prefix or "data") + ".profile.school_information.school_name", definition={'type': ['string', 'null']}, rule='type')
+                        if "address_1" in data__profile__schoolinformation_keys:
+                            data__profile__schoolinformation_keys.remove("address_1")
+                            data__profile__schoolinformation__address1 = data__profile__schoolinformation["address_1"]
+                            if not isinstance(data__profile__schoolinformation__address1, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information.address_1 must be string or null", value=data__profile__schoolinformation__address1, name="" + (name_prefix or "data") + ".profile.school_information.address_1", definition={'type': ['string', 'null']}, rule='type')
+                        if "address_2" in data__profile__schoolinformation_keys:
+                            data__profile__schoolinformation_keys.remove("address_2")
+                            data__profile__schoolinformation__address2 = data__profile__schoolinformation["address_2"]
+                            if not isinstance(data__profile__schoolinformation__address2, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information.address_2 must be string or null", value=data__profile__schoolinformation__address2, name="" + (name_prefix or "data") + ".profile.school_information.address_2", definition={'type': ['string', 'null']}, rule='type')
+                        if "city" in data__profile__schoolinformation_keys:
+                            data__profile__schoolinformation_keys.remove("city")
+                            data__profile__schoolinformation__city = data__profile__schoolinformation["city"]
+                            if not isinstance(data__profile__schoolinformation__city, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information.city must be string or null", value=data__profile__schoolinformation__city, name="" + (name_prefix or "data") + ".profile.school_information.city", definition={'type': ['string', 'null']}, rule='type')
+                        if "state_province" in data__profile__schoolinformation_keys:
+                            data__profile__schoolinformation_keys.remove("state_province")
+                            data__profile__schoolinformation__stateprovince = data__profile__schoolinformation["state_province"]
+                            if not isinstance(data__profile__schoolinformation__stateprovince, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information.state_province must be string or null", value=data__profile__schoolinformation__stateprovince, name="" + (name_prefix or "data") + ".profile.school_information.state_province", definition={'type': ['string', 'null']}, rule='type')
+                        if "zip_postal_code" in data__profile__schoolinformation_keys:
+                            data__profile__schoolinformation_keys.remove("zip_postal_code")
+                            data__profile__schoolinformation__zippostalcode = data__profile__schoolinformation["zip_postal_code"]
+                            if not isinstance(data__profile__schoolinformation__zippostalcode, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.school_information.zip_postal_code must be string or null", value=data__profile__schoolinformation__zippostalcode, name="" + (name_prefix or "data") + ".profile.school_information.zip_postal_code", definition={'type': ['string', 'null']}, rule='type')
+                if "completeness" in data__profile_keys:
+                    data__profile_keys.remove("completeness")
+                    data__profile__completeness = data__profile["completeness"]
+                    if not isinstance(data__profile__completeness, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.completeness must be object", value=data__profile__completeness, name="" + (name_prefix or "data") + ".profile.completeness", definition={'type': 'object', 'properties': {'has_resume': {'type': 'boolean'}, 'has_essay': {'type': 'boolean'}, 'num_recommendation_letters': {'type': ['integer', 'null']}, 'has_medical_certificate': {'type': ['boolean', 'null']}, 'has_logbook': {'type': ['boolean', 'null']}, 'num_attachments': {'type': ['integer', 'null']}}}, rule='type')
+                    data__profile__completeness_is_dict = isinstance(data__profile__completeness, dict)
+                    if data__profile__completeness_is_dict:
+                        data__profile__completeness_keys = set(data__profile__completeness.keys())
+                        if "has_resume" in data__profile__completeness_keys:
+                            data__profile__completeness_keys.remove("has_resume")
+                            data__profile__completeness__hasresume = data__profile__completeness["has_resume"]
+                            if not isinstance(data__profile__completeness__hasresume, (bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.completeness.has_resume must be boolean", value=data__profile__completeness__hasresume, name="" + (name_prefix or "data") + ".profile.completeness.has_resume", definition={'type': 'boolean'}, rule='type')
+                        if "has_essay" in data__profile__completeness_keys:
+                            data__profile__completeness_keys.remove("has_essay")
+                            data__profile__completeness__hasessay = data__profile__completeness["has_essay"]
+                            if not isinstance(data__profile__completeness__hasessay, (bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.completeness.has_essay must be boolean", value=data__profile__completeness__hasessay, name="" + (name_prefix or "data") + ".profile.completeness.has_essay", definition={'type': 'boolean'}, rule='type')
+                        if "num_recommendation_letters" in data__profile__completeness_keys:
+                            data__profile__completeness_keys.remove("num_recommendation_letters")
+                            data__profile__completeness__numrecommendationletters = data__profile__completeness["num_recommendation_letters"]
+                            if not isinstance(data__profile__completeness__numrecommendationletters, (int, NoneType)) and not (isinstance(data__profile__completeness__numrecommendationletters, float) and data__profile__completeness__numrecommendationletters.is_integer()) or isinstance(data__profile__completeness__numrecommendationletters, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.completeness.num_recommendation_letters must be integer or null", value=data__profile__completeness__numrecommendationletters, name="" + (name_prefix or "data") + ".profile.completeness.num_recommendation_letters", definition={'type': ['integer', 'null']}, rule='type')
+                        if "has_medical_certificate" in data__profile__completeness_keys:
+                            data__profile__completeness_keys.remove("has_medical_certificate")
+                            data__profile__completeness__hasmedicalcertificate = data__profile__completeness["has_medical_certificate"]
+                            if not isinstance(data__profile__completeness__hasmedicalcertificate, (bool, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.completeness.has_medical_certificate must be boolean or null", value=data__profile__completeness__hasmedicalcertificate, name="" + (name_prefix or "data") + ".profile.completeness.has_medical_certificate", definition={'type': ['boolean', 'null']}, rule='type')
+                        if "has_logbook" in data__profile__completeness_keys:
+                            data__profile__completeness_keys.remove("has_logbook")
+                            data__profile__completeness__haslogbook = data__profile__completeness["has_logbook"]
+                            if not isinstance(data__profile__completeness__haslogbook, (bool, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.completeness.has_logbook must be boolean or null", value=data__profile__completeness__haslogbook, name="" + (name_prefix or "data") + ".profile.completeness.has_logbook", definition={'type': ['boolean', 'null']}, rule='type')
+                        if "num_attachments" in data__profile__completeness_keys:
+                            data__profile__completeness_keys.remove("num_attachments")
+                            data__profile__completeness__numattachments = data__profile__completeness["num_attachments"]
+                            if not isinstance(data__profile__completeness__numattachments, (int, NoneType)) and not (isinstance(data__profile__completeness__numattachments, float) and data__profile__completeness__numattachments.is_integer()) or isinstance(data__profile__completeness__numattachments, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.completeness.num_attachments must be integer or null", value=data__profile__completeness__numattachments, name="" + (name_prefix or "data") + ".profile.completeness.num_attachments", definition={'type': ['integer', 'null']}, rule='type')
+        if "summary" in data_keys:
+            data_keys.remove("summary")
+            data__summary = data["summary"]
+            if not isinstance(data__summary, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary must be string", value=data__summary, name="" + (name_prefix or "data") + ".summary", definition={'type': 'string'}, rule='type')
+        if "scores" in data_keys:
+            data_keys.remove("scores")
+            data__scores = data["scores"]
+            if not isinstance(data__scores, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must be object", value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'overall_score': {'type': ['integer', 'number']}, 'completeness_score': {'type': ['integer', 'number']}, 'score_breakdown': {'type': 'object', 'properties': {'profile_information': {'type': ['string', 'number']}, 'contact_information': {'type': ['string', 'number']}, 'school_information': {'type': ['string', 'number']}, 'supporting_documents': {'type': ['string', 'number']}}}, 'missing_items': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_score', 'completeness_score']}, rule='type')
+            data__scores_is_dict = isinstance(data__scores, dict)
+            if data__scores_is_dict:
+                data__scores__missing_keys = set(['overall_score', 'completeness_score']) - data__scores.keys()
+                if data__scores__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must contain " + (str(sorted(data__scores__missing_keys)) + " properties"), value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'overall_score': {'type': ['integer', 'number']}, 'completeness_score': {'type': ['integer', 'number']}, 'score_breakdown': {'type': 'object', 'properties': {'profile_information': {'type': ['string', 'number']}, 'contact_information': {'type': ['string', 'number']}, 'school_information': {'type': ['string', 'number']}, 'supporting_documents': {'type': ['string', 'number']}}}, 'missing_items': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_score', 'completeness_score']}, rule='required')
+                data__scores_keys = set(data__scores.keys())
+                if "overall_score" in data__scores_keys:
+                    data__scores_keys.remove("overall_score")
+                    data__scores__overallscore = data__scores["overall_score"]
+                    if not isinstance(data__scores__overallscore, (int, int, float, Decimal)) and not (isinstance(data__scores__overallscore, float) and data__scores__overallscore.is_integer()) or isinstance(data__scores__overallscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.overall_score must be integer or number", value=data__scores__overallscore, name="" + (name_prefix or "data") + ".scores.overall_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "completeness_score" in data__scores_keys:
+                    data__scores_keys.remove("completeness_score")
+                    data__scores__completenessscore = data__scores["completeness_score"]
+                    if not isinstance(data__scores__completenessscore, (int, int, float, Decimal)) and not (isinstance(data__scores__completenessscore, float) and data__scores__completenessscore.is_integer()) or isinstance(data__scores__completenessscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.completeness_score must be integer or number", value=data__scores__completenessscore, name="" + (name_prefix or "data") + ".scores.completeness_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "score_breakdown" in data__scores_keys:
+                    data__scores_keys.remove("score_breakdown")
+                    data__scores__scorebreakdown = data__scores["score_breakdown"]
+                    if not isinstance(data__scores__scorebreakdown, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.score_breakdown must be object", value=data__scores__scorebreakdown, name="" + (name_prefix or "data") + ".scores.score_breakdown", definition={'type': 'object', 'properties': {'profile_information': {'type': ['string', 'number']}, 'contact_information': {'type': ['string', 'number']}, 'school_information': {'type': ['string', 'number']}, 'supporting_documents': {'type': ['string', 'number']}}}, rule='type')
+                    data__scores__scorebreakdown_is_dict = isinstance(data__scores__scorebreakdown, dict)
+                    if data__scores__scorebreakdown_is_dict:
+                        data__scores__scorebreakdown_keys = set(data__scores__scorebreakdown.keys())
+                        if "profile_information" in data__scores__scorebreakdown_keys:
+                            data__scores__scorebreakdown_keys.remove("profile_information")
+                            data__scores__scorebreakdown__profileinformation = data__scores__scorebreakdown["profile_information"]
+                            if not isinstance(data__scores__scorebreakdown__profileinformation, (str, int, float, Decimal)) or isinstance(data__scores__scorebreakdown__profileinformation, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.score_breakdown.profile_information must be string or number", value=data__scores__scorebreakdown__profileinformation, name="" + (name_prefix or "data") + ".scores.score_breakdown.profile_information", definition={'type': ['string', 'number']}, rule='type')
+                        if "contact_information" in data__scores__scorebreakdown_keys:
+                            data__scores__scorebreakdown_keys.remove("contact_information")
+                            data__scores__scorebreakdown__contactinformation = data__scores__scorebreakdown["contact_information"]
+                            if not isinstance(data__scores__scorebreakdown__contactinformation, (str, int, float, Decimal)) or isinstance(data__scores__scorebreakdown__contactinformation, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.score_breakdown.contact_information must be string or number", value=data__scores__scorebreakdown__contactinformation, name="" + (name_prefix or "data") + ".scores.score_breakdown.contact_information", definition={'type': ['string', 'number']}, rule='type')
+                        if "school_information" in data__scores__scorebreakdown_keys:
+                            data__scores__scorebreakdown_keys.remove("school_information")
+                            data__scores__scorebreakdown__schoolinformation = data__scores__scorebreakdown["school_information"]
+                            if not isinstance(data__scores__scorebreakdown__schoolinformation, (str, int, float, Decimal)) or isinstance(data__scores__scorebreakdown__schoolinformation, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.score_breakdown.school_information must be string or number", value=data__scores__scorebreakdown__schoolinformation, name="" + (name_prefix or "data") + ".scores.score_breakdown.school_information", definition={'type': ['string', 'number']}, rule='type')
+                        if "supporting_documents" in data__scores__scorebreakdown_keys:
+                            data__scores__scorebreakdown_keys.remove("supporting_documents")
+                            data__scores__scorebreakdown__supportingdocuments = data__scores__scorebreakdown["supporting_documents"]
+                            if not isinstance(data__scores__scorebreakdown__supportingdocuments, (str, int, float, Decimal)) or isinstance(data__scores__scorebreakdown__supportingdocuments, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.score_breakdown.supporting_documents must be string or number", value=data__scores__scorebreakdown__supportingdocuments, name="" + (name_prefix or "data") + ".scores.score_breakdown.supporting_documents", definition={'type': ['string', 'number']}, rule='type')
+                if "missing_items" in data__scores_keys:
+                    data__scores_keys.remove("missing_items")
+                    data__scores__missingitems = data__scores["missing_items"]
+                    if not isinstance(data__scores__missingitems, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.missing_items must be array", value=data__scores__missingitems, name="" + (name_prefix or "data") + ".scores.missing_items", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__scores__missingitems_is_list = isinstance(data__scores__missingitems, (list, tuple))
+                    if data__scores__missingitems_is_list:
+                        data__scores__missingitems_len = len(data__scores__missingitems)
+                        for data__scores__missingitems_x, data__scores__missingitems_item in enumerate(data__scores__missingitems):
+                            if not isinstance(data__scores__missingitems_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.missing_items[{data__scores__missingitems_x}]".format(**locals()) + " must be string", value=data__scores__missingitems_item, name="" + (name_prefix or "data") + ".scores.missing_items[{data__scores__missingitems_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,147 @@
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Personal Agent Output Schema', 'description': 'Schema for PersonalAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'motivation_summary': {'type': ['string', 'null']}, 'career_goals_summary': {'type': ['string', 'null']}, 'aviation_path_stage': {'type': ['string', 'null']}, 'community_service_summary': {'type': ['string', 'null']}, 'leadership_roles': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'personal_character_indicators': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'alignment_with_wai': {'type': ['string', 'null']}, 'unique_strengths': {'type': 'array', 'items': {'type': ['string', 'null']}}}}, 'scores': {'type': 'object', 'properties': {'motivation_score': {'type': ['integer', 'number', 'null']}, 'goals_clarity_score': {'type': ['integer', 'number', 'null']}, 'character_service_leadership_score': {'type': ['integer', 'number', 'null']}, 'overall_score': {'type': ['integer', 'number', 'null']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'motivation_score_reasoning': {'type': 'string'}, 'goals_clarity_score_reasoning': {'type': 'string'}, 'character_service_leadership_score_reasoning': {'type': 'string'}, 'overall_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['summary', 'profile_features', 'scores']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Personal Agent Output Schema', 'description': 'Schema for PersonalAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'motivation_summary': {'type': ['string', 'null']}, 'career_goals_summary': {'type': ['string', 'null']}, 'aviation_path_stage': {'type': ['string', 'null']}, 'community_service_summary': {'type': ['string', 'null']}, 'leadership_roles': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'personal_character_indicators': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'alignment_with_wai': {'type': ['string', 'null']}, 'unique_strengths': {'type': 'array', 'items': {'type': ['string', 'null']}}}}, 'scores': {'type': 'object', 'properties': {'motivation_score': {'type': ['integer', 'number', 'null']}, 'goals_clarity_score': {'type': ['integer', 'number', 'null']}, 'character_service_leadership_score': {'type': ['integer', 'number', 'null']}, 'overall_score': {'type': ['integer', 'number', 'null']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'motivation_score_reasoning': {'type': 'string'}, 'goals_clarity_score_reasoning': {'type': 'string'}, 'character_service_leadership_score_reasoning': {'type': 'string'}, 'overall_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='required')
+        data_keys = set(data.keys())
+        if "summary" in data_keys:
+            data_keys.remove("summary")
+            data__summary = data["summary"]
+            if not isinstance(data__summary, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary must be string", value=data__summary, name="" + (name_prefix or "data") + ".summary", definition={'type': 'string'}, rule='type')
+        if "profile_features" in data_keys:
+            data_keys.remove("profile_features")
+            data__profilefeatures = data["profile_features"]
+            if not isinstance(data__profilefeatures, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features must be object", value=data__profilefeatures, name="" + (name_prefix or "data") + ".profile_features", definition={'type': 'object', 'properties': {'motivation_summary': {'type': ['string', 'null']}, 'career_goals_summary': {'type': ['string', 'null']}, 'aviation_path_stage': {'type': ['string', 'null']}, 'community_service_summary': {'type': ['string', 'null']}, 'leadership_roles': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'personal_character_indicators': {'type': 'array', 'items': {'type': ['string', 'null']}}, 'alignment_with_wai': {'type': ['string', 'null']}, 'unique_strengths': {'type': 'array', 'items': {'type': ['string', 'null']}}}}, rule='type')
+            data__profilefeatures_is_dict = isinstance(data__profilefeatures, dict)
+            if data__profilefeatures_is_dict:
+                data__profilefeatures_keys = set(data__profilefeatures.keys())
+                if "motivation_summary" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("motivation_summary")
+                    data__profilefeatures__motivationsummary = data__profilefeatures["motivation_summary"]
+                    if not isinstance(data__profilefeatures__motivationsummary, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.motivation_summary must be string or null", value=data__profilefeatures__motivationsummary, name="" + (name_prefix or "data") + ".profile_features.motivation_summary", definition={'type': ['string', 'null']}, rule='type')
+                if "career_goals_summary" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("career_goals_summary")
+                    data__profilefeatures__careergoalssummary = data__profilefeatures["career_goals_summary"]
+                    if not isinstance(data__profilefeatures__careergoalssummary, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.career_goals_summary must be string or null", value=data__profilefeatures__careergoalssummary, name="" + (name_prefix or "data") + ".profile_features.career_goals_summary", definition={'type': ['string', 'null']}, rule='type')
+                if "aviation_path_stage" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("aviation_path_stage")
+                    data__profilefeatures__aviationpathstage = data__profilefeatures["aviation_path_stage"]
+                    if not isinstance(data__profilefeatures__aviationpathstage, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.aviation_path_stage must be string or null", value=data__profilefeatures__aviationpathstage, name="" + (name_prefix or "data") + ".profile_features.aviation_path_stage", definition={'type': ['string', 'null']}, rule='type')
+                if "community_service_summary" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("community_service_summary")
+                    data__profilefeatures__communityservicesummary = data__profilefeatures["community_service_summary"]
+                    if not isinstance(data__profilefeatures__communityservicesummary, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.community_service_summary must be string or null", value=data__profilefeatures__communityservicesummary, name="" + (name_prefix or "data") + ".profile_features.community_service_summary", definition={'type': ['string', 'null']}, rule='type')
+                if "leadership_roles" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("leadership_roles")
+                    data__profilefeatures__leadershiproles = data__profilefeatures["leadership_roles"]
+                    if not isinstance(data__profilefeatures__leadershiproles, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.leadership_roles must be array", value=data__profilefeatures__leadershiproles, name="" + (name_prefix or "data") + ".profile_features.leadership_roles", definition={'type': 'array', 'items': {'type': ['string', 'null']}}, rule='type')
+                    data__profilefeatures__leadershiproles_is_list = isinstance(data__profilefeatures__leadershiproles, (list, tuple))
+                    if data__profilefeatures__leadershiproles_is_list:
+                        data__profilefeatures__leadershiproles_len = len(data__profilefeatures__leadershiproles)
+                        for data__profilefeatures__leadershiproles_x, data__profilefeatures__leadershiproles_item in enumerate(data__profilefeatures__leadershiproles):
+                            if not isinstance(data__profilefeatures__leadershiproles_item, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.leadership_roles[{data__profilefeatures__leadershiproles_x}]".format(**locals()) + " must be string or null", value=data__profilefeatures__leadershiproles_item, name="" + (name_prefix or "data") + ".profile_features.leadership_roles[{data__profilefeatures__leadershiproles_x}]".format(**locals()) + "", definition={'type': ['string', 'null']}, rule='type')
+                if "personal_character_indicators" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("personal_character_indicators")
+                    data__profilefeatures__personalcharacterindicators = data__profilefeatures["personal_character_indicators"]
+                    if not isinstance(data__profilefeatures__personalcharacterindicators, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.personal_character_indicators must be array", value=data__profilefeatures__personalcharacterindicators, name="" + (name_prefix or "data") + ".profile_features.personal_character_indicators", definition={'type': 'array', 'items': {'type': ['string', 'null']}}, rule='type')
+                    data__profilefeatures__personalcharacterindicators_is_list = isinstance(data__profilefeatures__personalcharacterindicators, (list, tuple))
+                    if data__profilefeatures__personalcharacterindicators_is_list:
+                        data__profilefeatures__personalcharacterindicators_len = len(data__profilefeatures__personalcharacterindicators)
+                        for data__profilefeatures__personalcharacterindicators_x, data__profilefeatures__personalcharacterindicators_item in enumerate(data__profilefeatures__personalcharacterindicators):
+                            if not isinstance(data__profilefeatures__personalcharacterindicators_item, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.personal_character_indicators[{data__profilefeatures__personalcharacterindicators_x}]".format(**locals()) + " must be string or null", value=data__profilefeatures__personalcharacterindicators_item, name="" + (name_prefix or "data") + ".profile_features.personal_character_indicators[{data__profilefeatures__personalcharacterindicators_x}]".format(**locals()) + "", definition={'type': ['string', 'null']}, rule='type')
+                if "alignment_with_wai" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("alignment_with_wai")
+                    data__profilefeatures__alignmentwithwai = data__profilefeatures["alignment_with_wai"]
+                    if not isinstance(data__profilefeatures__alignmentwithwai, (str, NoneType)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.alignment_with_wai must be string or null", value=data__profilefeatures__alignmentwithwai, name="" + (name_prefix or "data") + ".profile_features.alignment_with_wai", definition={'type': ['string', 'null']}, rule='type')
+                if "unique_strengths" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("unique_strengths")
+                    data__profilefeatures__uniquestrengths = data__profilefeatures["unique_strengths"]
+                    if not isinstance(data__profilefeatures__uniquestrengths, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.unique_strengths must be array", value=data__profilefeatures__uniquestrengths, name="" + (name_prefix or "data") + ".profile_features.unique_strengths", definition={'type': 'array', 'items': {'type': ['string', 'null']}}, rule='type')
+                    data__profilefeatures__uniquestrengths_is_list = isinstance(data__profilefeatures__uniquestrengths, (list, tuple))
+                    if data__profilefeatures__uniquestrengths_is_list:
+                        data__profilefeatures__uniquestrengths_len = len(data__profilefeatures__uniquestrengths)
+                        for data__profilefeatures__uniquestrengths_x, data__profilefeatures__uniquestrengths_item in enumerate(data__profilefeatures__uniquestrengths):
+                            if not isinstance(data__profilefeatures__uniquestrengths_item, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.unique_strengths[{data__profilefeatures__uniquestrengths_x}]".format(**locals()) + " must be string or null", value=data__profilefeatures__uniquestrengths_item, name="" + (name_prefix or "data") + ".profile_features.unique_strengths[{data__profilefeatures__uniquestrengths_x}]".format(**locals()) + "", definition={'type': ['string', 'null']}, rule='type')
+        if "scores" in data_keys:
+            data_keys.remove("scores")
+            data__scores = data["scores"]
+            if not isinstance(data__scores, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must be object", value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'motivation_score': {'type': ['integer', 'number', 'null']}, 'goals_clarity_score': {'type': ['integer', 'number', 'null']}, 'character_service_leadership_score': {'type': ['integer', 'number', 'null']}, 'overall_score': {'type': ['integer', 'number', 'null']}}, 'required': ['overall_score']}, rule='type')
+            data__scores_is_dict = isinstance(data__scores, dict)
+            if data__scores_is_dict:
+                data__scores__missing_keys = set(['overall_score']) - data__scores.keys()
+                if data__scores__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must contain " + (str(sorted(data__scores__missing_keys)) + " properties"), value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'motivation_score': {'type': ['integer', 'number', 'null']}, 'goals_clarity_score': {'type': ['integer', 'number', 'null']}, 'character_service_leadership_score': {'type': ['integer', 'number', 'null']}, 'overall_score': {'type': ['integer', 'number', 'null']}}, 'required': ['overall_score']}, rule='required')
+                data__scores_keys = set(data__scores.keys())
+                if "motivation_score" in data__scores_keys:
+                    data__scores_keys.remove("motivation_score")
+                    data__scores__motivationscore = data__scores["motivation_score"]
+                    if not isinstance(data__scores__motivationscore, (int, int, float, Decimal, NoneType)) and not (isinstance(data__scores__motivationscore, float) and data__scores__motivationscore.is_integer()) or isinstance(data__scores__motivationscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.motivation_score must be integer or number or null", value=data__scores__motivationscore, name="" + (name_prefix or "data") + ".scores.motivation_score", definition={'type': ['integer', 'number', 'null']}, rule='type')
+                if "goals_clarity_score" in data__scores_keys:
+                    data__scores_keys.remove("goals_clarity_score")
+                    data__scores__goalsclarityscore = data__scores["goals_clarity_score"]
+                    if not isinstance(data__scores__goalsclarityscore, (int, int, float, Decimal, NoneType)) and not (isinstance(data__scores__goalsclarityscore, float) and data__scores__goalsclarityscore.is_integer()) or isinstance(data__scores__goalsclarityscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.goals_clarity_score must be integer or number or null", value=data__scores__goalsclarityscore, name="" + (name_prefix or "data") + ".scores.goals_clarity_score", definition={'type': ['integer', 'number', 'null']}, rule='type')
+                if "character_service_leadership_score" in data__scores_keys:
+                    data__scores_keys.remove("character_service_leadership_score")
+                    data__scores__characterserviceleadershipscore = data__scores["character_service_leadership_score"]
+                    if not isinstance(data__scores__characterserviceleadershipscore, (int, int, float, Decimal, NoneType)) and not (isinstance(data__scores__characterserviceleadershipscore, float) and data__scores__characterserviceleadershipscore.is_integer()) or isinstance(data__scores__characterserviceleadershipscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.character_service_leadership_score must be integer or number or null", value=data__scores__characterserviceleadershipscore, name="" + (name_prefix or "data") + ".scores.character_service_leadership_score", definition={'type': ['integer', 'number', 'null']}, rule='type')
+                if "overall_score" in data__scores_keys:
+                    data__scores_keys.remove("overall_score")
+                    data__scores__overallscore = data__scores["overall_score"]
+                    if not isinstance(data__scores__overallscore, (int, int, float, Decimal, NoneType)) and not (isinstance(data__scores__overallscore, float) and data__scores__overallscore.is_integer()) or isinstance(data__scores__overallscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.overall_score must be integer or number or null", value=data__scores__overallscore, name="" + (name_prefix or "data") + ".scores.overall_score", definition={'type': ['integer', 'number', 'null']}, rule='type')
+        if "score_breakdown" in data_keys:
+            data_keys.remove("score_breakdown")
+            data__scorebreakdown = data["score_breakdown"]
+            if not isinstance(data__scorebreakdown, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown must be object", value=data__scorebreakdown, name="" + (name_prefix or "data") + ".score_breakdown", definition={'type': 'object', 'properties': {'motivation_score_reasoning': {'type': 'string'}, 'goals_clarity_score_reasoning': {'type': 'string'}, 'character_service_leadership_score_reasoning': {'type': 'string'}, 'overall_score_reasoning': {'type': 'string'}}}, rule='type')
+            data__scorebreakdown_is_dict = isinstance(data__scorebreakdown, dict)
+            if data__scorebreakdown_is_dict:
+                data__scorebreakdown_keys = set(data__scorebreakdown.keys())
+                if "motivation_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("motivation_score_reasoning")
+                    data__scorebreakdown__motivationscorereasoning = data__scorebreakdown["motivation_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__motivationscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.motivation_score_reasoning must be string", value=data__scorebreakdown__motivationscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.motivation_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "goals_clarity_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("goals_clarity_score_reasoning")
+                    data__scorebreakdown__goalsclarityscorereasoning = data__scorebreakdown["goals_clarity_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__goalsclarityscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.goals_clarity_score_reasoning must be string", value=data__scorebreakdown__goalsclarityscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.goals_clarity_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "character_service_leadership_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("character_service_leadership_score_reasoning")
+                    data__scorebreakdown__characterserviceleadershipscorereasoning = data__scorebreakdown["character_service_leadership_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__characterserviceleadershipscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.character_service_leadership_score_reasoning must be string", value=data__scorebreakdown__characterserviceleadershipscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.character_service_leadership_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "overall_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("overall_score_reasoning")
+                    data__scorebreakdown__overallscorereasoning = data__scorebreakdown["overall_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__overallscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.overall_score_reasoning must be string", value=data__scorebreakdown__overallscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.overall_score_reasoning", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,177 @@
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Recommendation Agent Output Schema', 'description': 'Schema for RecommendationAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'recommendations': {'type': 'array', 'items': {'type': 'object', 'properties': {'recommender_role': {'type': 'string'}, 'relationship_duration': {'type': 'string'}, 'key_strengths_mentioned': {'type': 'array', 'items': {'type': 'string'}}, 'specific_examples': {'type': 'array', 'items': {'type': 'string'}}, 'potential_concerns': {'type': 'array', 'items': {'type': 'string'}}, 'overall_tone': {'type': 'string', 'enum': ['very_positive', 'positive', 'neutral', 'mixed']}}}}, 'aggregate_analysis': {'type': 'object', 'properties': {'common_themes': {'type': 'array', 'items': {'type': 'string'}}, 'strength_consistency': {'type': 'string'}, 'depth_of_support': {'type': 'string'}}}}}, 'scores': {'type': 'object', 'properties': {'average_support_strength_score': {'type': ['integer', 'number']}, 'consistency_of_support_score': {'type': ['integer', 'number']}, 'depth_of_endorsement_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'average_support_strength_score_reasoning': {'type': 'string'}, 'consistency_of_support_score_reasoning': {'type': 'string'}, 'depth_of_endorsement_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['summary', 'profile_features', 'scores']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Recommendation Agent Output Schema', 'description': 'Schema for RecommendationAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'recommendations': {'type': 'array', 'items': {'type': 'object', 'properties': {'recommender_role': {'type': 'string'}, 'relationship_duration': {'type': 'string'}, 'key_strengths_mentioned': {'type': 'array', 'items': {'type': 'string'}}, 'specific_examples': {'type': 'array', 'items': {'type': 'string'}}, 'potential_concerns': {'type': 'array', 'items': {'type': 'string'}}, 'overall_tone': {'type': 'string', 'enum': ['very_positive', 'positive', 'neutral', 'mixed']}}}}, 'aggregate_analysis': {'type': 'object', 'properties': {'common_themes': {'type': 'array', 'items': {'type': 'string'}}, 'strength_consistency': {'type': 'string'}, 'depth_of_support': {'type': 'string'}}}}}, 'scores': {'type': 'object', 'properties': {'average_support_strength_score': {'type': ['integer', 'number']}, 'consistency_of_support_score': {'type': ['integer', 'number']}, 'depth_of_endorsement_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'average_support_strength_score_reasoning': {'type': 'string'}, 'consistency_of_support_score_reasoning': {'type': 'string'}, 'depth_of_endorsement_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='required')
+        data_keys = set(data.keys())
+        if "summary" in data_keys:
+            data_keys.remove("summary")
+            data__summary = data["summary"]
+            if not isinstance(data__summary, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary must be string", value=data__summary, name="" + (name_prefix or "data") + ".summary", definition={'type': 'string'}, rule='type')
+        if "profile_features" in data_keys:
+            data_keys.remove("profile_features")
+            data__profilefeatures = data["profile_features"]
+            if not isinstance(data__profilefeatures, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features must be object", value=data__profilefeatures, name="" + (name_prefix or "data") + ".profile_features", definition={'type': 'object', 'properties': {'recommendations': {'type': 'array', 'items': {'type': 'object', 'properties': {'recommender_role': {'type': 'string'}, 'relationship_duration': {'type': 'string'}, 'key_strengths_mentioned': {'type': 'array', 'items': {'type': 'string'}}, 'specific_examples': {'type': 'array', 'items': {'type': 'string'}}, 'potential_concerns': {'type': 'array', 'items': {'type': 'string'}}, 'overall_tone': {'type': 'string', 'enum': ['very_positive', 'positive', 'neutral', 'mixed']}}}}, 'aggregate_analysis': {'type': 'object', 'properties': {'common_themes': {'type': 'array', 'items': {'type': 'string'}}, 'strength_consistency': {'type': 'string'}, 'depth_of_support': {'type': 'string'}}}}}, rule='type')
+            data__profilefeatures_is_dict = isinstance(data__profilefeatures, dict)
+            if data__profilefeatures_is_dict:
+                data__profilefeatures_keys = set(data__profilefeatures.keys())
+                if "recommendations" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("recommendations")
+                    data__profilefeatures__recommendations = data__profilefeatures["recommendations"]
+                    if not isinstance(data__profilefeatures__recommendations, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations must be array", value=data__profilefeatures__recommendations, name="" + (name_prefix or "data") + ".profile_features.recommendations", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'recommender_role': {'type': 'string'}, 'relationship_duration': {'type': 'string'}, 'key_strengths_mentioned': {'type': 'array', 'items': {'type': 'string'}}, 'specific_examples': {'type': 'array', 'items': {'type': 'string'}}, 'potential_concerns': {'type': 'array', 'items': {'type': 'string'}}, 'overall_tone': {'type': 'string', 'enum': ['very_positive', 'positive', 'neutral', 'mixed']}}}}, rule='type')
+                    data__profilefeatures__recommendations_is_list = isinstance(data__profilefeatures__recommendations, (list, tuple))
+                    if data__profilefeatures__recommendations_is_list:
+                        data__profilefeatures__recommendations_len = len(data__profilefeatures__recommendations)
+                        for data__profilefeatures__recommendations_x, data__profilefeatures__recommendations_item in enumerate(data__profilefeatures__recommendations):
+                            if not isinstance(data__profilefeatures__recommendations_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}]".format(**locals()) + " must be object", value=data__profilefeatures__recommendations_item, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'recommender_role': {'type': 'string'}, 'relationship_duration': {'type': 'string'}, 'key_strengths_mentioned': {'type': 'array', 'items': {'type': 'string'}}, 'specific_examples': {'type': 'array', 'items': {'type': 'string'}}, 'potential_concerns': {'type': 'array', 'items': {'type': 'string'}}, 'overall_tone': {'type': 'string', 'enum': ['very_positive', 'positive', 'neutral', 'mixed']}}}, rule='type')
+                            data__profilefeatures__recommendations_item_is_dict = isinstance(data__profilefeatures__recommendations_item, dict)
+                            if data__profilefeatures__recommendations_item_is_dict:
+                                data__profilefeatures__recommendations_item_keys = set(data__profilefeatures__recommendations_item.keys())
+                                if "recommender_role" in data__profilefeatures__recommendations_item_keys:
+                                    data__profilefeatures__recommendations_item_keys.remove("recommender_role")
+                                    data__profilefeatures__recommendations_item__recommenderrole = data__profilefeatures__recommendations_item["recommender_role"]
+                                    if not isinstance(data__profilefeatures__recommendations_item__recommenderrole, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].recommender_role".format(**locals()) + " must be string", value=data__profilefeatures__recommendations_item__recommenderrole, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].recommender_role".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "relationship_duration" in data__profilefeatures__recommendations_item_keys:
+                                    data__profilefeatures__recommendations_item_keys.remove("relationship_duration")
+                                    data__profilefeatures__recommendations_item__relationshipduration = data__profilefeatures__recommendations_item["relationship_duration"]
+                                    if not isinstance(data__profilefeatures__recommendations_item__relationshipduration, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].relationship_duration".format(**locals()) + " must be string", value=data__profilefeatures__recommendations_item__relationshipduration, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].relationship_duration".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "key_strengths_mentioned" in data__profilefeatures__recommendations_item_keys:
+                                    data__profilefeatures__recommendations_item_keys.remove("key_strengths_mentioned")
+                                    data__profilefeatures__recommendations_item__keystrengthsmentioned = data__profilefeatures__recommendations_item["key_strengths_mentioned"]
+                                    if not isinstance(data__profilefeatures__recommendations_item__keystrengthsmentioned, (list, tuple)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].key_strengths_mentioned".format(**locals()) + " must be array", value=data__profilefeatures__recommendations_item__keystrengthsmentioned, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].key_strengths_mentioned".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                                    data__profilefeatures__recommendations_item__keystrengthsmentioned_is_list = isinstance(data__profilefeatures__recommendations_item__keystrengthsmentioned, (list, tuple))
+                                    if data__profilefeatures__recommendations_item__keystrengthsmentioned_is_list:
+                                        data__profilefeatures__recommendations_item__keystrengthsmentioned_len = len(data__profilefeatures__recommendations_item__keystrengthsmentioned)
+                                        for data__profilefeatures__recommendations_item__keystrengthsmentioned_x, data__profilefeatures__recommendations_item__keystrengthsmentioned_item in enumerate(data__profilefeatures__recommendations_item__keystrengthsmentioned):
+                                            if not isinstance(data__profilefeatures__recommendations_item__keystrengthsmentioned_item, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].key_strengths_mentioned[{data__profilefeatures__recommendations_item__keystrengthsmentioned_x}]".format(**locals()) + " must be string", value=data__profilefeatures__recommendations_item__keystrengthsmentioned_item, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].key_strengths_mentioned[{data__profilefeatures__recommendations_item__keystrengthsmentioned_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "specific_examples" in data__profilefeatures__recommendations_item_keys:
+                                    data__profilefeatures__recommendations_item_keys.remove("specific_examples")
+                                    data__profilefeatures__recommendations_item__specificexamples = data__profilefeatures__recommendations_item["specific_examples"]
+                                    if not isinstance(data__profilefeatures__recommendations_item__specificexamples, (list, tuple)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].specific_examples".format(**locals()) + " must be array", value=data__profilefeatures__recommendations_item__specificexamples, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].specific_examples".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                                    data__profilefeatures__recommendations_item__specificexamples_is_list = isinstance(data__profilefeatures__recommendations_item__specificexamples, (list, tuple))
+                                    if data__profilefeatures__recommendations_item__specificexamples_is_list:
+                                        data__profilefeatures__recommendations_item__specificexamples_len = len(data__profilefeatures__recommendations_item__specificexamples)
+                                        for data__profilefeatures__recommendations_item__specificexamples_x, data__profilefeatures__recommendations_item__specificexamples_item in enumerate(data__profilefeatures__recommendations_item__specificexamples):
+                                            if not isinstance(data__profilefeatures__recommendations_item__specificexamples_item, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].specific_examples[{data__profilefeatures__recommendations_item__specificexamples_x}]".format(**locals()) + " must be string", value=data__profilefeatures__recommendations_item__specificexamples_item, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].specific_examples[{data__profilefeatures__recommendations_item__specificexamples_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "potential_concerns" in data__profilefeatures__recommendations_item_keys:
+                                    data__profilefeatures__recommendations_item_keys.remove("potential_concerns")
+                                    data__profilefeatures__recommendations_item__potentialconcerns = data__profilefeatures__recommendations_item["potential_concerns"]
+                                    if not isinstance(data__profilefeatures__recommendations_item__potentialconcerns, (list, tuple)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].potential_concerns".format(**locals()) + " must be array", value=data__profilefeatures__recommendations_item__potentialconcerns, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].potential_concerns".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                                    data__profilefeatures__recommendations_item__potentialconcerns_is_list = isinstance(data__profilefeatures__recommendations_item__potentialconcerns, (list, tuple))
+                                    if data__profilefeatures__recommendations_item__potentialconcerns_is_list:
+                                        data__profilefeatures__recommendations_item__potentialconcerns_len = len(data__profilefeatures__recommendations_item__potentialconcerns)
+                                        for data__profilefeatures__recommendations_item__potentialconcerns_x, data__profilefeatures__recommendations_item__potentialconcerns_item in enumerate(data__profilefeatures__recommendations_item__potentialconcerns):
+                                            if not isinstance(data__profilefeatures__recommendations_item__potentialconcerns_item, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].potential_concerns[{data__profilefeatures__recommendations_item__potentialconcerns_x}]".format(**locals()) + " must be string", value=data__profilefeatures__recommendations_item__potentialconcerns_item, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].potential_concerns[{data__profilefeatures__recommendations_item__potentialconcerns_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "overall_tone" in data__profilefeatures__recommendations_item_keys:
+                                    data__profilefeatures__recommendations_item_keys.remove("overall_tone")
+                                    data__profilefeatures__recommendations_item__overalltone = data__profilefeatures__recommendations_item["overall_tone"]
+                                    if not isinstance(data__profilefeatures__recommendations_item__overalltone, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].overall_tone".format(**locals()) + " must be string", value=data__profilefeatures__recommendations_item__overalltone, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].overall_tone".format(**locals()) + "", definition={'type': 'string', 'enum': ['very_positive', 'positive', 'neutral', 'mixed']}, rule='type')
+                                    if not (isinstance(data__profilefeatures__recommendations_item__overalltone, str) and data__profilefeatures__recommendations_item__overalltone == 'very_positive' or isinstance(data__profilefeatures__recommendations_item__overalltone, str) and data__profilefeatures__recommendations_item__overalltone == 'positive' or isinstance(data__profilefeatures__recommendations_item__overalltone, str) and data__profilefeatures__recommendations_item__overalltone == 'neutral' or isinstance(data__profilefeatures__recommendations_item__overalltone, str) and data__profilefeatures__recommendations_item__overalltone == 'mixed'):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].overall_tone".format(**locals()) + " must be one of ['very_positive', 'positive', 'neutral', 'mixed']", value=data__profilefeatures__recommendations_item__overalltone, name="" + (name_prefix or "data") + ".profile_features.recommendations[{data__profilefeatures__recommendations_x}].overall_tone".format(**locals()) + "", definition={'type': 'string', 'enum': ['very_positive', 'positive', 'neutral', 'mixed']}, rule='enum')
+                if "aggregate_analysis" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("aggregate_analysis")
+                    data__profilefeatures__aggregateanalysis = data__profilefeatures["aggregate_analysis"]
+                    if not isinstance(data__profilefeatures__aggregateanalysis, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.aggregate_analysis must be object", value=data__profilefeatures__aggregateanalysis, name="" + (name_prefix or "data") + ".profile_features.aggregate_analysis", definition={'type': 'object', 'properties': {'common_themes': {'type': 'array', 'items': {'type': 'string'}}, 'strength_consistency': {'type': 'string'}, 'depth_of_support': {'type': 'string'}}}, rule='type')
+                    data__profilefeatures__aggregateanalysis_is_dict = isinstance(data__profilefeatures__aggregateanalysis, dict)
+                    if data__profilefeatures__aggregateanalysis_is_dict:
+                        data__profilefeatures__aggregateanalysis_keys = set(data__profilefeatures__aggregateanalysis.keys())
+                        if "common_themes" in data__profilefeatures__aggregateanalysis_keys:
+                            data__profilefeatures__aggregateanalysis_keys.remove("common_themes")
+                            data__profilefeatures__aggregateanalysis__commonthemes = data__profilefeatures__aggregateanalysis["common_themes"]
+                            if not isinstance(data__profilefeatures__aggregateanalysis__commonthemes, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.aggregate_analysis.common_themes must be array", value=data__profilefeatures__aggregateanalysis__commonthemes, name="" + (name_prefix or "data") + ".profile_features.aggregate_analysis.common_themes", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                            data__profilefeatures__aggregateanalysis__commonthemes_is_list = isinstance(data__profilefeatures__aggregateanalysis__commonthemes, (list, tuple))
+                            if data__profilefeatures__aggregateanalysis__commonthemes_is_list:
+                                data__profilefeatures__aggregateanalysis__commonthemes_len = len(data__profilefeatures__aggregateanalysis__commonthemes)
+                                for data__profilefeatures__aggregateanalysis__commonthemes_x, data__profilefeatures__aggregateanalysis__commonthemes_item in enumerate(data__profilefeatures__aggregateanalysis__commonthemes):
+                                    if not isinstance(data__profilefeatures__aggregateanalysis__commonthemes_item, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.aggregate_analysis.common_themes[{data__profilefeatures__aggregateanalysis__commonthemes_x}]".format(**locals()) + " must be string", value=data__profilefeatures__aggregateanalysis__commonthemes_item, name="" + (name_prefix or "data") + ".profile_features.aggregate_analysis.common_themes[{data__profilefeatures__aggregateanalysis__commonthemes_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "strength_consistency" in data__profilefeatures__aggregateanalysis_keys:
+                            data__profilefeatures__aggregateanalysis_keys.remove("strength_consistency")
+                            data__profilefeatures__aggregateanalysis__strengthconsistency = data__profilefeatures__aggregateanalysis["strength_consistency"]
+                            if not isinstance(data__profilefeatures__aggregateanalysis__strengthconsistency, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.aggregate_analysis.strength_consistency must be string", value=data__profilefeatures__aggregateanalysis__strengthconsistency, name="" + (name_prefix or "data") + ".profile_features.aggregate_analysis.strength_consistency", definition={'type': 'string'}, rule='type')
+                        if "depth_of_support" in data__profilefeatures__aggregateanalysis_keys:
+                            data__profilefeatures__aggregateanalysis_keys.remove("depth_of_support")
+                            data__profilefeatures__aggregateanalysis__depthofsupport = data__profilefeatures__aggregateanalysis["depth_of_support"]
+                            if not isinstance(data__profilefeatures__aggregateanalysis__depthofsupport, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.aggregate_analysis.depth_of_support must be string", value=data__profilefeatures__aggregateanalysis__depthofsupport, name="" + (name_prefix or "data") + ".profile_features.aggregate_analysis.depth_of_support", definition={'type': 'string'}, rule='type')
+        if "scores" in data_keys:
+            data_keys.remove("scores")
+            data__scores = data["scores"]
+            if not isinstance(data__scores, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must be object", value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'average_support_strength_score': {'type': ['integer', 'number']}, 'consistency_of_support_score': {'type': ['integer', 'number']}, 'depth_of_endorsement_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, rule='type')
+            data__scores_is_dict = isinstance(data__scores, dict)
+            if data__scores_is_dict:
+                data__scores__missing_keys = set(['overall_score']) - data__scores.keys()
+                if data__scores__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must contain " + (str(sorted(data__scores__missing_keys)) + " properties"), value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'average_support_strength_score': {'type': ['integer', 'number']}, 'consistency_of_support_score': {'type': ['integer', 'number']}, 'depth_of_endorsement_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, rule='required')
+                data__scores_keys = set(data__scores.keys())
+                if "average_support_strength_score" in data__scores_keys:
+                    data__scores_keys.remove("average_support_strength_score")
+                    data__scores__averagesupportstrengthscore = data__scores["average_support_strength_score"]
+                    if not isinstance(data__scores__averagesupportstrengthscore, (int, int, float, Decimal)) and not (isinstance(data__scores__averagesupportstrengthscore, float) and data__scores__averagesupportstrengthscore.is_integer()) or isinstance(data__scores__averagesupportstrengthscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.average_support_strength_score must be integer or number", value=data__scores__averagesupportstrengthscore, name="" + (name_prefix or "data") + ".scores.average_support_strength_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "consistency_of_support_score" in data__scores_keys:
+                    data__scores_keys.remove("consistency_of_support_score")
+                    data__scores__consistencyofsupportscore = data__scores["consistency_of_support_score"]
+                    if not isinstance(data__scores__consistencyofsupportscore, (int, int, float, Decimal)) and not (isinstance(data__scores__consistencyofsupportscore, float) and data__scores__consistencyofsupportscore.is_integer()) or isinstance(data__scores__consistencyofsupportscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.consistency_of_support_score must be integer or number", value=data__scores__consistencyofsupportscore, name="" + (name_prefix or "data") + ".scores.consistency_of_support_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "depth_of_endorsement_score" in data__scores_keys:
+                    data__scores_keys.remove("depth_of_endorsement_score")
+                    data__scores__depthofendorsementscore = data__scores["depth_of_endorsement_score"]
+                    if not isinstance(data__scores__depthofendorsementscore, (int, int, float, Decimal)) and not (isinstance(data__scores__depthofendorsementscore, float) and data__scores__depthofendorsementscore.is_integer()) or isinstance(data__scores__depthofendorsementscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.depth_of_endorsement_score must be integer or number", value=data__scores__depthofendorsementscore, name="" + (name_prefix or "data") + ".scores.depth_of_endorsement_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "overall_score" in data__scores_keys:
+                    data__scores_keys.remove("overall_score")
+                    data__scores__overallscore = data__scores["overall_score"]
+                    if not isinstance(data__scores__overallscore, (int, int, float, Decimal)) and not (isinstance(data__scores__overallscore, float) and data__scores__overallscore.is_integer()) or isinstance(data__scores__overallscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.overall_score must be integer or number", value=data__scores__overallscore, name="" + (name_prefix or "data") + ".scores.overall_score", definition={'type': ['integer', 'number']}, rule='type')
+        if "score_breakdown" in data_keys:
+            data_keys.remove("score_breakdown")
+            data__scorebreakdown = data["score_breakdown"]
+            if not isinstance(data__scorebreakdown, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown must be object", value=data__scorebreakdown, name="" + (name_prefix or "data") + ".score_breakdown", definition={'type': 'object', 'properties': {'average_support_strength_score_reasoning': {'type': 'string'}, 'consistency_of_support_score_reasoning': {'type': 'string'}, 'depth_of_endorsement_score_reasoning': {'type': 'string'}}}, rule='type')
+            data__scorebreakdown_is_dict = isinstance(data__scorebreakdown, dict)
+            if data__scorebreakdown_is_dict:
+                data__scorebreakdown_keys = set(data__scorebreakdown.keys())
+                if "average_support_strength_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("average_support_strength_score_reasoning")
+                    data__scorebreakdown__averagesupportstrengthscorereasoning = data__scorebreakdown["average_support_strength_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__averagesupportstrengthscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.average_support_strength_score_reasoning must be string", value=data__scorebreakdown__averagesupportstrengthscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.average_support_strength_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "consistency_of_support_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("consistency_of_support_score_reasoning")
+                    data__scorebreakdown__consistencyofsupportscorereasoning = data__scorebreakdown["consistency_of_support_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__consistencyofsupportscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.consistency_of_support_score_reasoning must be string", value=data__scorebreakdown__consistencyofsupportscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.consistency_of_support_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "depth_of_endorsement_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("depth_of_endorsement_score_reasoning")
+                    data__scorebreakdown__depthofendorsementscorereasoning = data__scorebreakdown["depth_of_endorsement_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__depthofendorsementscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.depth_of_endorsement_score_reasoning must be string", value=data__scorebreakdown__depthofendorsementscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.depth_of_endorsement_score_reasoning", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,274 @@
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Social Agent Output Schema', 'description': 'Schema for SocialAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'platforms_found': {'type': 'object', 'properties': {'facebook': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'instagram': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'tiktok': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'linkedin': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}}}, 'total_platforms': {'type': 'integer'}, 'has_professional_presence': {'type': 'boolean'}, 'notes': {'type': 'string'}}}, 'scores': {'type': 'object', 'properties': {'social_presence_score': {'type': ['integer', 'number']}, 'professional_presence_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'social_presence_score_reasoning': {'type': 'string'}, 'professional_presence_score_reasoning': {'type': 'string'}, 'overall_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['summary', 'profile_features', 'scores']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Social Agent Output Schema', 'description': 'Schema for SocialAgent output structure', 'type': 'object', 'properties': {'summary': {'type': 'string'}, 'profile_features': {'type': 'object', 'properties': {'platforms_found': {'type': 'object', 'properties': {'facebook': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'instagram': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'tiktok': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'linkedin': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}}}, 'total_platforms': {'type': 'integer'}, 'has_professional_presence': {'type': 'boolean'}, 'notes': {'type': 'string'}}}, 'scores': {'type': 'object', 'properties': {'social_presence_score': {'type': ['integer', 'number']}, 'professional_presence_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, 'score_breakdown': {'type': 'object', 'properties': {'social_presence_score_reasoning': {'type': 'string'}, 'professional_presence_score_reasoning': {'type': 'string'}, 'overall_score_reasoning': {'type': 'string'}}}}, 'required': ['summary', 'profile_features', 'scores']}, rule='required')
+        data_keys = set(data.keys())
+        if "summary" in data_keys:
+            data_keys.remove("summary")
+            data__summary = data["summary"]
+            if not isinstance(data__summary, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary must be string", value=data__summary, name="" + (name_prefix or "data") + ".summary", definition={'type': 'string'}, rule='type')
+        if "profile_features" in data_keys:
+            data_keys.remove("profile_features")
+            data__profilefeatures = data["profile_features"]
+            if not isinstance(data__profilefeatures, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features must be object", value=data__profilefeatures, name="" + (name_prefix or "data") + ".profile_features", definition={'type': 'object', 'properties': {'platforms_found': {'type': 'object', 'properties': {'facebook': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'instagram': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'tiktok': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'linkedin': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}}}, 'total_platforms': {'type': 'integer'}, 'has_professional_presence': {'type': 'boolean'}, 'notes': {'type': 'string'}}}, rule='type')
+            data__profilefeatures_is_dict = isinstance(data__profilefeatures, dict)
+            if data__profilefeatures_is_dict:
+                data__profilefeatures_keys = set(data__profilefeatures.keys())
+                if "platforms_found" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("platforms_found")
+                    data__profilefeatures__platformsfound = data__profilefeatures["platforms_found"]
+                    if not isinstance(data__profilefeatures__platformsfound, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found must be object", value=data__profilefeatures__platformsfound, name="" + (name_prefix or "data") + ".profile_features.platforms_found", definition={'type': 'object', 'properties': {'facebook': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'instagram': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'tiktok': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, 'linkedin': {'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}}}, rule='type')
+                    data__profilefeatures__platformsfound_is_dict = isinstance(data__profilefeatures__platformsfound, dict)
+                    if data__profilefeatures__platformsfound_is_dict:
+                        data__profilefeatures__platformsfound_keys = set(data__profilefeatures__platformsfound.keys())
+                        if "facebook" in data__profilefeatures__platformsfound_keys:
+                            data__profilefeatures__platformsfound_keys.remove("facebook")
+                            data__profilefeatures__platformsfound__facebook = data__profilefeatures__platformsfound["facebook"]
+                            if not isinstance(data__profilefeatures__platformsfound__facebook, (dict, bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook must be object or boolean", value=data__profilefeatures__platformsfound__facebook, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='type')
+                            data__profilefeatures__platformsfound__facebook_one_of_count1 = 0
+                            if data__profilefeatures__platformsfound__facebook_one_of_count1 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__facebook, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook must be object", value=data__profilefeatures__platformsfound__facebook, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook", definition={'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, rule='type')
+                                    data__profilefeatures__platformsfound__facebook_is_dict = isinstance(data__profilefeatures__platformsfound__facebook, dict)
+                                    if data__profilefeatures__platformsfound__facebook_is_dict:
+                                        data__profilefeatures__platformsfound__facebook_keys = set(data__profilefeatures__platformsfound__facebook.keys())
+                                        if "present" in data__profilefeatures__platformsfound__facebook_keys:
+                                            data__profilefeatures__platformsfound__facebook_keys.remove("present")
+                                            data__profilefeatures__platformsfound__facebook__present = data__profilefeatures__platformsfound__facebook["present"]
+                                            if not isinstance(data__profilefeatures__platformsfound__facebook__present, (bool)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.present must be boolean", value=data__profilefeatures__platformsfound__facebook__present, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.present", definition={'type': 'boolean'}, rule='type')
+                                        if "link" in data__profilefeatures__platformsfound__facebook_keys:
+                                            data__profilefeatures__platformsfound__facebook_keys.remove("link")
+                                            data__profilefeatures__platformsfound__facebook__link = data__profilefeatures__platformsfound__facebook["link"]
+                                            if not isinstance(data__profilefeatures__platformsfound__facebook__link, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.link must be string or null", value=data__profilefeatures__platformsfound__facebook__link, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.link", definition={'type': ['string', 'null']}, rule='type')
+                                        if "handle" in data__profilefeatures__platformsfound__facebook_keys:
+                                            data__profilefeatures__platformsfound__facebook_keys.remove("handle")
+                                            data__profilefeatures__platformsfound__facebook__handle = data__profilefeatures__platformsfound__facebook["handle"]
+                                            if not isinstance(data__profilefeatures__platformsfound__facebook__handle, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.handle must be string or null", value=data__profilefeatures__platformsfound__facebook__handle, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.handle", definition={'type': ['string', 'null']}, rule='type')
+                                        if "evidence" in data__profilefeatures__platformsfound__facebook_keys:
+                                            data__profilefeatures__platformsfound__facebook_keys.remove("evidence")
+                                            data__profilefeatures__platformsfound__facebook__evidence = data__profilefeatures__platformsfound__facebook["evidence"]
+                                            if not isinstance(data__profilefeatures__platformsfound__facebook__evidence, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.evidence must be string", value=data__profilefeatures__platformsfound__facebook__evidence, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook.evidence", definition={'type': 'string'}, rule='type')
+                                    data__profilefeatures__platformsfound__facebook_one_of_count1 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__facebook_one_of_count1 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__facebook, (bool)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook must be boolean", value=data__profilefeatures__platformsfound__facebook, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook", definition={'type': 'boolean'}, rule='type')
+                                    data__profilefeatures__platformsfound__facebook_one_of_count1 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__facebook_one_of_count1 != 1:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.facebook must be valid exactly by one definition" + (" (" + str(data__profilefeatures__platformsfound__facebook_one_of_count1) + " matches found)"), value=data__profilefeatures__platformsfound__facebook, name="" + (name_prefix or "data") + ".profile_features.platforms_found.facebook", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='oneOf')
+                        if "instagram" in data__profilefeatures__platformsfound_keys:
+                            data__profilefeatures__platformsfound_keys.remove("instagram")
+                            data__profilefeatures__platformsfound__instagram = data__profilefeatures__platformsfound["instagram"]
+                            if not isinstance(data__profilefeatures__platformsfound__instagram, (dict, bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram must be object or boolean", value=data__profilefeatures__platformsfound__instagram, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='type')
+                            data__profilefeatures__platformsfound__instagram_one_of_count2 = 0
+                            if data__profilefeatures__platformsfound__instagram_one_of_count2 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__instagram, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram must be object", value=data__profilefeatures__platformsfound__instagram, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram", definition={'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, rule='type')
+                                    data__profilefeatures__platformsfound__instagram_is_dict = isinstance(data__profilefeatures__platformsfound__instagram, dict)
+                                    if data__profilefeatures__platformsfound__instagram_is_dict:
+                                        data__profilefeatures__platformsfound__instagram_keys = set(data__profilefeatures__platformsfound__instagram.keys())
+                                        if "present" in data__profilefeatures__platformsfound__instagram_keys:
+                                            data__profilefeatures__platformsfound__instagram_keys.remove("present")
+                                            data__profilefeatures__platformsfound__instagram__present = data__profilefeatures__platformsfound__instagram["present"]
+                                            if not isinstance(data__profilefeatures__platformsfound__instagram__present, (bool)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.present must be boolean", value=data__profilefeatures__platformsfound__instagram__present, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.present", definition={'type': 'boolean'}, rule='type')
+                                        if "link" in data__profilefeatures__platformsfound__instagram_keys:
+                                            data__profilefeatures__platformsfound__instagram_keys.remove("link")
+                                            data__profilefeatures__platformsfound__instagram__link = data__profilefeatures__platformsfound__instagram["link"]
+                                            if not isinstance(data__profilefeatures__platformsfound__instagram__link, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.link must be string or null", value=data__profilefeatures__platformsfound__instagram__link, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.link", definition={'type': ['string', 'null']}, rule='type')
+                                        if "handle" in data__profilefeatures__platformsfound__instagram_keys:
+                                            data__profilefeatures__platformsfound__instagram_keys.remove("handle")
+                                            data__profilefeatures__platformsfound__instagram__handle = data__profilefeatures__platformsfound__instagram["handle"]
+                                            if not isinstance(data__profilefeatures__platformsfound__instagram__handle, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.handle must be string or null", value=data__profilefeatures__platformsfound__instagram__handle, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.handle", definition={'type': ['string', 'null']}, rule='type')
+                                        if "evidence" in data__profilefeatures__platformsfound__instagram_keys:
+                                            data__profilefeatures__platformsfound__instagram_keys.remove("evidence")
+                                            data__profilefeatures__platformsfound__instagram__evidence = data__profilefeatures__platformsfound__instagram["evidence"]
+                                            if not isinstance(data__profilefeatures__platformsfound__instagram__evidence, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.evidence must be string", value=data__profilefeatures__platformsfound__instagram__evidence, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram.evidence", definition={'type': 'string'}, rule='type')
+                                    data__profilefeatures__platformsfound__instagram_one_of_count2 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__instagram_one_of_count2 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__instagram, (bool)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram must be boolean", value=data__profilefeatures__platformsfound__instagram, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram", definition={'type': 'boolean'}, rule='type')
+                                    data__profilefeatures__platformsfound__instagram_one_of_count2 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__instagram_one_of_count2 != 1:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.instagram must be valid exactly by one definition" + (" (" + str(data__profilefeatures__platformsfound__instagram_one_of_count2) + " matches found)"), value=data__profilefeatures__platformsfound__instagram, name="" + (name_prefix or "data") + ".profile_features.platforms_found.instagram", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='oneOf')
+                        if "tiktok" in data__profilefeatures__platformsfound_keys:
+                            data__profilefeatures__platformsfound_keys.remove("tiktok")
+                            data__profilefeatures__platformsfound__tiktok = data__profilefeatures__platformsfound["tiktok"]
+                            if not isinstance(data__profilefeatures__platformsfound__tiktok, (dict, bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok must be object or boolean", value=data__profilefeatures__platformsfound__tiktok, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='type')
+                            data__profilefeatures__platformsfound__tiktok_one_of_count3 = 0
+                            if data__profilefeatures__platformsfound__tiktok_one_of_count3 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__tiktok, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok must be object", value=data__profilefeatures__platformsfound__tiktok, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok", definition={'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, rule='type')
+                                    data__profilefeatures__platformsfound__tiktok_is_dict = isinstance(data__profilefeatures__platformsfound__tiktok, dict)
+                                    if data__profilefeatures__platformsfound__tiktok_is_dict:
+                                        data__profilefeatures__platformsfound__tiktok_keys = set(data__profilefeatures__platformsfound__tiktok.keys())
+                                        if "present" in data__profilefeatures__platformsfound__tiktok_keys:
+                                            data__profilefeatures__platformsfound__tiktok_keys.remove("present")
+                                            data__profilefeatures__platformsfound__tiktok__present = data__profilefeatures__platformsfound__tiktok["present"]
+                                            if not isinstance(data__profilefeatures__platformsfound__tiktok__present, (bool)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.present must be boolean", value=data__profilefeatures__platformsfound__tiktok__present, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.present", definition={'type': 'boolean'}, rule='type')
+                                        if "link" in data__profilefeatures__platformsfound__tiktok_keys:
+                                            data__profilefeatures__platformsfound__tiktok_keys.remove("link")
+                                            data__profilefeatures__platformsfound__tiktok__link = data__profilefeatures__platformsfound__tiktok["link"]
+                                            if not isinstance(data__profilefeatures__platformsfound__tiktok__link, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.link must be string or null", value=data__profilefeatures__platformsfound__tiktok__link, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.link", definition={'type': ['string', 'null']}, rule='type')
+                                        if "handle" in data__profilefeatures__platformsfound__tiktok_keys:
+                                            data__profilefeatures__platformsfound__tiktok_keys.remove("handle")
+                                            data__profilefeatures__platformsfound__tiktok__handle = data__profilefeatures__platformsfound__tiktok["handle"]
+                                            if not isinstance(data__profilefeatures__platformsfound__tiktok__handle, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.handle must be string or null", value=data__profilefeatures__platformsfound__tiktok__handle, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.handle", definition={'type': ['string', 'null']}, rule='type')
+                                        if "evidence" in data__profilefeatures__platformsfound__tiktok_keys:
+                                            data__profilefeatures__platformsfound__tiktok_keys.remove("evidence")
+                                            data__profilefeatures__platformsfound__tiktok__evidence = data__profilefeatures__platformsfound__tiktok["evidence"]
+                                            if not isinstance(data__profilefeatures__platformsfound__tiktok__evidence, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.evidence must be string", value=data__profilefeatures__platformsfound__tiktok__evidence, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok.evidence", definition={'type': 'string'}, rule='type')
+                                    data__profilefeatures__platformsfound__tiktok_one_of_count3 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__tiktok_one_of_count3 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__tiktok, (bool)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok must be boolean", value=data__profilefeatures__platformsfound__tiktok, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok", definition={'type': 'boolean'}, rule='type')
+                                    data__profilefeatures__platformsfound__tiktok_one_of_count3 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__tiktok_one_of_count3 != 1:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok must be valid exactly by one definition" + (" (" + str(data__profilefeatures__platformsfound__tiktok_one_of_count3) + " matches found)"), value=data__profilefeatures__platformsfound__tiktok, name="" + (name_prefix or "data") + ".profile_features.platforms_found.tiktok", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='oneOf')
+                        if "linkedin" in data__profilefeatures__platformsfound_keys:
+                            data__profilefeatures__platformsfound_keys.remove("linkedin")
+                            data__profilefeatures__platformsfound__linkedin = data__profilefeatures__platformsfound["linkedin"]
+                            if not isinstance(data__profilefeatures__platformsfound__linkedin, (dict, bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin must be object or boolean", value=data__profilefeatures__platformsfound__linkedin, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='type')
+                            data__profilefeatures__platformsfound__linkedin_one_of_count4 = 0
+                            if data__profilefeatures__platformsfound__linkedin_one_of_count4 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__linkedin, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin must be object", value=data__profilefeatures__platformsfound__linkedin, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin", definition={'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, rule='type')
+                                    data__profilefeatures__platformsfound__linkedin_is_dict = isinstance(data__profilefeatures__platformsfound__linkedin, dict)
+                                    if data__profilefeatures__platformsfound__linkedin_is_dict:
+                                        data__profilefeatures__platformsfound__linkedin_keys = set(data__profilefeatures__platformsfound__linkedin.keys())
+                                        if "present" in data__profilefeatures__platformsfound__linkedin_keys:
+                                            data__profilefeatures__platformsfound__linkedin_keys.remove("present")
+                                            data__profilefeatures__platformsfound__linkedin__present = data__profilefeatures__platformsfound__linkedin["present"]
+                                            if not isinstance(data__profilefeatures__platformsfound__linkedin__present, (bool)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.present must be boolean", value=data__profilefeatures__platformsfound__linkedin__present, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.present", definition={'type': 'boolean'}, rule='type')
+                                        if "link" in data__profilefeatures__platformsfound__linkedin_keys:
+                                            data__profilefeatures__platformsfound__linkedin_keys.remove("link")
+                                            data__profilefeatures__platformsfound__linkedin__link = data__profilefeatures__platformsfound__linkedin["link"]
+                                            if not isinstance(data__profilefeatures__platformsfound__linkedin__link, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.link must be string or null", value=data__profilefeatures__platformsfound__linkedin__link, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.link", definition={'type': ['string', 'null']}, rule='type')
+                                        if "handle" in data__profilefeatures__platformsfound__linkedin_keys:
+                                            data__profilefeatures__platformsfound__linkedin_keys.remove("handle")
+                                            data__profilefeatures__platformsfound__linkedin__handle = data__profilefeatures__platformsfound__linkedin["handle"]
+                                            if not isinstance(data__profilefeatures__platformsfound__linkedin__handle, (str, NoneType)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.handle must be string or null", value=data__profilefeatures__platformsfound__linkedin__handle, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.handle", definition={'type': ['string', 'null']}, rule='type')
+                                        if "evidence" in data__profilefeatures__platformsfound__linkedin_keys:
+                                            data__profilefeatures__platformsfound__linkedin_keys.remove("evidence")
+                                            data__profilefeatures__platformsfound__linkedin__evidence = data__profilefeatures__platformsfound__linkedin["evidence"]
+                                            if not isinstance(data__profilefeatures__platformsfound__linkedin__evidence, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.evidence must be string", value=data__profilefeatures__platformsfound__linkedin__evidence, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin.evidence", definition={'type': 'string'}, rule='type')
+                                    data__profilefeatures__platformsfound__linkedin_one_of_count4 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__linkedin_one_of_count4 < 2:
+                                try:
+                                    if not isinstance(data__profilefeatures__platformsfound__linkedin, (bool)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin must be boolean", value=data__profilefeatures__platformsfound__linkedin, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin", definition={'type': 'boolean'}, rule='type')
+                                    data__profilefeatures__platformsfound__linkedin_one_of_count4 += 1
+                                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                            if data__profilefeatures__platformsfound__linkedin_one_of_count4 != 1:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin must be valid exactly by one definition" + (" (" + str(data__profilefeatures__platformsfound__linkedin_one_of_count4) + " matches found)"), value=data__profilefeatures__platformsfound__linkedin, name="" + (name_prefix or "data") + ".profile_features.platforms_found.linkedin", definition={'type': ['object', 'boolean'], 'oneOf': [{'type': 'object', 'properties': {'present': {'type': 'boolean'}, 'link': {'type': ['string', 'null']}, 'handle': {'type': ['string', 'null']}, 'evidence': {'type': 'string'}}}, {'type': 'boolean'}]}, rule='oneOf')
+                if "total_platforms" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("total_platforms")
+                    data__profilefeatures__totalplatforms = data__profilefeatures["total_platforms"]
+                    if not isinstance(data__profilefeatures__totalplatforms, (int)) and not (isinstance(data__profilefeatures__totalplatforms, float) and data__profilefeatures__totalplatforms.is_integer()) or isinstance(data__profilefeatures__totalplatforms, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.total_platforms must be integer", value=data__profilefeatures__totalplatforms, name="" + (name_prefix or "data") + ".profile_features.total_platforms", definition={'type': 'integer'}, rule='type')
+                if "has_professional_presence" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("has_professional_presence")
+                    data__profilefeatures__hasprofessionalpresence = data__profilefeatures["has_professional_presence"]
+                    if not isinstance(data__profilefeatures__hasprofessionalpresence, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.has_professional_presence must be boolean", value=data__profilefeatures__hasprofessionalpresence, name="" + (name_prefix or "data") + ".profile_features.has_professional_presence", definition={'type': 'boolean'}, rule='type')
+                if "notes" in data__profilefeatures_keys:
+                    data__profilefeatures_keys.remove("notes")
+                    data__profilefeatures__notes = data__profilefeatures["notes"]
+                    if not isinstance(data__profilefeatures__notes, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile_features.notes must be string", value=data__profilefeatures__notes, name="" + (name_prefix or "data") + ".profile_features.notes", definition={'type': 'string'}, rule='type')
+        if "scores" in data_keys:
+            data_keys.remove("scores")
+            data__scores = data["scores"]
+            if not isinstance(data__scores, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must be object", value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'social_presence_score': {'type': ['integer', 'number']}, 'professional_presence_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, rule='type')
+            data__scores_is_dict = isinstance(data__scores, dict)
+            if data__scores_is_dict:
+                data__scores__missing_keys = set(['overall_score']) - data__scores.keys()
+                if data__scores__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores must contain " + (str(sorted(data__scores__missing_keys)) + " properties"), value=data__scores, name="" + (name_prefix or "data") + ".scores", definition={'type': 'object', 'properties': {'social_presence_score': {'type': ['integer', 'number']}, 'professional_presence_score': {'type': ['integer', 'number']}, 'overall_score': {'type': ['integer', 'number']}}, 'required': ['overall_score']}, rule='required')
+                data__scores_keys = set(data__scores.keys())
+                if "social_presence_score" in data__scores_keys:
+                    data__scores_keys.remove("social_presence_score")
+                    data__scores__socialpresencescore = data__scores["social_presence_score"]
+                    if not isinstance(data__scores__socialpresencescore, (int, int, float, Decimal)) and not (isinstance(data__scores__socialpresencescore, float) and data__scores__socialpresencescore.is_integer()) or isinstance(data__scores__socialpresencescore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.social_presence_score must be integer or number", value=data__scores__socialpresencescore, name="" + (name_prefix or "data") + ".scores.social_presence_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "professional_presence_score" in data__scores_keys:
+                    data__scores_keys.remove("professional_presence_score")
+                    data__scores__professionalpresencescore = data__scores["professional_presence_score"]
+                    if not isinstance(data__scores__professionalpresencescore, (int, int, float, Decimal)) and not (isinstance(data__scores__professionalpresencescore, float) and data__scores__professionalpresencescore.is_integer()) or isinstance(data__scores__professionalpresencescore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.professional_presence_score must be integer or number", value=data__scores__professionalpresencescore, name="" + (name_prefix or "data") + ".scores.professional_presence_score", definition={'type': ['integer', 'number']}, rule='type')
+                if "overall_score" in data__scores_keys:
+                    data__scores_keys.remove("overall_score")
+                    data__scores__overallscore = data__scores["overall_score"]
+                    if not isinstance(data__scores__overallscore, (int, int, float, Decimal)) and not (isinstance(data__scores__overallscore, float) and data__scores__overallscore.is_integer()) or isinstance(data__scores__overallscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".scores.overall_score must be integer or number", value=data__scores__overallscore, name="" + (name_prefix or "data") + ".scores.overall_score", definition={'type': ['integer', 'number']}, rule='type')
+        if "score_breakdown" in data_keys:
+            data_keys.remove("score_breakdown")
+            data__scorebreakdown = data["score_breakdown"]
+            if not isinstance(data__scorebreakdown, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown must be object", value=data__scorebreakdown, name="" + (name_prefix or "data") + ".score_breakdown", definition={'type': 'object', 'properties': {'social_presence_score_reasoning': {'type': 'string'}, 'professional_presence_score_reasoning': {'type': 'string'}, 'overall_score_reasoning': {'type': 'string'}}}, rule='type')
+            data__scorebreakdown_is_dict = isinstance(data__scorebreakdown, dict)
+            if data__scorebreakdown_is_dict:
+                data__scorebreakdown_keys = set(data__scorebreakdown.keys())
+                if "social_presence_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("social_presence_score_reasoning")
+                    data__scorebreakdown__socialpresencescorereasoning = data__scorebreakdown["social_presence_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__socialpresencescorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.social_presence_score_reasoning must be string", value=data__scorebreakdown__socialpresencescorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.social_presence_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "professional_presence_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("professional_presence_score_reasoning")
+                    data__scorebreakdown__professionalpresencescorereasoning = data__scorebreakdown["professional_presence_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__professionalpresencescorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.professional_presence_score_reasoning must be string", value=data__scorebreakdown__professionalpresencescorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.professional_presence_score_reasoning", definition={'type': 'string'}, rule='type')
+                if "overall_score_reasoning" in data__scorebreakdown_keys:
+                    data__scorebreakdown_keys.remove("overall_score_reasoning")
+                    data__scorebreakdown__overallscorereasoning = data__scorebreakdown["overall_score_reasoning"]
+                    if not isinstance(data__scorebreakdown__overallscorereasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_breakdown.overall_score_reasoning must be string", value=data__scorebreakdown__overallscorereasoning, name="" + (name_prefix or "data") + ".score_breakdown.overall_score_reasoning", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file